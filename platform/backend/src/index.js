@@ -1096,11 +1096,44 @@ function buildCommand(project, params, outputPath) {
   return ["python", args];
 }
 
+// Resolves to { unavailable } when the service cannot be reached (the caller then spawns python);
+// any answer from the service, including an error status, is final for the run.
+async function executeServiceRun(serviceUrl, config, outputPath) {
+  let response;
+  try {
+    response = await fetch(`${serviceUrl.replace(/\/+$/, "")}/predict`, {
+      method: "POST",
+      headers: { "content-type": "application/json" },
+      body: JSON.stringify({ params: config.params }),
+    });
+  } catch (error) {
+    return { unavailable: error };
+  }
+  const payload = await response.json().catch(() => null);
+  if (!response.ok) {
+    throw new Error(payload?.error ?? `Prediction service returned ${response.status}`);
+  }
+  await writeJson(outputPath, payload);
+  return { ok: true };
+}
+
 async function executePythonRun(project, config, outputPath, stdoutPath, stderrPath) {
   if (!isObject(config.params)) {
     throw AppError.badRequest("Params missing");
   }
 
+  let serviceError = null;
+  const serviceUrl = process.env.F1_PREDICTION_SERVICE_URL;
+  if (project.kind === "F1" && serviceUrl) {
+    await Bun.write(stdoutPath, "");
+    await Bun.write(stderrPath, "");
+    const outcome = await executeServiceRun(serviceUrl, config, outputPath);
+    if (outcome.ok) {
+      return true;
+    }
+    serviceError = outcome.unavailable;
+  }
+
   const [command, args] = buildCommand(project, config.params, outputPath);
 
   try {
@@ -1114,6 +1147,13 @@ async function executePythonRun(project, config, outputPath, stdoutPath, stderrP
     });
 
     const exitCode = await process.exited;
+    if (serviceError) {
+      await fsp.appendFile(
+        stderrPath,
+        `\nPrediction service unavailable (${String(serviceError)}), ran python instead.\n`,
+        "utf8"
+      );
+    }
     return exitCode === 0 && fs.existsSync(outputPath);
   } catch {
     throw AppError.internal("Failed to run python");
@@ -1338,6 +1378,10 @@ async function handleCreateRun(state, request) {
     )}, ${outputPath}, ${stdoutPath}, ${stderrPath}, ${null}, ${null})
   `;
 
+  if (state.runExecutor === "worker") {
+    return jsonResponse({ runId, status: "queued" }, 202);
+  }
+
   enqueueBackgroundJob(state, `run:${runId}`, async () => {
     await state.db`
       UPDATE runs
@@ -1513,6 +1557,14 @@ async function handleCreateSweep(state, request) {
     });
   }
 
+  if (state.runExecutor === "worker") {
+    return jsonResponse({
+      sweepId,
+      runIds,
+      status: "queued",
+    }, 202);
+  }
+
   enqueueBackgroundJob(state, `sweep:${sweepId}`, async () => {
     try {
       await state.db`
@@ -1857,6 +1909,7 @@ async function main() {
     db,
     jobQueue: [],
     jobQueueRunning: false,
+    runExecutor: process.env.RUN_EXECUTOR === "worker" ? "worker" : "backend",
   };
 
   const port = Number.parseInt(process.env.PORT ?? "4000", 10) || 4000;
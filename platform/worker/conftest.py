@@ -0,0 +1 @@
+"""pytest puts this directory on sys.path, so `import run_worker` works from `python -m pytest` here."""
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Python worker pool consuming queued platform runs from Postgres."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+PROJECTS_DIR = REPO_ROOT / "research" / "projects"
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS runs (
+  id TEXT PRIMARY KEY,
+  created_at TEXT NOT NULL,
+  sport TEXT NOT NULL,
+  project TEXT NOT NULL,
+  status TEXT NOT NULL,
+  config_json TEXT NOT NULL,
+  result_path TEXT,
+  stdout_path TEXT,
+  stderr_path TEXT,
+  duration_ms INTEGER,
+  sweep_id TEXT
+);
+CREATE TABLE IF NOT EXISTS sweeps (
+  id TEXT PRIMARY KEY,
+  created_at TEXT NOT NULL,
+  sport TEXT NOT NULL,
+  project TEXT NOT NULL,
+  param TEXT NOT NULL,
+  values_json TEXT NOT NULL,
+  base_config_json TEXT NOT NULL,
+  status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sweep_runs (
+  sweep_id TEXT NOT NULL,
+  run_id TEXT NOT NULL,
+  param_value TEXT NOT NULL,
+  PRIMARY KEY (sweep_id, run_id)
+);
+"""
+
+CLAIM_SQL = """
+UPDATE runs
+SET status = 'running'
+WHERE id = (
+  SELECT id FROM runs
+  WHERE status = 'queued'
+  ORDER BY created_at, id
+  LIMIT 1
+  FOR UPDATE SKIP LOCKED
+)
+RETURNING id, sport, project, config_json, result_path, stdout_path, stderr_path, sweep_id
+"""
+
+FINISH_SQL = """
+UPDATE runs
+SET status = %s, duration_ms = %s
+WHERE id = %s
+"""
+
+SWEEP_RUNNING_SQL = """
+UPDATE sweeps SET status = 'running'
+WHERE id = %s AND status = 'queued'
+"""
+
+SWEEP_FINISH_SQL = """
+UPDATE sweeps
+SET status = CASE
+  WHEN counts.failed = 0 THEN 'done'
+  WHEN counts.succeeded = 0 THEN 'error'
+  ELSE 'partial'
+END
+FROM (
+  SELECT
+    COUNT(*) FILTER (WHERE status = 'done') AS succeeded,
+    COUNT(*) FILTER (WHERE status = 'error') AS failed,
+    COUNT(*) FILTER (WHERE status IN ('queued', 'running')) AS pending
+  FROM runs
+  WHERE sweep_id = %s
+) AS counts
+WHERE sweeps.id = %s AND counts.pending = 0
+"""
+
+
+def parse_env_value(raw: str) -> str:
+    value = raw.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in {"'", '"'}:
+        return value[1:-1]
+    return value
+
+
+def load_env_file(path: Path) -> None:
+    if not path.exists():
+        return
+    for raw_line in path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, raw_value = line.split("=", 1)
+        key = key.strip()
+        if key and not os.environ.get(key):
+            os.environ[key] = parse_env_value(raw_value)
+
+
+def resolve_database_url(explicit: Optional[str]) -> Optional[str]:
+    if explicit:
+        return explicit
+    for key in [
+        "DATABASE_URL",
+        "SUPABASE_DIRECT_CONNECTION_STRING",
+        "SUPABASE_DB_URL",
+        "SUPABASE_SESSION_POOLER_CONNECTION_STRING",
+        "SUPABASE_TRANSACTION_POOLER_CONNECTION_STRING",
+    ]:
+        if os.environ.get(key):
+            return os.environ[key]
+    return None
+
+
+def connect(database_url: str):
+    try:
+        import psycopg
+    except Exception:
+        raise SystemExit("psycopg is not installed. Install with: pip install 'psycopg[binary]'")
+    return psycopg.connect(database_url)
+
+
+class RunExecutor:
+    """Executes run configs in-process, keeping project packages and F1 caches warm."""
+
+    def __init__(self) -> None:
+        self._f1_service = None
+
+    def _python_dir(self, sport: str, project: str) -> Path:
+        python_dir = PROJECTS_DIR / sport / project / "Python"
+        if not python_dir.exists():
+            raise ValueError(f"Unknown project: {sport}/{project}")
+        if str(python_dir) not in sys.path:
+            sys.path.insert(0, str(python_dir))
+        return python_dir
+
+    def _params(self, params: Dict[str, object], python_dir: Path) -> Dict[str, object]:
+        params = dict(params)
+        cache_dir = params.get("cache_dir")
+        if isinstance(cache_dir, str) and cache_dir.strip():
+            params["cache_dir"] = str(python_dir / cache_dir.strip())
+        return params
+
+    def _run_f1(self, params: Dict[str, object]) -> Dict[str, object]:
+        if self._f1_service is None:
+            from rqp.service import PredictionService
+
+            self._f1_service = PredictionService()
+        payload = self._f1_service.predict(params)
+        payload.pop("service", None)
+        return payload
+
+    def _run_football(self, params: Dict[str, object]) -> Dict[str, object]:
+        from mrp import PredictionConfig, prediction_payload, run_prediction
+
+        season = int(params["season"])
+        round_number = params.get("round_number", params.get("round"))
+        train_seasons = str(params.get("train_seasons") or "auto")
+        if train_seasons.lower() in {"auto", "default"}:
+            seasons = [season - 2, season - 1, season]
+        else:
+            seasons = [int(x.strip()) for x in train_seasons.split(",") if x.strip()]
+        config = PredictionConfig(
+            league=str(params["league"]),
+            season=season,
+            round_number=int(round_number),
+            mode=str(params["mode"]),
+            data_source=str(params.get("data_source") or "placeholder"),
+            train_seasons=seasons,
+            cache_dir=params.get("cache_dir") or None,
+        )
+        return prediction_payload(config, run_prediction(config))
+
+    def execute(self, sport: str, project: str, params: Dict[str, object]) -> Dict[str, object]:
+        python_dir = self._python_dir(sport, project)
+        params = self._params(params, python_dir)
+        if sport == "F1":
+            return self._run_f1(params)
+        if sport == "Football":
+            return self._run_football(params)
+        raise ValueError(f"Unknown sport: {sport}")
+
+
+def _write_text(path: Optional[str], content: str) -> None:
+    if not path:
+        return
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(content, encoding="utf-8")
+
+
+def process_run(conn, executor: RunExecutor, row: tuple) -> str:
+    run_id, sport, project, config_json, result_path, stdout_path, stderr_path, sweep_id = row
+    started = time.perf_counter()
+    status = "error"
+    _write_text(stdout_path, "")
+    _write_text(stderr_path, "")
+    try:
+        config = json.loads(config_json)
+        params = config.get("params")
+        if not isinstance(params, dict):
+            raise ValueError("Params missing")
+        payload = executor.execute(sport, project, params)
+        _write_text(result_path, json.dumps(payload, ensure_ascii=False, indent=2))
+        status = "done"
+    except (Exception, SystemExit):
+        _write_text(stderr_path, traceback.format_exc())
+    duration_ms = int((time.perf_counter() - started) * 1000)
+    with conn.transaction():
+        conn.execute(FINISH_SQL, (status, duration_ms, run_id))
+        if sweep_id:
+            conn.execute(SWEEP_FINISH_SQL, (sweep_id, sweep_id))
+    return status
+
+
+def claim_run(conn) -> Optional[tuple]:
+    with conn.transaction():
+        row = conn.execute(CLAIM_SQL).fetchone()
+        if row is not None and row[7]:
+            conn.execute(SWEEP_RUNNING_SQL, (row[7],))
+    return row
+
+
+def worker_loop(worker_id: int, database_url: str, poll_interval: float, once: bool, quiet: bool) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    executor = RunExecutor()
+    conn = connect(database_url)
+    conn.autocommit = True
+    try:
+        while True:
+            row = claim_run(conn)
+            if row is None:
+                if once:
+                    return
+                time.sleep(poll_interval)
+                continue
+            status = process_run(conn, executor, row)
+            if not quiet:
+                print(f"[worker {worker_id}] run {row[0]} -> {status}", flush=True)
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worker pool for queued platform runs (Postgres)")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--poll-interval", type=float, default=2.0)
+    parser.add_argument("--once", action="store_true", help="Exit once the queue is empty")
+    parser.add_argument("--init-schema", action="store_true")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    load_env_file(REPO_ROOT / ".env")
+    load_env_file(REPO_ROOT / ".env.local")
+    database_url = resolve_database_url(args.database_url)
+    if not database_url:
+        raise SystemExit("DATABASE_URL is required (use your Supabase Postgres URI)")
+
+    if args.init_schema:
+        conn = connect(database_url)
+        with conn:
+            conn.execute(SCHEMA_SQL)
+        conn.close()
+
+    workers = max(1, args.workers)
+    if workers == 1:
+        worker_loop(0, database_url, args.poll_interval, args.once, args.quiet)
+        return
+
+    processes = [
+        multiprocessing.Process(
+            target=worker_loop,
+            args=(idx, database_url, args.poll_interval, args.once, args.quiet),
+        )
+        for idx in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
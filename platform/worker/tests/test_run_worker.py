@@ -0,0 +1,138 @@
+import json
+import os
+import threading
+import uuid
+
+import pytest
+
+DATABASE_URL = os.environ.get("WORKER_TEST_DATABASE_URL")
+if not DATABASE_URL:
+    pytest.skip("WORKER_TEST_DATABASE_URL is not set", allow_module_level=True)
+pytest.importorskip("psycopg")
+
+import run_worker  # noqa: E402
+
+
+class FakeExecutor:
+    def execute(self, sport, project, params):
+        if params.get("fail"):
+            raise ValueError("boom")
+        return {"sport": sport, "project": project, "params": params}
+
+
+@pytest.fixture
+def schema():
+    name = f"worker_test_{uuid.uuid4().hex[:12]}"
+    conn = run_worker.connect(DATABASE_URL)
+    conn.autocommit = True
+    conn.execute(f'CREATE SCHEMA "{name}"')
+    conn.execute(f'SET search_path TO "{name}"')
+    conn.execute(run_worker.SCHEMA_SQL)
+    try:
+        yield name
+    finally:
+        conn.execute(f'DROP SCHEMA "{name}" CASCADE')
+        conn.close()
+
+
+def _connect(schema):
+    conn = run_worker.connect(DATABASE_URL)
+    conn.autocommit = True
+    conn.execute(f'SET search_path TO "{schema}"')
+    return conn
+
+
+def _queue(conn, tmp_path, run_id, params, sweep_id=None):
+    conn.execute(
+        "INSERT INTO runs (id, created_at, sport, project, status, config_json, result_path, stdout_path, "
+        "stderr_path, sweep_id) VALUES (%s, %s, 'Football', 'Match Result Prediction', 'queued', %s, %s, %s, %s, %s)",
+        (
+            run_id,
+            "2026-01-01T00:00:00",
+            json.dumps({"params": params}),
+            str(tmp_path / run_id / "result.json"),
+            str(tmp_path / run_id / "stdout.log"),
+            str(tmp_path / run_id / "stderr.log"),
+            sweep_id,
+        ),
+    )
+
+
+def _status(conn, table, key):
+    return conn.execute(f"SELECT status FROM {table} WHERE id = %s", (key,)).fetchone()[0]
+
+
+def test_concurrent_workers_never_claim_the_same_run(schema, tmp_path):
+    conn = _connect(schema)
+    ids = [f"run-{idx:03d}" for idx in range(60)]
+    for run_id in ids:
+        _queue(conn, tmp_path, run_id, {"season": 2024})
+
+    claimed = []
+    lock = threading.Lock()
+
+    def drain():
+        worker = _connect(schema)
+        try:
+            while (row := run_worker.claim_run(worker)) is not None:
+                with lock:
+                    claimed.append(row[0])
+        finally:
+            worker.close()
+
+    threads = [threading.Thread(target=drain) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == ids
+    statuses = conn.execute("SELECT DISTINCT status FROM runs").fetchall()
+    assert statuses == [("running",)]
+    conn.close()
+
+
+def test_finished_and_failed_runs_are_recorded(schema, tmp_path):
+    conn = _connect(schema)
+    _queue(conn, tmp_path, "ok", {"season": 2024})
+    _queue(conn, tmp_path, "failing", {"fail": True})
+    executor = FakeExecutor()
+
+    outcomes = {}
+    while (row := run_worker.claim_run(conn)) is not None:
+        outcomes[row[0]] = run_worker.process_run(conn, executor, row)
+
+    assert outcomes == {"ok": "done", "failing": "error"}
+    assert _status(conn, "runs", "ok") == "done"
+    assert _status(conn, "runs", "failing") == "error"
+    durations = conn.execute("SELECT duration_ms FROM runs WHERE duration_ms IS NOT NULL").fetchall()
+    assert len(durations) == 2
+    result = json.loads((tmp_path / "ok" / "result.json").read_text(encoding="utf-8"))
+    assert result["params"] == {"season": 2024}
+    assert "ValueError: boom" in (tmp_path / "failing" / "stderr.log").read_text(encoding="utf-8")
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    "failures, expected",
+    [([False, False], "done"), ([False, True], "partial"), ([True, True], "error")],
+)
+def test_sweep_status_is_aggregated_once_its_runs_are_finished(schema, tmp_path, failures, expected):
+    conn = _connect(schema)
+    conn.execute(
+        "INSERT INTO sweeps (id, created_at, sport, project, param, values_json, base_config_json, status) "
+        "VALUES ('sweep', '2026-01-01', 'Football', 'Match Result Prediction', 'fail', '[]', '{}', 'queued')"
+    )
+    for idx, fail in enumerate(failures):
+        _queue(conn, tmp_path, f"sweep-{idx}", {"fail": fail}, sweep_id="sweep")
+    executor = FakeExecutor()
+
+    row = run_worker.claim_run(conn)
+    assert _status(conn, "sweeps", "sweep") == "running"
+    run_worker.process_run(conn, executor, row)
+    # One run is still queued: the sweep stays running.
+    assert _status(conn, "sweeps", "sweep") == "running"
+
+    run_worker.process_run(conn, executor, run_worker.claim_run(conn))
+    assert _status(conn, "sweeps", "sweep") == expected
+    conn.close()
@@ -1,6 +1,28 @@
 """Rising Qualification Prediction package."""
 
-from .config import PredictionConfig, PredictionResult
-from .prediction import run_prediction
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import PredictionConfig, PredictionResult
+    from .prediction import run_prediction
 
 __all__ = ["PredictionConfig", "PredictionResult", "run_prediction"]
+
+_EXPORTS = {
+    "PredictionConfig": "config",
+    "PredictionResult": "config",
+    "run_prediction": "prediction",
+}
+
+
+def __getattr__(name: str) -> object:
+    # Lazy exports keep `import rqp` cheap (pandas, sklearn, xgboost load on use).
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,230 @@
+"""Season backtests replaying rounds as if live."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .data import build_current_features, build_training_data, slice_training_data
+from .prediction import feature_columns, predict_with_model
+from .providers import BaseProvider, CachedProvider, FastF1Provider, OpenF1Provider
+from .registry import ModelRegistry
+from .training import TrainingResult, train_model
+
+ROUND_COLUMNS = [
+    "year",
+    "round_number",
+    "model_name",
+    "retrained",
+    "train_rows",
+    "drivers",
+    "mae",
+    "top10_hit_rate",
+    "spearman",
+]
+
+
+@dataclass
+class BacktestConfig:
+    source: str
+    mode: str
+    seasons: List[int]
+    train_seasons: Optional[List[int]]
+    include_standings: bool
+    cache_dir: Optional[str]
+    rounds: Optional[List[int]] = None
+    retrain_every: int = 1
+    model_dir: Optional[str] = None
+    selection: str = "full"
+    incremental: bool = False
+    ensemble: bool = False
+
+
+@dataclass
+class BacktestResult:
+    rounds: pd.DataFrame
+    overall: Dict[str, float]
+    notes: List[str]
+
+
+def _build_provider(config: BacktestConfig) -> BaseProvider:
+    if config.source == "fastf1":
+        return FastF1Provider(config.cache_dir)
+    return OpenF1Provider(cache_dir=config.cache_dir)
+
+
+def _season_train_seasons(config: BacktestConfig, year: int) -> List[int]:
+    if config.train_seasons:
+        return [season for season in config.train_seasons if season <= year]
+    return [year - 2, year - 1, year]
+
+
+def _actual_positions(provider: BaseProvider, mode: str, year: int, round_number: int) -> pd.DataFrame:
+    if mode == "qualifying":
+        results = provider.get_qualifying_results(year, round_number)
+    else:
+        results = provider.get_race_results(year, round_number)
+    if results is None or results.empty or "position" not in results.columns:
+        return pd.DataFrame(columns=["driver_id", "actual_position"])
+    actual = results[["driver_id", "position"]].copy()
+    actual["actual_position"] = pd.to_numeric(actual["position"], errors="coerce")
+    return actual.dropna(subset=["actual_position"])[["driver_id", "actual_position"]]
+
+
+def _spearman(a: np.ndarray, b: np.ndarray) -> float:
+    if len(a) < 2:
+        return float("nan")
+    ra = pd.Series(a).rank().to_numpy()
+    rb = pd.Series(b).rank().to_numpy()
+    ra = ra - ra.mean()
+    rb = rb - rb.mean()
+    denom = np.sqrt((ra * ra).sum() * (rb * rb).sum())
+    if denom == 0:
+        return float("nan")
+    return float((ra * rb).sum() / denom)
+
+
+def _round_metrics(
+    scored: pd.DataFrame,
+    actual: pd.DataFrame,
+    targets: pd.DataFrame,
+) -> Dict[str, float]:
+    errors = scored.merge(targets, on="driver_id", how="inner")
+    abs_errors = (errors["pred"] - errors["target"]).abs().dropna()
+
+    ranked = scored.merge(actual, on="driver_id", how="inner").dropna(subset=["pred"])
+    hit_rate = float("nan")
+    spearman = float("nan")
+    if not ranked.empty:
+        predicted_top = set(ranked.nsmallest(10, "pred")["driver_id"])
+        actual_top = set(ranked.loc[ranked["actual_position"] <= 10, "driver_id"])
+        if actual_top:
+            hit_rate = len(predicted_top & actual_top) / min(10, len(actual_top))
+        spearman = _spearman(ranked["pred"].to_numpy(), ranked["actual_position"].to_numpy())
+    return {
+        "abs_error_sum": float(abs_errors.sum()),
+        "abs_error_count": int(len(abs_errors)),
+        "mae": float(abs_errors.mean()) if len(abs_errors) else float("nan"),
+        "top10_hit_rate": hit_rate,
+        "spearman": spearman,
+    }
+
+
+def run_backtest(config: BacktestConfig, provider: Optional[BaseProvider] = None) -> BacktestResult:
+    if config.retrain_every < 1:
+        raise ValueError("retrain_every must be >= 1")
+    if provider is None:
+        provider = CachedProvider(_build_provider(config))
+    registry = ModelRegistry(config.model_dir) if config.model_dir else None
+    feature_cols, fallback_cols = feature_columns(config.mode, config.include_standings)
+
+    # Every season is fetched once; each round trains on a slice of this frame.
+    all_seasons = sorted(
+        set(config.seasons).union(*(_season_train_seasons(config, y) for y in config.seasons))
+    )
+    history, notes = build_training_data(
+        provider=provider,
+        mode=config.mode,
+        train_seasons=all_seasons,
+        target_year=max(all_seasons) + 1,
+        target_round=1,
+        include_standings=config.include_standings,
+    )
+    notes = list(notes)
+
+    rows: List[Dict[str, object]] = []
+    abs_error_sum = 0.0
+    abs_error_count = 0
+    trainings = 0
+    for year in sorted(config.seasons):
+        try:
+            listed = provider.list_rounds(year)
+        except (Exception, SystemExit) as exc:
+            notes.append(f"Echec listing rounds {year}: {exc}")
+            continue
+        round_numbers = sorted(int(rnd["round_number"]) for rnd in listed)
+        if config.rounds:
+            selected = set(config.rounds)
+            round_numbers = [r for r in round_numbers if r in selected]
+        if history.empty:
+            season_history = history
+        else:
+            season_history = history.loc[
+                history["event_year"].isin(_season_train_seasons(config, year)).to_numpy()
+            ].reset_index(drop=True)
+
+        training: Optional[TrainingResult] = None
+        rounds_since_training = 0
+        for round_number in round_numbers:
+            train, _ = slice_training_data(season_history, [], year, round_number)
+            retrained = training is None or rounds_since_training >= config.retrain_every
+            if retrained:
+                training = train_model(
+                    train,
+                    feature_cols,
+                    registry=registry,
+                    selection=config.selection,
+                    incremental=config.incremental,
+                    ensemble=config.ensemble,
+                )
+                trainings += 1
+                rounds_since_training = 0
+            rounds_since_training += 1
+
+            features, feature_notes = build_current_features(
+                provider=provider,
+                mode=config.mode,
+                year=year,
+                round_number=round_number,
+                include_standings=config.include_standings,
+            )
+            if features.empty:
+                notes.extend(f"{year} round {round_number}: {note}" for note in feature_notes)
+                continue
+            try:
+                actual = _actual_positions(provider, config.mode, year, round_number)
+            except (Exception, SystemExit) as exc:
+                notes.append(f"Echec resultats {year} round {round_number}: {exc}")
+                continue
+
+            scored = features[["driver_id"]].copy()
+            scored["pred"] = predict_with_model(
+                training.model,
+                features,
+                feature_cols,
+                fallback_cols,
+                preprocessor=training.preprocessor,
+            ).to_numpy()
+            targets = pd.DataFrame(columns=["driver_id", "target"])
+            if not history.empty:
+                current = history["event_key"] == (year * 100) + round_number
+                targets = history.loc[current.to_numpy(), ["driver_id", "target"]]
+            metrics = _round_metrics(scored, actual, targets)
+            abs_error_sum += metrics["abs_error_sum"]
+            abs_error_count += metrics["abs_error_count"]
+            rows.append(
+                {
+                    "year": year,
+                    "round_number": round_number,
+                    "model_name": training.model_name,
+                    "retrained": retrained,
+                    "train_rows": int(len(train)),
+                    "drivers": int(len(scored)),
+                    "mae": metrics["mae"],
+                    "top10_hit_rate": metrics["top10_hit_rate"],
+                    "spearman": metrics["spearman"],
+                }
+            )
+
+    rounds = pd.DataFrame(rows, columns=ROUND_COLUMNS)
+    overall = {
+        "rounds": int(len(rounds)),
+        "trainings": trainings,
+        "mae": abs_error_sum / abs_error_count if abs_error_count else float("nan"),
+        "top10_hit_rate": float(rounds["top10_hit_rate"].mean()) if not rounds.empty else float("nan"),
+        "spearman": float(rounds["spearman"].mean()) if not rounds.empty else float("nan"),
+    }
+    return BacktestResult(rounds=rounds, overall=overall, notes=notes)
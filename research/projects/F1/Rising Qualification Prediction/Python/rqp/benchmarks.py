@@ -0,0 +1,316 @@
+"""Hot-path benchmarks on a deterministic in-memory provider, with JSON results and regression checks."""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .constants import POINTS_TABLE
+from .data import build_training_data
+from .pipeline import PipelineConfig, _merge_round_data, run_pipeline
+from .prediction import feature_columns, predict_with_model
+from .preprocessing import FeaturePreprocessor
+from .providers import BaseProvider
+from .training import _build_design_matrix, _candidate_models, _walk_forward_folds, train_model
+from .utils import merge_fp_frames
+
+DEFAULT_SIZES = (1, 5, 20)
+DEFAULT_THRESHOLD = 0.10
+# Differences below this are timer noise, whatever the ratio.
+MIN_REGRESSION_MS = 1.0
+LAST_YEAR = 2025
+ROUNDS_PER_SEASON = 22
+DRIVERS = 20
+FP_SESSIONS = ("FP1", "FP2", "FP3")
+
+
+class SyntheticProvider(BaseProvider):
+    """Deterministic seasons of FP, qualifying, race and standings frames, all built up front."""
+
+    def __init__(
+        self,
+        years: List[int],
+        rounds: int = ROUNDS_PER_SEASON,
+        drivers: int = DRIVERS,
+        seed: int = 0,
+    ) -> None:
+        rng = np.random.default_rng(seed)
+        ids = [f"D{idx:02d}" for idx in range(drivers)]
+        pace = rng.normal(0.0, 0.6, size=drivers)
+        self.rounds: Dict[int, List[Dict[str, object]]] = {}
+        self.sessions: Dict[Tuple[int, int], List[pd.DataFrame]] = {}
+        self.fp: Dict[Tuple[int, int], pd.DataFrame] = {}
+        self.qualifying: Dict[Tuple[int, int], pd.DataFrame] = {}
+        self.race: Dict[Tuple[int, int], pd.DataFrame] = {}
+        self.standings: Dict[Tuple[int, int], Optional[pd.DataFrame]] = {}
+        for year in years:
+            self.rounds[year] = [
+                {"round_number": rnd, "event_name": f"Grand Prix {rnd}"} for rnd in range(1, rounds + 1)
+            ]
+            pace = pace + rng.normal(0.0, 0.2, size=drivers)
+            points = np.zeros(drivers)
+            for rnd in range(1, rounds + 1):
+                key = (year, rnd)
+                frames = []
+                for session in FP_SESSIONS:
+                    best = 90.0 + pace + rng.normal(0.0, 0.3, size=drivers)
+                    # Some drivers skip a session, as in real FP data.
+                    kept = rng.random(drivers) > 0.05
+                    frame = pd.DataFrame({"driver_id": ids, "driver_name": ids, "best_lap": best}).loc[kept]
+                    frame["delta"] = frame["best_lap"] - frame["best_lap"].min()
+                    frame["rank"] = frame["best_lap"].rank(method="min").astype(int)
+                    frame["session"] = session
+                    frames.append(frame[["driver_id", "driver_name", "delta", "rank", "session"]].reset_index(drop=True))
+                self.sessions[key] = frames
+                self.fp[key] = merge_fp_frames(frames)
+
+                q3 = 89.0 + pace + rng.normal(0.0, 0.25, size=drivers)
+                order = np.argsort(q3)
+                positions = np.empty(drivers, dtype=int)
+                positions[order] = np.arange(1, drivers + 1)
+                self.qualifying[key] = pd.DataFrame(
+                    {
+                        "driver_id": ids,
+                        "driver_name": ids,
+                        "position": positions,
+                        "q3_time": np.where(positions <= 10, q3, np.nan),
+                    }
+                )
+                finish = positions + rng.normal(0.0, 3.0, size=drivers)
+                race_positions = np.empty(drivers, dtype=int)
+                race_positions[np.argsort(finish)] = np.arange(1, drivers + 1)
+                self.race[key] = pd.DataFrame({"driver_id": ids, "driver_name": ids, "position": race_positions})
+
+                if rnd == 1:
+                    self.standings[key] = None
+                else:
+                    self.standings[key] = pd.DataFrame(
+                        {
+                            "driver_id": ids,
+                            "driver_name": ids,
+                            "position_start": pd.Series(points).rank(method="min", ascending=False).astype(int),
+                            "points": points.copy(),
+                        }
+                    )
+                points += np.array([POINTS_TABLE.get(int(pos), 0) for pos in race_positions])
+
+    def list_rounds(self, year: int) -> List[Dict[str, object]]:
+        return self.rounds.get(year, [])
+
+    def get_fp_features(self, year: int, round_number: int) -> pd.DataFrame:
+        return self.fp.get((year, round_number), pd.DataFrame())
+
+    def get_qualifying_results(self, year: int, round_number: int) -> pd.DataFrame:
+        return self.qualifying.get((year, round_number), pd.DataFrame())
+
+    def get_race_results(self, year: int, round_number: int) -> pd.DataFrame:
+        return self.race.get((year, round_number), pd.DataFrame())
+
+    def get_standings(self, year: int, round_number: int) -> Optional[pd.DataFrame]:
+        return self.standings.get((year, round_number))
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    setup: Callable[[SyntheticProvider, List[int]], Callable[[], object]]
+    # Model selection grows with folds x candidates: cap sizes and repeats where a run takes minutes.
+    max_seasons: Optional[int] = None
+    max_repeat: Optional[int] = None
+    warmup: bool = True
+
+
+def _years(seasons: int) -> List[int]:
+    return list(range(LAST_YEAR - seasons + 1, LAST_YEAR + 1))
+
+
+def _history(provider: SyntheticProvider, years: List[int], mode: str = "qualifying") -> pd.DataFrame:
+    train, _ = build_training_data(provider, mode, years, years[-1] + 1, 1, include_standings=False)
+    return train
+
+
+def _setup_merge_fp(provider: SyntheticProvider, years: List[int]) -> Callable[[], object]:
+    sessions = list(provider.sessions.values())
+    return lambda: [merge_fp_frames(frames) for frames in sessions]
+
+
+def _setup_merge_round(provider: SyntheticProvider, years: List[int]) -> Callable[[], object]:
+    keys = list(provider.fp)
+
+    def run() -> object:
+        return [
+            _merge_round_data(
+                "synthetic",
+                year,
+                rnd,
+                f"Grand Prix {rnd}",
+                provider.fp[(year, rnd)],
+                provider.qualifying[(year, rnd)],
+                provider.race[(year, rnd)],
+                provider.standings[(year, rnd)] if provider.standings[(year, rnd)] is not None else pd.DataFrame(),
+            )
+            for year, rnd in keys
+        ]
+
+    return run
+
+
+def _setup_build(mode: str) -> Callable[[SyntheticProvider, List[int]], Callable[[], object]]:
+    def setup(provider: SyntheticProvider, years: List[int]) -> Callable[[], object]:
+        return lambda: build_training_data(provider, mode, years, years[-1] + 1, 1, include_standings=mode == "race")
+
+    return setup
+
+
+def _setup_folds(provider: SyntheticProvider, years: List[int]) -> Callable[[], object]:
+    train = _history(provider, years)
+    feature_cols, _ = feature_columns("qualifying", False)
+    return lambda: _walk_forward_folds(train, _build_design_matrix(train, feature_cols))
+
+
+def _setup_train(**options: object) -> Callable[[SyntheticProvider, List[int]], Callable[[], object]]:
+    def setup(provider: SyntheticProvider, years: List[int]) -> Callable[[], object]:
+        train = _history(provider, years)
+        feature_cols, _ = feature_columns("qualifying", False)
+        _candidate_models()  # estimator imports stay out of the timing
+        return lambda: train_model(train, feature_cols, **options)
+
+    return setup
+
+
+def _setup_predict(heuristic: bool) -> Callable[[SyntheticProvider, List[int]], Callable[[], object]]:
+    def setup(provider: SyntheticProvider, years: List[int]) -> Callable[[], object]:
+        feature_cols, fallback_cols = feature_columns("qualifying", False)
+        model, preprocessor = None, None
+        if not heuristic:
+            # A fixed ridge fit: the timing must not depend on which candidate selection would keep.
+            from sklearn.linear_model import Ridge
+
+            train = _history(provider, years)
+            preprocessor = FeaturePreprocessor.fit(train, feature_cols)
+            model = Ridge(alpha=1.0).fit(preprocessor.transform(train), train["target"].to_numpy())
+        weekends = list(provider.fp.values())
+        return lambda: [
+            predict_with_model(model, features, feature_cols, fallback_cols, preprocessor) for features in weekends
+        ]
+
+    return setup
+
+
+def _setup_pipeline(provider: SyntheticProvider, years: List[int]) -> Callable[[], object]:
+    def run() -> object:
+        with tempfile.TemporaryDirectory() as output_dir:
+            config = PipelineConfig(sources=["synthetic"], years=years, output_dir=output_dir, cache_dir=None)
+            return run_pipeline(config, providers={"synthetic": provider})
+
+    return run
+
+
+CASES = [
+    BenchmarkCase("merge_fp_frames", _setup_merge_fp),
+    BenchmarkCase("_merge_round_data", _setup_merge_round),
+    BenchmarkCase("build_training_data[qualifying]", _setup_build("qualifying")),
+    BenchmarkCase("build_training_data[race]", _setup_build("race")),
+    BenchmarkCase("_walk_forward_folds", _setup_folds),
+    BenchmarkCase("train_model", _setup_train(), max_seasons=5, max_repeat=1, warmup=False),
+    BenchmarkCase(
+        "train_model[halving/incremental]",
+        _setup_train(selection="halving", incremental=True),
+        max_repeat=1,
+        warmup=False,
+    ),
+    BenchmarkCase("predict_with_model", _setup_predict(heuristic=False)),
+    BenchmarkCase("predict_with_model[heuristic]", _setup_predict(heuristic=True)),
+    BenchmarkCase("run_pipeline", _setup_pipeline),
+]
+
+
+def _time(fn: Callable[[], object], repeat: int, warmup: bool = True) -> List[float]:
+    if warmup:
+        fn()  # lazy imports and first-call caches are not what is being measured
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def run_benchmarks(
+    sizes: Tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = 3,
+    cases: Optional[List[str]] = None,
+    progress: Optional[Callable[[Dict[str, object]], None]] = None,
+) -> Dict[str, object]:
+    selected = [case for case in CASES if not cases or case.name in cases]
+    unknown = sorted(set(cases or []) - {case.name for case in CASES})
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+    results: List[Dict[str, object]] = []
+    for seasons in sizes:
+        years = _years(seasons)
+        provider = SyntheticProvider(years)
+        for case in selected:
+            if case.max_seasons is not None and seasons > case.max_seasons:
+                continue
+            runs = max(1, min(repeat, case.max_repeat or repeat))
+            timings = _time(case.setup(provider, years), runs, case.warmup)
+            record = {
+                "case": case.name,
+                "seasons": seasons,
+                "median_ms": round(statistics.median(timings), 3),
+                "min_ms": round(min(timings), 3),
+                "repeat": len(timings),
+            }
+            results.append(record)
+            if progress is not None:
+                progress(record)
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sizes": list(sizes),
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, object],
+    current: Dict[str, object],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_ms: float = MIN_REGRESSION_MS,
+) -> List[Dict[str, object]]:
+    """One row per (case, seasons) in both runs; `status` is regression, improvement or same."""
+    before = {(r["case"], r["seasons"]): r for r in baseline.get("results", [])}
+    rows: List[Dict[str, object]] = []
+    for record in current.get("results", []):
+        key = (record["case"], record["seasons"])
+        if key not in before:
+            continue
+        old, new = float(before[key]["median_ms"]), float(record["median_ms"])
+        ratio = new / old if old > 0 else float("inf")
+        status = "same"
+        if ratio > 1.0 + threshold and new - old > min_ms:
+            status = "regression"
+        elif ratio < 1.0 - threshold and old - new > min_ms:
+            status = "improvement"
+        rows.append(
+            {
+                "case": record["case"],
+                "seasons": record["seasons"],
+                "baseline_ms": old,
+                "current_ms": new,
+                "ratio": round(ratio, 3),
+                "status": status,
+            }
+        )
+    return rows
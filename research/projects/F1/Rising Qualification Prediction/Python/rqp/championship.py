@@ -0,0 +1,164 @@
+"""Monte Carlo projection of the drivers' championship for the rest of a season."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .constants import DEFAULT_SIMULATIONS, FORM_WINDOW
+from .data import build_training_data
+from .prediction import feature_columns, predict_with_model
+from .providers import BaseProvider, CachedProvider, FastF1Provider, OpenF1Provider
+from .registry import ModelRegistry
+from .simulation import simulate_championship
+from .training import train_model
+
+
+@dataclass
+class ChampionshipConfig:
+    source: str
+    year: int
+    from_round: int
+    train_seasons: List[int]
+    cache_dir: Optional[str]
+    simulations: int = DEFAULT_SIMULATIONS
+    form_window: int = FORM_WINDOW
+    model_dir: Optional[str] = None
+    selection: str = "full"
+    incremental: bool = False
+    ensemble: bool = False
+
+
+@dataclass
+class ChampionshipResult:
+    table: pd.DataFrame
+    positions: pd.DataFrame
+    remaining_rounds: List[int]
+    notes: List[str]
+
+
+def _build_provider(config: ChampionshipConfig) -> BaseProvider:
+    if config.source == "fastf1":
+        return FastF1Provider(config.cache_dir)
+    return OpenF1Provider(cache_dir=config.cache_dir)
+
+
+def _driver_form(history: pd.DataFrame, feature_cols: List[str], window: int) -> pd.DataFrame:
+    latest = history.loc[history["event_key"] == history["event_key"].max(), "driver_id"].unique()
+    recent = history.loc[history["driver_id"].isin(latest)].sort_values("event_key")
+    recent = recent.groupby("driver_id", sort=False).tail(window)
+    numeric = recent.reindex(columns=feature_cols).apply(pd.to_numeric, errors="coerce")
+    numeric["driver_id"] = recent["driver_id"].to_numpy()
+    form = numeric.groupby("driver_id", sort=True).mean().reset_index()
+    if "driver_name" in recent.columns:
+        names = recent.drop_duplicates("driver_id", keep="last").set_index("driver_id")["driver_name"]
+        form["driver_name"] = form["driver_id"].map(names).fillna(form["driver_id"])
+    else:
+        form["driver_name"] = form["driver_id"]
+    return form
+
+
+def _current_points(provider: BaseProvider, year: int, from_round: int, drivers: pd.Series) -> np.ndarray:
+    standings = provider.get_standings(year, from_round)
+    if standings is None or standings.empty or "points" not in standings.columns:
+        return np.zeros(len(drivers), dtype=np.float32)
+    points = standings.set_index(standings["driver_id"].astype(str))["points"]
+    points = pd.to_numeric(points, errors="coerce")
+    return drivers.astype(str).map(points).fillna(0.0).to_numpy(dtype=np.float32)
+
+
+def run_championship(
+    config: ChampionshipConfig,
+    provider: Optional[BaseProvider] = None,
+) -> ChampionshipResult:
+    if provider is None:
+        provider = CachedProvider(_build_provider(config))
+    notes: List[str] = []
+    empty = ChampionshipResult(
+        table=pd.DataFrame(), positions=pd.DataFrame(), remaining_rounds=[], notes=notes
+    )
+
+    try:
+        listed = provider.list_rounds(config.year)
+    except (Exception, SystemExit) as exc:
+        notes.append(f"Echec listing rounds {config.year}: {exc}")
+        return empty
+    remaining = sorted(
+        int(rnd["round_number"]) for rnd in listed if int(rnd["round_number"]) >= config.from_round
+    )
+
+    history, training_notes = build_training_data(
+        provider=provider,
+        mode="race",
+        train_seasons=config.train_seasons,
+        target_year=config.year,
+        target_round=config.from_round,
+        include_standings=False,
+    )
+    notes.extend(training_notes)
+    if history.empty:
+        return empty
+
+    feature_cols, fallback_cols = feature_columns("race", False)
+    registry = ModelRegistry(config.model_dir) if config.model_dir else None
+    training = train_model(
+        history,
+        feature_cols,
+        registry=registry,
+        selection=config.selection,
+        incremental=config.incremental,
+        ensemble=config.ensemble,
+    )
+    notes.extend(training.notes)
+    if training.residuals is None:
+        notes.append("Residus walk-forward indisponibles: projection championnat impossible.")
+        return empty
+
+    form = _driver_form(history, feature_cols, config.form_window)
+    preds = predict_with_model(
+        training.model, form, feature_cols, fallback_cols, preprocessor=training.preprocessor
+    ).to_numpy()
+    current_points = _current_points(provider, config.year, config.from_round, form["driver_id"])
+
+    distribution = simulate_championship(
+        preds,
+        training.residuals,
+        current_points,
+        n_rounds=len(remaining),
+        simulations=config.simulations,
+        seed=config.year * 100 + config.from_round,
+    )
+    notes.append(
+        f"Simulation championnat: {config.simulations} saisons, {len(remaining)} rounds restants, "
+        f"forme sur {config.form_window} derniers rounds."
+    )
+
+    probabilities = distribution.position_probabilities
+    table = pd.DataFrame(
+        {
+            "driver_id": form["driver_id"].to_numpy(),
+            "driver_name": form["driver_name"].to_numpy(),
+            "pred_race_position": preds,
+            "current_points": current_points,
+            "expected_points": distribution.expected_points,
+            "p_title": distribution.p_title,
+            "p_top3": probabilities[:, :3].sum(axis=1),
+            "expected_position": probabilities @ np.arange(1, len(preds) + 1),
+        }
+    ).sort_values(["expected_position", "p_title"], ascending=[True, False])
+    table.insert(0, "rank", range(1, len(table) + 1))
+    positions = pd.DataFrame(
+        probabilities,
+        columns=[f"p{pos}" for pos in range(1, len(preds) + 1)],
+    )
+    positions.insert(0, "driver_name", form["driver_name"].to_numpy())
+    positions = positions.loc[table.index].reset_index(drop=True)
+    return ChampionshipResult(
+        table=table.reset_index(drop=True),
+        positions=positions,
+        remaining_rounds=remaining,
+        notes=notes,
+    )
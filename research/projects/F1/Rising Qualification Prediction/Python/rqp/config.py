@@ -5,6 +5,28 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional
 
+from .constants import DEFAULT_SIMULATIONS
+
+
+def parse_train_seasons(value: str, target_year: int) -> List[int]:
+    if value.lower() in {"auto", "default"}:
+        return [target_year - 2, target_year - 1, target_year]
+    return [int(x.strip()) for x in value.split(",") if x.strip()]
+
+
+def parse_rounds(value: str) -> List[int]:
+    rounds: List[int] = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            rounds.extend(range(int(start), int(end) + 1))
+        else:
+            rounds.append(int(part))
+    return sorted(set(rounds))
+
 
 @dataclass
 class PredictionConfig:
@@ -17,6 +39,11 @@ class PredictionConfig:
     cache_dir: Optional[str]
     meeting_name: Optional[str]
     country_name: Optional[str]
+    model_dir: Optional[str] = None
+    selection: str = "full"
+    incremental: bool = False
+    ensemble: bool = False
+    simulations: int = DEFAULT_SIMULATIONS
 
 
 @dataclass
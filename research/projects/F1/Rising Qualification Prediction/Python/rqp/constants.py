@@ -12,3 +12,6 @@ POINTS_TABLE = {
     9: 2,
     10: 1,
 }
+
+DEFAULT_SIMULATIONS = 100_000
+FORM_WINDOW = 5
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple
+import re
+from typing import List, Optional, Tuple
 
 import pandas as pd
 
 from .providers import BaseProvider
 
+NO_HISTORY_NOTE = "Pas assez de data historique: fallback heuristique."
+# Per-round fetch failures are worded "Echec <what> <year> round <n>: ..." (see _round_failure).
+_ROUND_NOTE = re.compile(r"^Echec .+ (\d{4}) round (\d+): ")
+
+
+def _round_failure(what: str, year: int, round_number: int, exc: BaseException) -> str:
+    return f"Echec {what} {year} round {round_number}: {exc}"
+
+
+def _note_round(note: str) -> Optional[Tuple[int, int]]:
+    match = _ROUND_NOTE.match(note)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
 
 def build_training_data(
     provider: BaseProvider,
@@ -20,6 +34,8 @@ def build_training_data(
     rows: List[pd.DataFrame] = []
     notes: List[str] = []
     for year in train_seasons:
+        if year > target_year:
+            continue
         try:
             rounds = provider.list_rounds(year)
         except (Exception, SystemExit) as exc:
@@ -32,7 +48,7 @@ def build_training_data(
             try:
                 fp_features = provider.get_fp_features(year, round_number)
             except (Exception, SystemExit) as exc:
-                notes.append(f"Echec FP {year} round {round_number}: {exc}")
+                notes.append(_round_failure("FP", year, round_number, exc))
                 continue
             if fp_features.empty:
                 continue
@@ -40,7 +56,7 @@ def build_training_data(
                 try:
                     qualy = provider.get_qualifying_results(year, round_number)
                 except (Exception, SystemExit) as exc:
-                    notes.append(f"Echec qualifs {year} round {round_number}: {exc}")
+                    notes.append(_round_failure("qualifs", year, round_number, exc))
                     continue
                 if qualy.empty or "q3_time" not in qualy.columns:
                     continue
@@ -63,7 +79,7 @@ def build_training_data(
                     race = provider.get_race_results(year, round_number)
                     qualy = provider.get_qualifying_results(year, round_number)
                 except (Exception, SystemExit) as exc:
-                    notes.append(f"Echec race/qualifs {year} round {round_number}: {exc}")
+                    notes.append(_round_failure("race/qualifs", year, round_number, exc))
                     continue
                 if race.empty or qualy.empty:
                     continue
@@ -77,7 +93,7 @@ def build_training_data(
                     try:
                         standings = provider.get_standings(year, round_number)
                     except (Exception, SystemExit) as exc:
-                        notes.append(f"Echec standings {year} round {round_number}: {exc}")
+                        notes.append(_round_failure("standings", year, round_number, exc))
                         standings = None
                     if standings is not None and not standings.empty:
                         merged = merged.merge(
@@ -92,12 +108,38 @@ def build_training_data(
                 merged["event_key"] = (year * 100) + round_number
                 rows.append(merged)
     if not rows:
-        notes.append("Pas assez de data historique: fallback heuristique.")
+        notes.append(NO_HISTORY_NOTE)
         return pd.DataFrame(), notes
     train = pd.concat(rows, ignore_index=True)
     return train, notes
 
 
+def slice_training_data(
+    train: pd.DataFrame,
+    notes: List[str],
+    target_year: int,
+    target_round: int,
+) -> Tuple[pd.DataFrame, List[str]]:
+    # Failures of rounds at or after the target belong to later targets of the batch, not this one.
+    notes = [
+        note
+        for note in notes
+        if note != NO_HISTORY_NOTE and (_note_round(note) or (0, 0)) < (target_year, target_round)
+    ]
+    if train.empty:
+        return train, notes + [NO_HISTORY_NOTE]
+    later = (train["event_year"] > target_year) | (
+        (train["event_year"] == target_year) & (train["event_round"] >= target_round)
+    )
+    if not later.any():
+        return train, notes
+    sliced = train.loc[~later.to_numpy()].reset_index(drop=True)
+    if sliced.empty:
+        notes.append(NO_HISTORY_NOTE)
+        return pd.DataFrame(), notes
+    return sliced, notes
+
+
 def build_current_features(
     provider: BaseProvider,
     mode: str,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import pandas as pd
 
@@ -251,7 +251,7 @@ def _write_outputs(
     return str(csv_path), parquet_output
 
 
-def run_pipeline(config: PipelineConfig) -> PipelineResult:
+def run_pipeline(config: PipelineConfig, providers: Optional[Dict[str, BaseProvider]] = None) -> PipelineResult:
     notes: List[str] = []
     all_rows: List[pd.DataFrame] = []
     coverage_rows: List[dict[str, object]] = []
@@ -259,7 +259,10 @@ def run_pipeline(config: PipelineConfig) -> PipelineResult:
     for source in config.sources:
         normalized = source.lower().strip()
         try:
-            provider = _build_provider(normalized, config.cache_dir)
+            if providers and normalized in providers:
+                provider = providers[normalized]
+            else:
+                provider = _build_provider(normalized, config.cache_dir)
         except (Exception, SystemExit) as exc:
             notes.append(f"{normalized}: provider indisponible ({exc}).")
             continue
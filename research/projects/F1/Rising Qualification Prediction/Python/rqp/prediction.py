@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
 from .config import PredictionConfig, PredictionResult
-from .data import build_current_features, build_training_data
-from .providers import FastF1Provider, OpenF1Provider, BaseProvider
+from .data import build_current_features, build_training_data, slice_training_data
+from .preprocessing import FeaturePreprocessor
+from .providers import FastF1Provider, OpenF1Provider, BaseProvider, CachedProvider
+from .registry import ModelRegistry
+from .simulation import simulate_finishing_order
 from .training import train_model
-from .utils import format_prediction_table
+from .utils import LRUCache, format_prediction_table
 
 
 def compute_version(round_number: int, include_standings: bool) -> str:
@@ -21,19 +28,28 @@ def compute_version(round_number: int, include_standings: bool) -> str:
     return f"V{round_number}"
 
 
+def resolve_model_dir(config: PredictionConfig) -> Optional[str]:
+    if config.model_dir:
+        return config.model_dir
+    if config.cache_dir:
+        return os.path.join(config.cache_dir, "models")
+    return None
+
+
 def predict_with_model(
     model: Optional[object],
     features: pd.DataFrame,
     feature_cols: List[str],
     fallback_cols: List[str],
+    preprocessor: Optional[FeaturePreprocessor] = None,
 ) -> pd.Series:
     if features.empty:
         return pd.Series(dtype=float)
     if model is not None:
-        X = features.reindex(columns=feature_cols).copy()
-        X = X.apply(pd.to_numeric, errors="coerce")
-        X = X.fillna(X.median(numeric_only=True))
-        X = X.fillna(0.0)
+        if preprocessor is None:
+            # Models without a frozen preprocessor: impute from the current weekend.
+            preprocessor = FeaturePreprocessor.fit(features, feature_cols)
+        X = preprocessor.transform(features)
         return pd.Series(model.predict(X), index=features.index)
     fallback = features.reindex(columns=fallback_cols).copy()
     if fallback.empty:
@@ -44,37 +60,19 @@ def predict_with_model(
     return fallback.mean(axis=1).fillna(0.0)
 
 
-def run_prediction(config: PredictionConfig) -> PredictionResult:
-    provider: BaseProvider
+def build_provider(config: PredictionConfig) -> BaseProvider:
     if config.source == "fastf1":
-        provider = FastF1Provider(config.cache_dir)
-    else:
-        provider = OpenF1Provider(
-            cache_dir=config.cache_dir,
-            target_round=config.round_number,
-            meeting_name=config.meeting_name,
-            country_name=config.country_name,
-        )
-
-    train, notes = build_training_data(
-        provider=provider,
-        mode=config.mode,
-        train_seasons=config.train_seasons,
-        target_year=config.year,
+        return FastF1Provider(config.cache_dir)
+    return OpenF1Provider(
+        cache_dir=config.cache_dir,
         target_round=config.round_number,
-        include_standings=config.include_standings,
+        meeting_name=config.meeting_name,
+        country_name=config.country_name,
     )
 
-    features, feature_notes = build_current_features(
-        provider=provider,
-        mode=config.mode,
-        year=config.year,
-        round_number=config.round_number,
-        include_standings=config.include_standings,
-    )
-    notes.extend(feature_notes)
 
-    if config.mode == "qualifying":
+def feature_columns(mode: str, include_standings: bool) -> Tuple[List[str], List[str]]:
+    if mode == "qualifying":
         feature_cols = [
             "fp1_delta",
             "fp2_delta",
@@ -98,13 +96,84 @@ def run_prediction(config: PredictionConfig) -> PredictionResult:
             "fp_mean_rank",
             "qualy_position",
         ]
-        if config.include_standings:
+        if include_standings:
             feature_cols.append("position_start")
         fallback_cols = ["qualy_position"]
+    return feature_cols, fallback_cols
+
+
+def _training_cache_key(config: PredictionConfig) -> tuple:
+    return (
+        config.source,
+        config.cache_dir,
+        config.mode,
+        tuple(config.train_seasons),
+        config.year,
+        config.round_number,
+        config.include_standings,
+        config.meeting_name,
+        config.country_name,
+    )
+
+
+def provider_key(config: PredictionConfig) -> tuple:
+    filtered = bool(config.meeting_name or config.country_name)
+    return (
+        config.source,
+        config.cache_dir,
+        config.meeting_name,
+        config.country_name,
+        config.round_number if filtered else None,
+    )
+
+
+def _training_group_key(config: PredictionConfig) -> tuple:
+    return provider_key(config) + (
+        config.mode,
+        tuple(config.train_seasons),
+        config.include_standings,
+    )
+
+
+def _predict_from_training(
+    config: PredictionConfig,
+    provider: BaseProvider,
+    registry: Optional[ModelRegistry],
+    train: pd.DataFrame,
+    training_notes: List[str],
+) -> PredictionResult:
+    notes = list(training_notes)
 
-    training_result = train_model(train, feature_cols)
+    features, feature_notes = build_current_features(
+        provider=provider,
+        mode=config.mode,
+        year=config.year,
+        round_number=config.round_number,
+        include_standings=config.include_standings,
+    )
+    notes.extend(feature_notes)
+
+    feature_cols, fallback_cols = feature_columns(config.mode, config.include_standings)
+
+    if registry is None:
+        model_dir = resolve_model_dir(config)
+        registry = ModelRegistry(model_dir) if model_dir else None
+    training_result = train_model(
+        train,
+        feature_cols,
+        registry=registry,
+        selection=config.selection,
+        incremental=config.incremental,
+        ensemble=config.ensemble,
+    )
     notes.extend(training_result.notes)
-    preds = predict_with_model(training_result.model, features, feature_cols, fallback_cols)
+    preds = predict_with_model(
+        training_result.model,
+        features,
+        feature_cols,
+        fallback_cols,
+        preprocessor=training_result.preprocessor,
+    )
     output = features.copy()
     output["pred"] = preds
     if "driver_name" not in output.columns:
@@ -115,6 +184,107 @@ def run_prediction(config: PredictionConfig) -> PredictionResult:
     elif "driver_id" in output.columns:
         output["driver_name"] = output["driver_name"].fillna(output["driver_id"])
 
+    residuals = training_result.residuals
+    if config.simulations > 0 and residuals is not None and len(output) > 1:
+        distribution = simulate_finishing_order(
+            output["pred"].to_numpy(),
+            residuals,
+            simulations=config.simulations,
+            seed=config.year * 100 + config.round_number,
+        )
+        output["p_pole"] = distribution.p_pole
+        output["p_top3"] = distribution.p_top3
+        output["p_top10"] = distribution.p_top10
+        output["expected_position"] = distribution.expected_position
+        notes.append(
+            f"Simulation Monte Carlo: {config.simulations} sessions "
+            f"(residus walk-forward, n={len(residuals)})."
+        )
+
     version = compute_version(config.round_number, config.include_standings)
     table = format_prediction_table(output, top_n=10)
     return PredictionResult(version=version, table=table, notes=notes)
+
+
+def run_prediction(
+    config: PredictionConfig,
+    provider: Optional[BaseProvider] = None,
+    registry: Optional[ModelRegistry] = None,
+    training_cache: Optional[LRUCache] = None,
+) -> PredictionResult:
+    if provider is None:
+        provider = build_provider(config)
+
+    cache_key = _training_cache_key(config)
+    cached = training_cache.get(cache_key) if training_cache is not None else None
+    if cached is not None:
+        train, training_notes = cached
+    else:
+        train, training_notes = build_training_data(
+            provider=provider,
+            mode=config.mode,
+            train_seasons=config.train_seasons,
+            target_year=config.year,
+            target_round=config.round_number,
+            include_standings=config.include_standings,
+        )
+        if training_cache is not None:
+            training_cache.put(cache_key, (train, training_notes))
+    return _predict_from_training(config, provider, registry, train, training_notes)
+
+
+def run_prediction_batch(
+    configs: Sequence[PredictionConfig],
+    provider: Optional[BaseProvider] = None,
+    registry: Optional[ModelRegistry] = None,
+) -> List[PredictionResult]:
+    providers: Dict[tuple, BaseProvider] = {}
+    groups: Dict[tuple, List[int]] = {}
+    for idx, config in enumerate(configs):
+        groups.setdefault(_training_group_key(config), []).append(idx)
+
+    results: List[Optional[PredictionResult]] = [None] * len(configs)
+    for indices in groups.values():
+        group = [configs[idx] for idx in indices]
+        latest = max(group, key=lambda config: (config.year, config.round_number))
+        group_provider = provider
+        if group_provider is None:
+            key = provider_key(latest)
+            if key not in providers:
+                providers[key] = CachedProvider(build_provider(latest))
+            group_provider = providers[key]
+        # One historical frame per group, built up to the latest target;
+        # earlier targets train on the rows that precede them.
+        train, training_notes = build_training_data(
+            provider=group_provider,
+            mode=latest.mode,
+            train_seasons=latest.train_seasons,
+            target_year=latest.year,
+            target_round=latest.round_number,
+            include_standings=latest.include_standings,
+        )
+        for idx in indices:
+            config = configs[idx]
+            round_train, round_notes = slice_training_data(
+                train, training_notes, config.year, config.round_number
+            )
+            results[idx] = _predict_from_training(
+                config, group_provider, registry, round_train, round_notes
+            )
+    return [result for result in results if result is not None]
+
+
+def prediction_payload(config: PredictionConfig, result: PredictionResult) -> Dict[str, object]:
+    if result.table.empty:
+        rows = []
+    else:
+        rows = json.loads(result.table.to_json(orient="records"))
+    return {
+        "version": result.version,
+        "sport": "F1",
+        "project": "Rising Qualification Prediction",
+        "config": asdict(config),
+        "rows": rows,
+        "notes": result.notes,
+        "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
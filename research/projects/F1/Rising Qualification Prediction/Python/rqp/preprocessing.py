@@ -0,0 +1,54 @@
+"""Frozen feature preprocessing shared by training and inference."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+DTYPE = np.float32
+
+
+def _column_values(frame: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in frame.columns:
+        return np.full(len(frame), np.nan, dtype=DTYPE)
+    series = frame[column]
+    if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+        series = pd.to_numeric(series, errors="coerce")
+    return series.to_numpy(dtype=DTYPE, na_value=np.nan)
+
+
+@dataclass(frozen=True, eq=False)
+class FeaturePreprocessor:
+    columns: Tuple[str, ...]
+    dtypes: Tuple[str, ...]
+    medians: np.ndarray
+
+    @classmethod
+    def fit(cls, frame: pd.DataFrame, feature_cols: List[str]) -> "FeaturePreprocessor":
+        columns = tuple(feature_cols)
+        dtypes = tuple(str(frame[c].dtype) if c in frame.columns else "missing" for c in columns)
+        X = cls(columns=columns, dtypes=dtypes, medians=np.zeros(len(columns), dtype=DTYPE)).raw(frame)
+        medians = np.zeros(len(columns), dtype=DTYPE)
+        observed = ~np.isnan(X).all(axis=0) if len(X) else np.zeros(len(columns), dtype=bool)
+        if observed.any():
+            medians[observed] = np.nanmedian(X[:, observed], axis=0)
+        medians.setflags(write=False)
+        return cls(columns=columns, dtypes=dtypes, medians=medians)
+
+    @property
+    def median_map(self) -> dict:
+        return {col: float(value) for col, value in zip(self.columns, self.medians)}
+
+    def raw(self, frame: pd.DataFrame) -> np.ndarray:
+        X = np.empty((len(frame), len(self.columns)), dtype=DTYPE)
+        for j, column in enumerate(self.columns):
+            X[:, j] = _column_values(frame, column)
+        return X
+
+    def transform(self, frame: pd.DataFrame) -> np.ndarray:
+        X = self.raw(frame)
+        np.copyto(X, np.broadcast_to(self.medians, X.shape), where=np.isnan(X))
+        return X
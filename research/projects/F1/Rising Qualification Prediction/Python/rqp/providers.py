@@ -9,15 +9,24 @@ import time
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
-import requests
 
 from .constants import POINTS_TABLE
-from .utils import first_available, merge_fp_frames
+from .utils import LRUCache, first_available, merge_fp_frames
 
-try:
-    import fastf1
-except Exception:  # pragma: no cover - optional dependency
-    fastf1 = None
+# fastf1 and requests are imported on first use: both are slow to import and
+# most runs only need one of them (or neither, on a warm cache).
+fastf1 = None
+
+
+def _load_fastf1() -> Optional[object]:
+    global fastf1
+    if fastf1 is None:
+        try:
+            import fastf1 as module
+        except Exception:  # pragma: no cover - optional dependency
+            return None
+        fastf1 = module
+    return fastf1
 
 
 class BaseProvider:
@@ -37,9 +46,45 @@ class BaseProvider:
         return None
 
 
+_MISSING = object()
+
+
+class CachedProvider(BaseProvider):
+    def __init__(self, provider: BaseProvider, max_entries: int = 1024) -> None:
+        self.provider = provider
+        self.cache = LRUCache(max_entries)
+
+    def _cached(self, method: str, *args: object) -> object:
+        key = (method,) + args
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = getattr(self.provider, method)(*args)
+            self.cache.put(key, value)
+        if isinstance(value, pd.DataFrame):
+            return value.copy()
+        if isinstance(value, list):
+            return [dict(item) for item in value]
+        return value
+
+    def list_rounds(self, year: int) -> List[Dict[str, object]]:
+        return self._cached("list_rounds", year)
+
+    def get_fp_features(self, year: int, round_number: int) -> pd.DataFrame:
+        return self._cached("get_fp_features", year, round_number)
+
+    def get_qualifying_results(self, year: int, round_number: int) -> pd.DataFrame:
+        return self._cached("get_qualifying_results", year, round_number)
+
+    def get_race_results(self, year: int, round_number: int) -> pd.DataFrame:
+        return self._cached("get_race_results", year, round_number)
+
+    def get_standings(self, year: int, round_number: int) -> Optional[pd.DataFrame]:
+        return self._cached("get_standings", year, round_number)
+
+
 class FastF1Provider(BaseProvider):
     def __init__(self, cache_dir: Optional[str]) -> None:
-        if fastf1 is None:
+        if _load_fastf1() is None:
             raise SystemExit(
                 "FastF1 is not installed. Install with: pip install fastf1"
             )
@@ -143,7 +188,7 @@ class FastF1Provider(BaseProvider):
         )
         df["position_start"] = df["points"].rank(method="min", ascending=False).astype(int)
         df["driver_name"] = df["driver_id"]
-        return df[["driver_id", "driver_name", "position_start"]]
+        return df[["driver_id", "driver_name", "position_start", "points"]]
 
 
 class OpenF1Provider(BaseProvider):
@@ -175,6 +220,8 @@ class OpenF1Provider(BaseProvider):
         if cache_path and os.path.exists(cache_path):
             with open(cache_path, "r", encoding="utf-8") as f:
                 return json.load(f)
+        import requests
+
         last_error: Optional[Exception] = None
         for attempt in range(3):
             try:
@@ -365,7 +412,9 @@ class OpenF1Provider(BaseProvider):
                 "driver_id": str(s.get("driver_number")),
                 "driver_name": str(s.get("driver_number")),
                 "position_start": s.get("position_start") or s.get("position_current"),
+                "points": s.get("points_current"),
             })
         df = pd.DataFrame(rows)
         df["position_start"] = pd.to_numeric(df["position_start"], errors="coerce")
+        df["points"] = pd.to_numeric(df["points"], errors="coerce")
         return df
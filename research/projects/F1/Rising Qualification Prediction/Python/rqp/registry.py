@@ -0,0 +1,80 @@
+"""On-disk registry of fitted models keyed by a training-data fingerprint."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from .utils import LRUCache
+
+REGISTRY_VERSION = 3
+
+
+def training_fingerprint(
+    train: pd.DataFrame,
+    feature_cols: List[str],
+    candidates: Sequence[object],
+) -> str:
+    header = {
+        "registry_version": REGISTRY_VERSION,
+        "feature_cols": list(feature_cols),
+        "candidates": list(candidates),
+    }
+    digest = hashlib.sha256()
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+    frame = train.reindex(columns=list(feature_cols) + ["target", "event_key"])
+    hashed = pd.util.hash_pandas_object(frame, index=False)
+    digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    def __init__(self, root: Optional[str] = None, memory: Optional[LRUCache] = None) -> None:
+        self.root = root
+        self.memory = memory
+        if root:
+            os.makedirs(root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.pkl")
+
+    def load(self, key: str) -> Optional[object]:
+        if self.memory is not None:
+            entry = self.memory.get(key)
+            if entry is not None:
+                return copy.copy(entry)
+        if not self.root:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        if self.memory is not None:
+            self.memory.put(key, entry)
+        return copy.copy(entry)
+
+    def save(self, key: str, entry: object) -> None:
+        if self.memory is not None:
+            self.memory.put(key, entry)
+        if not self.root:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
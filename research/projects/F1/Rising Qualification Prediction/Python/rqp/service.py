@@ -0,0 +1,237 @@
+"""Resident prediction service keeping providers, fetch caches, training frames and models warm."""
+
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Mapping, Optional
+
+from .config import PredictionConfig, parse_train_seasons
+from .constants import DEFAULT_SIMULATIONS
+from .prediction import (
+    build_provider,
+    prediction_payload,
+    provider_key,
+    resolve_model_dir,
+    run_prediction,
+)
+from .providers import BaseProvider, CachedProvider
+from .registry import ModelRegistry
+from .training import SELECTION_STRATEGIES
+from .utils import LRUCache
+
+
+def _optional_str(params: Mapping[str, object], key: str) -> Optional[str]:
+    value = params.get(key)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _required_int(params: Mapping[str, object], key: str, *aliases: str) -> int:
+    for name in (key,) + aliases:
+        value = params.get(name)
+        if value is None or value == "":
+            continue
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid param: {name}") from None
+    raise ValueError(f"Missing param: {key}")
+
+
+def _optional_int(params: Mapping[str, object], key: str, default: int) -> int:
+    value = params.get(key)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid param: {key}") from None
+
+
+def _optional_bool(params: Mapping[str, object], key: str, default: bool = False) -> bool:
+    # JSON bools or their string spelling only: bool("false") is True.
+    value = params.get(key)
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in {"true", "false"}:
+        return value.strip().lower() == "true"
+    raise ValueError(f"Invalid param: {key} (expected true or false)")
+
+
+def config_from_params(params: Mapping[str, object]) -> PredictionConfig:
+    mode = _optional_str(params, "mode")
+    if mode not in {"qualifying", "race"}:
+        raise ValueError("mode must be 'qualifying' or 'race'")
+    source = _optional_str(params, "source")
+    if source not in {"fastf1", "openf1"}:
+        raise ValueError("source must be 'fastf1' or 'openf1'")
+    year = _required_int(params, "year")
+    round_number = _required_int(params, "round_number", "round")
+    train_seasons = params.get("train_seasons", "auto")
+    if isinstance(train_seasons, list):
+        seasons = [int(season) for season in train_seasons]
+    else:
+        seasons = parse_train_seasons(str(train_seasons or "auto"), year)
+    selection = _optional_str(params, "selection") or "full"
+    if selection not in SELECTION_STRATEGIES:
+        raise ValueError(f"selection must be one of {', '.join(SELECTION_STRATEGIES)}")
+    return PredictionConfig(
+        source=source,
+        mode=mode,
+        year=year,
+        round_number=round_number,
+        train_seasons=seasons,
+        include_standings=_optional_bool(params, "include_standings"),
+        cache_dir=_optional_str(params, "cache_dir"),
+        meeting_name=_optional_str(params, "meeting_name"),
+        country_name=_optional_str(params, "country_name"),
+        model_dir=_optional_str(params, "model_dir"),
+        selection=selection,
+        incremental=_optional_bool(params, "incremental"),
+        ensemble=_optional_bool(params, "ensemble"),
+        simulations=_optional_int(params, "simulations", DEFAULT_SIMULATIONS),
+    )
+
+
+class PredictionService:
+    def __init__(
+        self,
+        max_providers: int = 4,
+        max_training_frames: int = 16,
+        max_models: int = 16,
+        max_fetches: int = 2048,
+    ) -> None:
+        self.providers = LRUCache(max_providers)
+        self.training_frames = LRUCache(max_training_frames)
+        self.models = LRUCache(max_models)
+        self.max_fetches = max_fetches
+        self.requests = 0
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def _provider(self, config: PredictionConfig) -> BaseProvider:
+        key = provider_key(config)
+        provider = self.providers.get(key)
+        if provider is None:
+            provider = CachedProvider(build_provider(config), max_entries=self.max_fetches)
+            self.providers.put(key, provider)
+        return provider
+
+    def predict(self, params: Mapping[str, object]) -> Dict[str, object]:
+        """Single-flight: one prediction at a time, HTTP threads queue on the lock.
+
+        The lock covers the whole run on purpose: providers (FastF1's session cache), the fetch,
+        training-frame and model LRU caches and the on-disk registry are not thread-safe, and two
+        concurrent cold requests would only fetch and train the same things twice on one machine.
+        Parameter validation stays outside, so bad requests get their 400 without waiting.
+        """
+        config = config_from_params(params)
+        with self._lock:
+            self.requests += 1
+            started = time.perf_counter()
+            result = run_prediction(
+                config,
+                provider=self._provider(config),
+                registry=ModelRegistry(resolve_model_dir(config), memory=self.models),
+                training_cache=self.training_frames,
+            )
+            payload = prediction_payload(config, result)
+            payload["service"] = {"duration_ms": int((time.perf_counter() - started) * 1000)}
+        return payload
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "requests": self.requests,
+            "uptime_s": int(time.time() - self.started_at),
+            "providers": len(self.providers),
+            "training_frames": len(self.training_frames),
+            "models": len(self.models),
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "rqp-service/1"
+
+    def address_string(self) -> str:
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: object) -> None:
+        if not getattr(self.server, "quiet", False):
+            super().log_message(format, *args)
+
+    def _send_json(self, payload: object, status: int = 200) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json({"status": "ok", **self.server.service.stats()})
+            return
+        self._send_json({"error": "Not found"}, 404)
+
+    def do_POST(self) -> None:
+        if self.path != "/predict":
+            self._send_json({"error": "Not found"}, 404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, json.JSONDecodeError):
+            self._send_json({"error": "Invalid JSON body"}, 400)
+            return
+        params = body.get("params", body) if isinstance(body, dict) else None
+        if not isinstance(params, dict):
+            self._send_json({"error": "params must be an object"}, 400)
+            return
+        try:
+            payload = self.server.service.predict(params)
+        except ValueError as exc:
+            self._send_json({"error": str(exc)}, 400)
+            return
+        except (Exception, SystemExit) as exc:
+            self._send_json({"error": str(exc)}, 500)
+            return
+        self._send_json(payload)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(
+    service: PredictionService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[str] = None,
+    quiet: bool = False,
+) -> None:
+    server: socketserver.BaseServer
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = _UnixHTTPServer(socket_path, _Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    server.service = service
+    server.quiet = quiet
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, List, Optional
+import inspect
+import math
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-try:
-    from sklearn.ensemble import HistGradientBoostingRegressor
-    from sklearn.linear_model import Ridge
-except Exception:  # pragma: no cover - optional dependency
-    HistGradientBoostingRegressor = None
-    Ridge = None
+from .preprocessing import FeaturePreprocessor
+from .registry import ModelRegistry, training_fingerprint
 
-try:
-    from xgboost import XGBRegressor
-except Exception:  # pragma: no cover - optional dependency
-    XGBRegressor = None
+# Estimators are imported on first training call (see _load_estimators):
+# sklearn and xgboost dominate the package import time.
+HistGradientBoostingRegressor = None
+LinearRegression = None
+Ridge = None
+XGBRegressor = None
+_ESTIMATORS_LOADED = False
+
+SELECTION_STRATEGIES = ("full", "halving")
+HALVING_ETA = 3
+EARLY_STOPPING_ROUNDS = 20
+MIN_BOOSTING_ITERATIONS = 20
+MIN_WARM_START_ITERATIONS = 5
+MIN_BLEND_FOLDS = 3
 
 
 @dataclass
@@ -25,107 +35,517 @@ class TrainingResult:
     model: Optional[object]
     model_name: str
     notes: List[str]
+    feature_cols: List[str] = field(default_factory=list)
+    medians: Dict[str, float] = field(default_factory=dict)
+    leaderboard: List[Tuple[str, float]] = field(default_factory=list)
+    residuals: Optional[np.ndarray] = None
+    preprocessor: Optional[FeaturePreprocessor] = None
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    name: str
+    factory: Callable[..., object]
+    params: Dict[str, object]
+    iter_param: Optional[str] = None
+
+    def build(self, **overrides: object) -> object:
+        return self.factory(**{**self.params, **overrides})
+
+
+@dataclass
+class _DesignMatrix:
+    X: np.ndarray
+    y: np.ndarray
+    event_keys: np.ndarray
+
+
+class _RidgeStatistics:
+    def __init__(self, n_features: int) -> None:
+        self.n = 0
+        self.sum_x = np.zeros(n_features)
+        self.missing = np.zeros(n_features)
+        self.sum_y = 0.0
+        self.xtx = np.zeros((n_features, n_features))
+        self.mtx = np.zeros((n_features, n_features))
+        self.mtm = np.zeros((n_features, n_features))
+        self.xty = np.zeros(n_features)
+        self.mty = np.zeros(n_features)
+
+    def update(self, X: np.ndarray, y: np.ndarray) -> None:
+        mask = np.isnan(X)
+        X0 = np.where(mask, 0.0, X).astype(np.float64)
+        M = mask.astype(np.float64)
+        self.n += len(X)
+        self.sum_x += X0.sum(axis=0)
+        self.missing += M.sum(axis=0)
+        self.sum_y += float(y.sum())
+        self.xtx += X0.T @ X0
+        self.mtx += M.T @ X0
+        self.mtm += M.T @ M
+        self.xty += X0.T @ y
+        self.mty += M.T @ y
+
+    def solve(self, medians: np.ndarray, alpha: float) -> tuple[np.ndarray, float]:
+        m = medians.astype(np.float64)
+        sum_x = self.sum_x + m * self.missing
+        xtx = self.xtx + m[:, None] * self.mtx + (m[:, None] * self.mtx).T + np.outer(m, m) * self.mtm
+        xty = self.xty + m * self.mty
+        xtx_centered = xtx - np.outer(sum_x, sum_x) / self.n
+        xty_centered = xty - sum_x * self.sum_y / self.n
+        coef = np.linalg.solve(xtx_centered + alpha * np.eye(len(m)), xty_centered)
+        intercept = (self.sum_y - float(sum_x @ coef)) / self.n
+        return coef, intercept
+
+
+@dataclass
+class _Evaluation:
+    candidate: _Candidate
+    score: float
+    iterations: List[int] = field(default_factory=list)
+    oof: Optional[np.ndarray] = None
+
+
+@dataclass
+class _Pruned:
+    evaluation: _Evaluation
+    rung: int
+    n_folds: int
+    overrides: Dict[str, object]
+
+
+class StackedEnsemble:
+    def __init__(self, models: List[object], weights: np.ndarray, intercept: float) -> None:
+        self.models = models
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.intercept = float(intercept)
+
+    def predict(self, X: object) -> np.ndarray:
+        preds = np.column_stack([np.asarray(model.predict(X), dtype=np.float64) for model in self.models])
+        return preds @ self.weights + self.intercept
+
+
+def _load_estimators() -> None:
+    global HistGradientBoostingRegressor, LinearRegression, Ridge, XGBRegressor, _ESTIMATORS_LOADED
+    if _ESTIMATORS_LOADED:
+        return
+    _ESTIMATORS_LOADED = True
+    try:
+        from sklearn.ensemble import HistGradientBoostingRegressor as hist_gradient_boosting
+        from sklearn.linear_model import LinearRegression as linear_regression
+        from sklearn.linear_model import Ridge as ridge
+    except Exception:  # pragma: no cover - optional dependency
+        pass
+    else:
+        HistGradientBoostingRegressor = hist_gradient_boosting
+        LinearRegression = linear_regression
+        Ridge = ridge
+    try:
+        from xgboost import XGBRegressor as xgb_regressor
+    except Exception:  # pragma: no cover - optional dependency
+        pass
+    else:
+        XGBRegressor = xgb_regressor
 
 
-def _candidate_models() -> list[tuple[str, Callable[[], object]]]:
-    candidates: list[tuple[str, Callable[[], object]]] = []
+def _candidate_models() -> list[_Candidate]:
+    _load_estimators()
+    candidates: list[_Candidate] = []
     if XGBRegressor is not None:
-        candidates.append((
-            "xgboost",
-            lambda: XGBRegressor(
-                objective="reg:squarederror",
-                n_estimators=400,
-                learning_rate=0.05,
-                max_depth=5,
-                subsample=0.9,
-                colsample_bytree=0.9,
-                random_state=42,
-                n_jobs=1,
-                verbosity=0,
-            ),
+        candidates.append(_Candidate(
+            name="xgboost",
+            factory=XGBRegressor,
+            params={
+                "objective": "reg:squarederror",
+                "n_estimators": 400,
+                "learning_rate": 0.05,
+                "max_depth": 5,
+                "subsample": 0.9,
+                "colsample_bytree": 0.9,
+                "random_state": 42,
+                "n_jobs": 1,
+                "verbosity": 0,
+            },
+            iter_param="n_estimators",
         ))
     if HistGradientBoostingRegressor is not None:
-        candidates.append((
-            "hist_gradient_boosting",
-            lambda: HistGradientBoostingRegressor(
-                learning_rate=0.05,
-                max_depth=5,
-                max_iter=600,
-                random_state=42,
-            ),
+        candidates.append(_Candidate(
+            name="hist_gradient_boosting",
+            factory=HistGradientBoostingRegressor,
+            params={
+                "learning_rate": 0.05,
+                "max_depth": 5,
+                "max_iter": 600,
+                "random_state": 42,
+            },
+            iter_param="max_iter",
         ))
     if Ridge is not None:
-        candidates.append(("ridge", lambda: Ridge(alpha=1.0)))
+        candidates.append(_Candidate(name="ridge", factory=Ridge, params={"alpha": 1.0}))
     return candidates
 
 
-def _prepare_features(frame: pd.DataFrame, feature_cols: List[str]) -> pd.DataFrame:
-    X = frame.reindex(columns=feature_cols).copy()
-    X = X.apply(pd.to_numeric, errors="coerce")
-    X = X.fillna(X.median(numeric_only=True))
-    X = X.fillna(0.0)
-    return X
+def _library_version(factory: Callable[..., object]) -> str:
+    package = sys.modules.get(factory.__module__.split(".")[0])
+    return str(getattr(package, "__version__", "unknown"))
 
 
-def _prepare_training_xy(
-    frame: pd.DataFrame,
-    feature_cols: List[str],
-) -> tuple[pd.DataFrame, pd.Series]:
-    X = _prepare_features(frame, feature_cols)
-    y = pd.to_numeric(frame["target"], errors="coerce")
-    mask = y.notna()
-    return X.loc[mask], y.loc[mask]
+def _build_design_matrix(train: pd.DataFrame, feature_cols: List[str]) -> _DesignMatrix:
+    X = train.reindex(columns=feature_cols).apply(pd.to_numeric, errors="coerce")
+    y = pd.to_numeric(train["target"], errors="coerce").to_numpy(dtype=np.float64)
+    if "event_key" in train.columns:
+        keys = pd.to_numeric(train["event_key"], errors="coerce").to_numpy(dtype=np.float64)
+    else:
+        keys = np.full(len(train), np.nan)
+    mask = ~np.isnan(y) & ~np.isnan(keys)
+    event_keys = keys[mask].astype(np.int64)
+    order = np.argsort(event_keys, kind="stable")
+    return _DesignMatrix(
+        X=np.ascontiguousarray(X.to_numpy(dtype=np.float32)[mask][order]),
+        y=np.ascontiguousarray(y[mask][order]),
+        event_keys=event_keys[order],
+    )
+
+
+def _prefix_medians(X: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    ends = np.asarray(ends, dtype=np.int64)
+    medians = np.zeros((len(ends), X.shape[1]), dtype=np.float32)
+    for j in range(X.shape[1]):
+        col = X[:, j]
+        valid = np.count_nonzero(~np.isnan(col))
+        if valid == 0:
+            continue
+        order = np.argsort(col, kind="stable")[:valid]
+        sorted_vals = col[order]
+        member = order[None, :] < ends[:, None]
+        cumulative = np.cumsum(member, axis=1, dtype=np.int32)
+        counts = cumulative[:, -1]
+        lower = (cumulative <= ((counts - 1) // 2)[:, None]).sum(axis=1)
+        upper = (cumulative <= (counts // 2)[:, None]).sum(axis=1)
+        lower = np.minimum(lower, valid - 1)
+        upper = np.minimum(upper, valid - 1)
+        values = (sorted_vals[lower] + sorted_vals[upper]) / 2.0
+        medians[:, j] = np.where(counts > 0, values, 0.0)
+    return medians
+
 
+def _impute(X: np.ndarray, medians: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(X), medians, X)
 
-def _mean_absolute_error(y_true: pd.Series, y_pred: object) -> float:
-    pred = pd.Series(y_pred, index=y_true.index)
-    return float((y_true - pred).abs().mean())
 
+def _mean_absolute_error(y_true: np.ndarray, y_pred: object) -> float:
+    return float(np.mean(np.abs(y_true - np.asarray(y_pred, dtype=np.float64))))
 
-def _walk_forward_folds(train: pd.DataFrame) -> list[tuple[set[int], int]]:
+
+def _walk_forward_folds(train: pd.DataFrame, matrix: _DesignMatrix) -> list[tuple[int, int, int]]:
     if "event_key" not in train.columns:
         return []
     keys = pd.to_numeric(train["event_key"], errors="coerce").dropna().astype(int).unique()
-    ordered_keys = sorted(int(k) for k in keys)
+    ordered_keys = np.sort(keys.astype(np.int64))
     if len(ordered_keys) < 4:
         return []
     min_train_events = max(3, len(ordered_keys) // 3)
-    folds: list[tuple[set[int], int]] = []
+    starts = np.searchsorted(matrix.event_keys, ordered_keys, side="left")
+    ends = np.searchsorted(matrix.event_keys, ordered_keys, side="right")
+    folds: list[tuple[int, int, int]] = []
     for idx in range(min_train_events, len(ordered_keys)):
-        folds.append((set(ordered_keys[:idx]), ordered_keys[idx]))
+        folds.append((int(starts[idx - 1]), int(starts[idx]), int(ends[idx])))
     return folds
 
 
-def _evaluate_candidate(
-    train: pd.DataFrame,
-    feature_cols: List[str],
-    build_model: Callable[[], object],
-    folds: list[tuple[set[int], int]],
-) -> Optional[float]:
-    event_key = pd.to_numeric(train["event_key"], errors="coerce")
+def _fold_medians(matrix: _DesignMatrix, folds: list[tuple[int, int, int]]) -> np.ndarray:
+    ends = np.array([[val_start, inner_start] for inner_start, val_start, _ in folds])
+    medians = _prefix_medians(matrix.X, ends.ravel())
+    return medians.reshape(len(folds), 2, matrix.X.shape[1])
+
+
+def _supports_validation_set(factory: Callable[..., object]) -> bool:
+    try:
+        return "X_val" in inspect.signature(factory.fit).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _supports_early_stopping(candidate: _Candidate) -> bool:
+    if candidate.factory is XGBRegressor:
+        return True
+    return candidate.factory is HistGradientBoostingRegressor and _supports_validation_set(
+        candidate.factory
+    )
+
+
+def _fit_early_stopped(
+    candidate: _Candidate,
+    overrides: Dict[str, object],
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_stop: np.ndarray,
+    y_stop: np.ndarray,
+) -> tuple[object, int]:
+    if candidate.factory is XGBRegressor:
+        model = candidate.build(**overrides, early_stopping_rounds=EARLY_STOPPING_ROUNDS)
+        model.fit(X_train, y_train, eval_set=[(X_stop, y_stop)], verbose=False)
+        return model, int(model.best_iteration) + 1
+    model = candidate.build(
+        **overrides,
+        early_stopping=True,
+        n_iter_no_change=EARLY_STOPPING_ROUNDS,
+    )
+    model.fit(X_train, y_train, X_val=X_stop, y_val=y_stop)
+    return model, int(model.n_iter_)
+
+
+def _supports_warm_start(candidate: _Candidate) -> bool:
+    # HistGradientBoosting rebins on every fit while warm-started trees keep thresholds from the
+    # previous binning, so its fold-to-fold continuation is wrong: it is refitted per fold instead.
+    return candidate.factory in (Ridge, XGBRegressor)
+
+
+def _warm_start_target(budget: int, train_rows: int, final_rows: int) -> int:
+    return max(MIN_BOOSTING_ITERATIONS, math.ceil(budget * train_rows / max(final_rows, 1)))
+
+
+def _evaluate_incremental(
+    matrix: _DesignMatrix,
+    candidate: _Candidate,
+    folds: list[tuple[int, int, int]],
+    fold_medians: np.ndarray,
+    overrides: Dict[str, object],
+) -> Optional[_Evaluation]:
     scores: list[float] = []
-    for train_keys, val_key in folds:
-        train_df = train.loc[event_key.isin(train_keys)]
-        val_df = train.loc[event_key == val_key]
-        if train_df.empty or val_df.empty:
+    ridge_stats: Optional[_RidgeStatistics] = None
+    model: Optional[object] = None
+    fitted_iterations = 0
+    final_rows = max(val_start for _, val_start, _ in folds)
+    oof = np.full(len(matrix.y), np.nan)
+    seen = 0
+    for (_, val_start, val_end), (medians, _) in zip(folds, fold_medians):
+        if val_start == 0 or val_end == val_start:
             continue
-        X_train, y_train = _prepare_training_xy(train_df, feature_cols)
-        X_val, y_val = _prepare_training_xy(val_df, feature_cols)
-        if X_train.empty or X_val.empty:
+        X_val = matrix.X[val_start:val_end]
+        X_val = _impute(X_val, _prefix_medians(X_val, [len(X_val)])[0])
+        try:
+            if candidate.factory is Ridge:
+                if ridge_stats is None:
+                    ridge_stats = _RidgeStatistics(matrix.X.shape[1])
+                ridge_stats.update(matrix.X[seen:val_start], matrix.y[seen:val_start])
+                alpha = float({**candidate.params, **overrides}.get("alpha", 1.0))
+                coef, intercept = ridge_stats.solve(medians, alpha)
+                preds = X_val.astype(np.float64) @ coef + intercept
+            else:
+                X_train = _impute(matrix.X[:val_start], medians)
+                y_train = matrix.y[:val_start]
+                budget = int({**candidate.params, **overrides}[candidate.iter_param])
+                target = _warm_start_target(budget, val_start, final_rows)
+                if model is None:
+                    model = candidate.build(**{**overrides, candidate.iter_param: target})
+                    model.fit(X_train, y_train)
+                    fitted_iterations = target
+                else:
+                    increment = max(MIN_WARM_START_ITERATIONS, target - fitted_iterations)
+                    previous = model.get_booster()
+                    model = candidate.build(**{**overrides, candidate.iter_param: increment})
+                    model.fit(X_train, y_train, xgb_model=previous)
+                    fitted_iterations += increment
+                preds = model.predict(X_val)
+        except Exception:
+            return None
+        seen = val_start
+        oof[val_start:val_end] = preds
+        scores.append(_mean_absolute_error(matrix.y[val_start:val_end], preds))
+    if not scores:
+        return None
+    return _Evaluation(candidate=candidate, score=float(sum(scores) / len(scores)), oof=oof)
+
+
+def _evaluate_candidate(
+    matrix: _DesignMatrix,
+    candidate: _Candidate,
+    folds: list[tuple[int, int, int]],
+    fold_medians: np.ndarray,
+    overrides: Optional[Dict[str, object]] = None,
+    early_stopping: bool = False,
+    incremental: bool = False,
+) -> Optional[_Evaluation]:
+    overrides = overrides or {}
+    if incremental and _supports_warm_start(candidate):
+        return _evaluate_incremental(matrix, candidate, folds, fold_medians, overrides)
+    early_stopping = early_stopping and _supports_early_stopping(candidate)
+    scores: list[float] = []
+    iterations: list[int] = []
+    oof = np.full(len(matrix.y), np.nan)
+    for (inner_start, val_start, val_end), (medians, inner_medians) in zip(folds, fold_medians):
+        if val_start == 0 or val_end == val_start:
             continue
-        model = build_model()
+        X_val = matrix.X[val_start:val_end]
+        X_val = _impute(X_val, _prefix_medians(X_val, [len(X_val)])[0])
         try:
-            model.fit(X_train, y_train)
+            if early_stopping and 0 < inner_start < val_start:
+                model, used = _fit_early_stopped(
+                    candidate,
+                    overrides,
+                    _impute(matrix.X[:inner_start], inner_medians),
+                    matrix.y[:inner_start],
+                    _impute(matrix.X[inner_start:val_start], inner_medians),
+                    matrix.y[inner_start:val_start],
+                )
+                iterations.append(used)
+            else:
+                model = candidate.build(**overrides)
+                model.fit(_impute(matrix.X[:val_start], medians), matrix.y[:val_start])
             preds = model.predict(X_val)
         except Exception:
             return None
-        scores.append(_mean_absolute_error(y_val, preds))
+        oof[val_start:val_end] = preds
+        scores.append(_mean_absolute_error(matrix.y[val_start:val_end], preds))
     if not scores:
         return None
-    return float(sum(scores) / len(scores))
+    return _Evaluation(
+        candidate=candidate,
+        score=float(sum(scores) / len(scores)),
+        iterations=iterations,
+        oof=oof,
+    )
+
+
+def _select_full(
+    matrix: _DesignMatrix,
+    candidates: list[_Candidate],
+    folds: list[tuple[int, int, int]],
+    fold_medians: np.ndarray,
+    incremental: bool = False,
+) -> tuple[list[_Evaluation], list[_Pruned]]:
+    evaluations: list[_Evaluation] = []
+    for candidate in candidates:
+        evaluation = _evaluate_candidate(
+            matrix,
+            candidate,
+            folds,
+            fold_medians,
+            incremental=incremental,
+        )
+        if evaluation is not None:
+            evaluations.append(evaluation)
+    evaluations.sort(key=lambda e: e.score)
+    return evaluations, []
+
+
+def _select_halving(
+    matrix: _DesignMatrix,
+    candidates: list[_Candidate],
+    folds: list[tuple[int, int, int]],
+    fold_medians: np.ndarray,
+    incremental: bool = False,
+) -> tuple[list[_Evaluation], list[_Pruned]]:
+    # Only iterative candidates are budgeted and pruned; non-iterative ones (ridge) are cheap
+    # and join at the last rung, on every fold, without going through elimination.
+    survivors = [candidate for candidate in candidates if candidate.iter_param]
+    fixed_cost = [candidate for candidate in candidates if not candidate.iter_param]
+    pruned: list[_Pruned] = []
+    n_rungs = math.ceil(math.log2(len(survivors))) + 1 if len(survivors) > 1 else 1
+    for rung in range(n_rungs):
+        last_rung = rung == n_rungs - 1
+        fraction = float(HALVING_ETA) ** (rung - (n_rungs - 1))
+        n_folds = max(1, math.ceil(len(folds) * fraction))
+        rung_folds = folds[-n_folds:]
+        rung_medians = fold_medians[-n_folds:]
+        evaluations: list[_Evaluation] = []
+        rung_overrides: Dict[str, Dict[str, object]] = {}
+        for candidate in survivors + (fixed_cost if last_rung else []):
+            overrides: Dict[str, object] = {}
+            if candidate.iter_param and not last_rung:
+                full_budget = int(candidate.params[candidate.iter_param])
+                overrides[candidate.iter_param] = max(
+                    MIN_BOOSTING_ITERATIONS,
+                    int(full_budget * fraction),
+                )
+            rung_overrides[candidate.name] = overrides
+            evaluation = _evaluate_candidate(
+                matrix,
+                candidate,
+                rung_folds,
+                rung_medians,
+                overrides=overrides,
+                early_stopping=True,
+                incremental=incremental,
+            )
+            if evaluation is not None:
+                evaluations.append(evaluation)
+        evaluations.sort(key=lambda e: e.score)
+        if last_rung:
+            return evaluations, pruned
+        keep = max(1, math.ceil(len(evaluations) / 2))
+        pruned.extend(
+            _Pruned(evaluation, rung, n_folds, rung_overrides[evaluation.candidate.name])
+            for evaluation in evaluations[keep:]
+        )
+        survivors = [evaluation.candidate for evaluation in evaluations[:keep]]
+    return [], pruned
+
+
+def _fit_blend(P: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, float]:
+    blender = LinearRegression(positive=True)
+    blender.fit(P, y)
+    return blender.coef_, float(blender.intercept_)
+
+
+def _blend_evaluations(
+    matrix: _DesignMatrix,
+    evaluations: list[_Evaluation],
+    folds: list[tuple[int, int, int]],
+) -> Optional[tuple[float, float, np.ndarray, float]]:
+    _load_estimators()
+    if LinearRegression is None or len(evaluations) < 2:
+        return None
+    P = np.column_stack([e.oof for e in evaluations])
+    scored = [
+        (val_start, val_end)
+        for _, val_start, val_end in folds
+        if val_end > val_start and not np.isnan(P[val_start:val_end]).any()
+    ]
+    if len(scored) <= MIN_BLEND_FOLDS:
+        return None
+    blend_scores: list[float] = []
+    single_scores: list[float] = []
+    for idx in range(MIN_BLEND_FOLDS, len(scored)):
+        rows = np.concatenate([np.arange(start, end) for start, end in scored[:idx]])
+        weights, intercept = _fit_blend(P[rows], matrix.y[rows])
+        val_start, val_end = scored[idx]
+        y_val = matrix.y[val_start:val_end]
+        blend_scores.append(_mean_absolute_error(y_val, P[val_start:val_end] @ weights + intercept))
+        single_scores.append(_mean_absolute_error(y_val, P[val_start:val_end, 0]))
+    rows = np.concatenate([np.arange(start, end) for start, end in scored])
+    weights, intercept = _fit_blend(P[rows], matrix.y[rows])
+    return float(np.mean(blend_scores)), float(np.mean(single_scores)), weights, intercept
+
+
+def _walk_forward_residuals(y: np.ndarray, oof: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    if oof is None:
+        return None
+    scored = ~np.isnan(oof)
+    if not scored.any():
+        return None
+    return (y[scored] - oof[scored]).astype(np.float32)
+
 
+def _final_overrides(evaluation: _Evaluation) -> Dict[str, object]:
+    candidate = evaluation.candidate
+    if not candidate.iter_param or not evaluation.iterations:
+        return {}
+    iterations = int(np.median(evaluation.iterations))
+    return {candidate.iter_param: max(MIN_BOOSTING_ITERATIONS, iterations)}
 
-def train_model(train: pd.DataFrame, feature_cols: List[str]) -> TrainingResult:
+
+def train_model(
+    train: pd.DataFrame,
+    feature_cols: List[str],
+    registry: Optional[ModelRegistry] = None,
+    selection: str = "full",
+    incremental: bool = False,
+    ensemble: bool = False,
+) -> TrainingResult:
+    if selection not in SELECTION_STRATEGIES:
+        raise ValueError(f"Unsupported selection strategy: {selection}")
     notes: List[str] = []
     if train.empty:
         notes.append("Pas assez de data historique: fallback heuristique.")
@@ -136,39 +556,133 @@ def train_model(train: pd.DataFrame, feature_cols: List[str]) -> TrainingResult:
         notes.append("Aucun modele ML disponible (installer scikit-learn ou xgboost).")
         return TrainingResult(model=None, model_name="heuristic", notes=notes)
 
-    best_name: Optional[str] = None
-    best_builder: Optional[Callable[[], object]] = None
-    folds = _walk_forward_folds(train)
+    registry_key: Optional[str] = None
+    if registry is not None:
+        registry_key = training_fingerprint(
+            train,
+            feature_cols,
+            [
+                (candidate.name, candidate.params, _library_version(candidate.factory))
+                for candidate in candidates
+            ] + [("selection", selection), ("incremental", incremental), ("ensemble", ensemble)],
+        )
+        cached = registry.load(registry_key)
+        if cached is not None:
+            cached.notes = [f"Modele charge depuis le registre ({registry_key[:12]})."] + cached.notes
+            return cached
+
+    best: Optional[_Candidate] = None
+    best_overrides: Dict[str, object] = {}
+    members: list[tuple[_Candidate, Dict[str, object], float]] = []
+    intercept = 0.0
+    leaderboard: List[Tuple[str, float]] = []
+    residuals: Optional[np.ndarray] = None
+    matrix = _build_design_matrix(train, feature_cols)
+    folds = _walk_forward_folds(train, matrix)
     if folds:
-        scores: list[tuple[float, str, Callable[[], object]]] = []
-        for name, builder in candidates:
-            score = _evaluate_candidate(train, feature_cols, builder, folds)
-            if score is None:
-                continue
-            scores.append((score, name, builder))
-        if scores:
-            scores.sort(key=lambda x: x[0])
-            leaderboard = ", ".join(f"{name}={score:.3f}" for score, name, _ in scores)
-            notes.append(f"Model selection (MAE walk-forward): {leaderboard}.")
-            best_score, best_name, best_builder = scores[0]
-            notes.append(f"Modele retenu: {best_name} (MAE={best_score:.3f}).")
+        fold_medians = _fold_medians(matrix, folds)
+        if selection == "halving":
+            evaluations, pruned = _select_halving(
+                matrix, candidates, folds, fold_medians, incremental=incremental
+            )
+        else:
+            evaluations, pruned = _select_full(
+                matrix, candidates, folds, fold_medians, incremental=incremental
+            )
+        if evaluations:
+            leaderboard = [(e.candidate.name, e.score) for e in evaluations]
+            summary = ", ".join(f"{name}={score:.3f}" for name, score in leaderboard)
+            label = "successive halving, MAE walk-forward" if selection == "halving" else "MAE walk-forward"
+            if incremental:
+                label += ", folds incrementaux"
+            notes.append(f"Model selection ({label}): {summary}.")
+            if pruned:
+                # Rung scores use fewer folds and a smaller budget: not comparable with the leaderboard.
+                eliminated = "; ".join(
+                    f"{p.evaluation.candidate.name}={p.evaluation.score:.3f} (rung {p.rung + 1}, "
+                    f"{p.n_folds}/{len(folds)} folds"
+                    + "".join(f", {k}={v}" for k, v in p.overrides.items())
+                    + ")"
+                    for p in pruned
+                )
+                notes.append(f"Elimines en cours de halving (scores non comparables): {eliminated}.")
+            best_evaluation = evaluations[0]
+            best = best_evaluation.candidate
+            best_overrides = _final_overrides(best_evaluation)
+            residuals = _walk_forward_residuals(matrix.y, best_evaluation.oof)
+            retained = f"Modele retenu: {best.name} (MAE={best_evaluation.score:.3f})."
+            if best_overrides:
+                iterations = ", ".join(f"{k}={v}" for k, v in best_overrides.items())
+                notes.append(f"Early stopping walk-forward: {iterations}.")
+            if ensemble:
+                blend = _blend_evaluations(matrix, evaluations, folds)
+                if blend is None:
+                    notes.append("Ensemble OOF indisponible (pas assez de folds communs).")
+                else:
+                    blend_score, single_score, weights, blend_intercept = blend
+                    mix = ", ".join(
+                        f"{e.candidate.name}={w:.2f}" for e, w in zip(evaluations, weights) if w > 0
+                    )
+                    notes.append(
+                        f"Ensemble OOF (stacking positif): MAE={blend_score:.3f} "
+                        f"vs {best.name}={single_score:.3f} sur les memes folds; poids {mix}."
+                    )
+                    if blend_score < single_score and np.count_nonzero(weights > 0) > 1:
+                        members = [
+                            (e.candidate, _final_overrides(e), float(w))
+                            for e, w in zip(evaluations, weights)
+                            if w > 0
+                        ]
+                        intercept = blend_intercept
+                        blended = np.column_stack([e.oof for e in evaluations]) @ weights + intercept
+                        residuals = _walk_forward_residuals(matrix.y, blended)
+                        retained = "Modele retenu: ensemble OOF (" + "+".join(c.name for c, _, _ in members) + ")."
+            notes.append(retained)
     else:
         notes.append("Historique insuffisant pour validation walk-forward, selection par priorite.")
 
-    if best_builder is None:
-        best_name, best_builder = candidates[0]
-        notes.append(f"Modele retenu par defaut: {best_name}.")
+    if best is None:
+        best = candidates[0]
+        notes.append(f"Modele retenu par defaut: {best.name}.")
 
-    X_train, y_train = _prepare_training_xy(train, feature_cols)
-    if X_train.empty:
+    preprocessor = FeaturePreprocessor.fit(train, feature_cols)
+    y_all = pd.to_numeric(train["target"], errors="coerce").to_numpy(dtype=np.float64)
+    labelled = ~np.isnan(y_all)
+    X_train = preprocessor.transform(train)[labelled]
+    y_train = y_all[labelled]
+    if len(X_train) == 0:
         notes.append("Features d'entrainement vides: fallback heuristique.")
         return TrainingResult(model=None, model_name="heuristic", notes=notes)
 
-    model = best_builder()
-    try:
-        model.fit(X_train, y_train)
-    except Exception as exc:
-        notes.append(f"Echec entrainement {best_name}: {exc}. Fallback heuristique.")
-        return TrainingResult(model=None, model_name="heuristic", notes=notes)
+    if not members:
+        members = [(best, best_overrides, 1.0)]
+    fitted: list[object] = []
+    for candidate, overrides, _ in members:
+        model = candidate.build(**overrides)
+        try:
+            model.fit(X_train, y_train)
+        except Exception as exc:
+            notes.append(f"Echec entrainement {candidate.name}: {exc}. Fallback heuristique.")
+            return TrainingResult(model=None, model_name="heuristic", notes=notes)
+        fitted.append(model)
+
+    if len(fitted) > 1:
+        model = StackedEnsemble(fitted, np.array([w for _, _, w in members]), intercept)
+        model_name = "ensemble(" + "+".join(candidate.name for candidate, _, _ in members) + ")"
+    else:
+        model = fitted[0]
+        model_name = best.name
 
-    return TrainingResult(model=model, model_name=best_name, notes=notes)
+    result = TrainingResult(
+        model=model,
+        model_name=model_name,
+        notes=notes,
+        feature_cols=list(feature_cols),
+        medians=preprocessor.median_map,
+        leaderboard=leaderboard,
+        residuals=residuals,
+        preprocessor=preprocessor,
+    )
+    if registry is not None and registry_key is not None:
+        registry.save(registry_key, result)
+    return result
@@ -2,10 +2,41 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from collections import OrderedDict
+from typing import Hashable, Iterable, Optional
 
 import pandas as pd
 
+SIMULATION_COLUMNS = ["p_pole", "p_top3", "p_top10", "expected_position"]
+
+
+# Same code as mrp.utils.LRUCache (Football Match Result Prediction): the projects
+# ship separately and share no package, so keep the two copies in sync.
+class LRUCache:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: object) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 def first_available(df: pd.DataFrame, columns: Iterable[str]) -> Optional[str]:
     for col in columns:
@@ -44,4 +75,6 @@ def format_prediction_table(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
         return df
     df = df.copy().sort_values("pred", ascending=True).head(top_n)
     df["rank"] = range(1, len(df) + 1)
-    return df[["rank", "driver_name", "pred"]]
+    columns = ["rank", "driver_name", "pred"]
+    columns += [c for c in SIMULATION_COLUMNS if c in df.columns]
+    return df[columns]
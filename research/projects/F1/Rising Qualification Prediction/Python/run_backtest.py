@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Season backtest: replay rounds as if live and score the predictions."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from datetime import datetime, timezone
+
+from rqp.config import parse_rounds
+
+
+def parse_years(value: str) -> list[int]:
+    return sorted({int(item.strip()) for item in value.split(",") if item.strip()})
+
+
+def json_number(value: object) -> object:
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rising Qualification Prediction backtest (MAE, top-10 hit rate, Spearman)"
+    )
+    parser.add_argument("--mode", choices=["qualifying", "race"], required=True)
+    parser.add_argument("--source", choices=["fastf1", "openf1"], required=True)
+    parser.add_argument("--seasons", required=True, help="Saisons rejouees (ex: 2023,2024,2025)")
+    parser.add_argument(
+        "--train-seasons",
+        default="auto",
+        help="Saisons d'entrainement (defaut: 2 saisons precedentes + saison rejouee)",
+    )
+    parser.add_argument("--rounds", default=None, help="Rounds rejoues (ex: 1-10)")
+    parser.add_argument("--retrain-every", type=int, default=1)
+    parser.add_argument("--include-standings", action="store_true")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--model-dir", default=None)
+    parser.add_argument("--selection", choices=["full", "halving"], default="full")
+    parser.add_argument("--incremental-folds", action="store_true")
+    parser.add_argument("--ensemble", action="store_true")
+    parser.add_argument("--output-format", choices=["text", "json"], default="text")
+    parser.add_argument("--output-path", default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    from rqp.backtest import BacktestConfig, run_backtest
+
+    train_seasons = None
+    if args.train_seasons.lower() not in {"auto", "default"}:
+        train_seasons = parse_years(args.train_seasons)
+    config = BacktestConfig(
+        source=args.source,
+        mode=args.mode,
+        seasons=parse_years(args.seasons),
+        train_seasons=train_seasons,
+        include_standings=args.include_standings,
+        cache_dir=args.cache_dir,
+        rounds=parse_rounds(args.rounds) if args.rounds else None,
+        retrain_every=args.retrain_every,
+        model_dir=args.model_dir,
+        selection=args.selection,
+        incremental=args.incremental_folds,
+        ensemble=args.ensemble,
+    )
+    result = run_backtest(config)
+
+    payload = {
+        "sport": "F1",
+        "project": "Rising Qualification Prediction",
+        "config": {
+            "source": config.source,
+            "mode": config.mode,
+            "seasons": config.seasons,
+            "train_seasons": config.train_seasons,
+            "rounds": config.rounds,
+            "retrain_every": config.retrain_every,
+            "include_standings": config.include_standings,
+            "selection": config.selection,
+            "incremental": config.incremental,
+            "ensemble": config.ensemble,
+        },
+        "overall": {key: json_number(value) for key, value in result.overall.items()},
+        "rounds": [
+            {key: json_number(value) for key, value in row.items()}
+            for row in result.rounds.to_dict(orient="records")
+        ],
+        "notes": result.notes,
+        "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
+
+    if args.output_path:
+        with open(args.output_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    if args.quiet:
+        return
+
+    if args.output_format == "json":
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        return
+
+    print("=" * 72)
+    print(
+        f"Backtest | Mode: {config.mode} | Source: {config.source} | "
+        f"Seasons: {', '.join(str(y) for y in config.seasons)} | Retrain every: {config.retrain_every}"
+    )
+    print("=" * 72)
+    if result.rounds.empty:
+        print("Aucun round evalue.")
+    else:
+        print(result.rounds.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    overall = result.overall
+    print("-" * 72)
+    print(
+        f"Overall: rounds={overall['rounds']} trainings={overall['trainings']} "
+        f"MAE={overall['mae']:.3f} top10={overall['top10_hit_rate']:.3f} "
+        f"spearman={overall['spearman']:.3f}"
+    )
+    if result.notes:
+        print("\nNotes:")
+        for note in result.notes:
+            print(f"- {note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Championship projection: simulate the remaining races of a season."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timezone
+
+from rqp.config import parse_train_seasons
+from rqp.constants import DEFAULT_SIMULATIONS, FORM_WINDOW
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rising Qualification Prediction championship projection (Monte Carlo)"
+    )
+    parser.add_argument("--source", choices=["fastf1", "openf1"], required=True)
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument(
+        "--from-round",
+        type=int,
+        required=True,
+        help="Premier round non couru (les rounds precedents sont acquis)",
+    )
+    parser.add_argument("--train-seasons", default="auto")
+    parser.add_argument("--simulations", type=int, default=DEFAULT_SIMULATIONS)
+    parser.add_argument("--form-window", type=int, default=FORM_WINDOW)
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--model-dir", default=None)
+    parser.add_argument("--selection", choices=["full", "halving"], default="full")
+    parser.add_argument("--incremental-folds", action="store_true")
+    parser.add_argument("--ensemble", action="store_true")
+    parser.add_argument("--output-format", choices=["text", "json"], default="text")
+    parser.add_argument("--output-path", default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    from rqp.championship import ChampionshipConfig, run_championship
+
+    config = ChampionshipConfig(
+        source=args.source,
+        year=args.year,
+        from_round=args.from_round,
+        train_seasons=parse_train_seasons(args.train_seasons, args.year),
+        cache_dir=args.cache_dir,
+        simulations=max(1, args.simulations),
+        form_window=max(1, args.form_window),
+        model_dir=args.model_dir,
+        selection=args.selection,
+        incremental=args.incremental_folds,
+        ensemble=args.ensemble,
+    )
+    result = run_championship(config)
+
+    payload = {
+        "sport": "F1",
+        "project": "Rising Qualification Prediction",
+        "config": {
+            "source": config.source,
+            "year": config.year,
+            "from_round": config.from_round,
+            "train_seasons": config.train_seasons,
+            "simulations": config.simulations,
+            "form_window": config.form_window,
+        },
+        "remaining_rounds": result.remaining_rounds,
+        "rows": json.loads(result.table.to_json(orient="records")) if not result.table.empty else [],
+        "positions": json.loads(result.positions.to_json(orient="records")) if not result.positions.empty else [],
+        "notes": result.notes,
+        "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
+
+    if args.output_path:
+        with open(args.output_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    if args.quiet:
+        return
+
+    if args.output_format == "json":
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        return
+
+    print("=" * 72)
+    print(
+        f"Championship | Source: {config.source} | Year: {config.year} | "
+        f"From round: {config.from_round} | Remaining: {len(result.remaining_rounds)}"
+    )
+    print("=" * 72)
+    if result.table.empty:
+        print("Aucune projection disponible.")
+    else:
+        columns = ["rank", "driver_name", "current_points", "expected_points", "p_title", "p_top3", "expected_position"]
+        print(result.table[columns].to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    if result.notes:
+        print("\nNotes:")
+        for note in result.notes:
+            print(f"- {note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,6 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
-from rqp.pipeline import PipelineConfig, run_pipeline
-
 
 def parse_csv_list(value: str) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
@@ -41,6 +39,8 @@ def main() -> None:
     parser.add_argument("--quiet", action="store_true")
     args = parser.parse_args()
 
+    from rqp.pipeline import PipelineConfig, run_pipeline
+
     config = PipelineConfig(
         sources=parse_csv_list(args.sources),
         years=parse_years(args.years),
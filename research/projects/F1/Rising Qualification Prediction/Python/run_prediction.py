@@ -5,29 +5,64 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import asdict
-from datetime import datetime, timezone
+from dataclasses import replace
 
-from rqp import PredictionConfig, run_prediction
+from rqp.config import PredictionConfig, parse_rounds, parse_train_seasons
+from rqp.constants import DEFAULT_SIMULATIONS
 
 
-def parse_train_seasons(value: str, target_year: int) -> list[int]:
-    if value.lower() in {"auto", "default"}:
-        return [target_year - 2, target_year - 1, target_year]
-    return [int(x.strip()) for x in value.split(",") if x.strip()]
+def print_result(config: PredictionConfig, result) -> None:
+    print("=" * 72)
+    print(
+        f"Mode: {config.mode} | Source: {config.source} | Year: {config.year} | Round: {config.round_number}"
+    )
+    print(f"Model version: {result.version}")
+    print("=" * 72)
+    if result.table.empty:
+        print("Aucune prediction disponible.")
+    else:
+        print(result.table.to_string(index=False))
+    if result.notes:
+        print("\nNotes:")
+        for note in result.notes:
+            print(f"- {note}")
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Rising Qualification Prediction (FastF1 / OpenF1)"
     )
-    parser.add_argument("--mode", choices=["qualifying", "race"], required=True)
+    parser.add_argument("--mode", choices=["qualifying", "race"], default=None)
+    parser.add_argument(
+        "--modes",
+        default=None,
+        help="Liste de modes pour un batch (ex: qualifying,race)",
+    )
     parser.add_argument("--source", choices=["fastf1", "openf1"], required=True)
     parser.add_argument("--year", type=int, required=True)
-    parser.add_argument("--round", dest="round_number", type=int, required=True)
+    parser.add_argument("--round", dest="round_number", type=int, default=None)
+    parser.add_argument(
+        "--rounds",
+        default=None,
+        help="Rounds pour un batch (ex: 1-10,12 ou all)",
+    )
     parser.add_argument("--train-seasons", default="auto")
     parser.add_argument("--include-standings", action="store_true")
     parser.add_argument("--cache-dir", default=None)
+    parser.add_argument(
+        "--model-dir",
+        default=None,
+        help="Registre des modeles entraines (defaut: <cache-dir>/models)",
+    )
+    parser.add_argument("--selection", choices=["full", "halving"], default="full")
+    parser.add_argument("--incremental-folds", action="store_true")
+    parser.add_argument("--ensemble", action="store_true")
+    parser.add_argument(
+        "--simulations",
+        type=int,
+        default=DEFAULT_SIMULATIONS,
+        help="Sessions Monte Carlo pour P(pole)/P(top 3)/P(top 10) (0 = desactive)",
+    )
     parser.add_argument("--meeting-name", default=None)
     parser.add_argument("--country-name", default=None)
     parser.add_argument("--output-format", choices=["text", "json"], default="text")
@@ -36,58 +71,76 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    from rqp.prediction import build_provider, prediction_payload, run_prediction, run_prediction_batch
+
+    batch = bool(args.rounds or args.modes)
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()] if args.modes else [args.mode]
+    if not modes or modes[0] is None:
+        parser.error("--mode ou --modes est requis")
+    for mode in modes:
+        if mode not in {"qualifying", "race"}:
+            parser.error(f"mode invalide: {mode}")
+    if not args.rounds and args.round_number is None:
+        parser.error("--round ou --rounds est requis")
+
     config = PredictionConfig(
         source=args.source,
-        mode=args.mode,
+        mode=modes[0],
         year=args.year,
-        round_number=args.round_number,
+        round_number=args.round_number or 1,
         train_seasons=parse_train_seasons(args.train_seasons, args.year),
         include_standings=args.include_standings,
         cache_dir=args.cache_dir,
         meeting_name=args.meeting_name,
         country_name=args.country_name,
+        model_dir=args.model_dir,
+        selection=args.selection,
+        incremental=args.incremental_folds,
+        ensemble=args.ensemble,
+        simulations=max(0, args.simulations),
     )
 
-    result = run_prediction(config)
+    if not batch:
+        result = run_prediction(config)
+        if args.output_format == "json":
+            payload = prediction_payload(config, result)
+            if args.output_path:
+                with open(args.output_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False, indent=2)
+            if not args.quiet:
+                print(json.dumps(payload, ensure_ascii=False, indent=2))
+            return
+        if not args.quiet:
+            print_result(config, result)
+        return
+
+    if args.rounds and args.rounds.strip().lower() == "all":
+        rounds = sorted(int(r["round_number"]) for r in build_provider(config).list_rounds(args.year))
+    elif args.rounds:
+        rounds = parse_rounds(args.rounds)
+    else:
+        rounds = [args.round_number]
+    configs = [
+        replace(config, mode=mode, round_number=round_number)
+        for mode in modes
+        for round_number in rounds
+    ]
+    results = run_prediction_batch(configs)
 
     if args.output_format == "json":
-        if result.table.empty:
-            rows = []
-        else:
-            rows = json.loads(result.table.to_json(orient="records"))
-        payload = {
-            "version": result.version,
-            "sport": "F1",
-            "project": "Rising Qualification Prediction",
-            "config": asdict(config),
-            "rows": rows,
-            "notes": result.notes,
-            "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        }
+        payloads = [prediction_payload(c, r) for c, r in zip(configs, results)]
         if args.output_path:
             with open(args.output_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
+                json.dump(payloads, f, ensure_ascii=False, indent=2)
         if not args.quiet:
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print(json.dumps(payloads, ensure_ascii=False, indent=2))
         return
 
     if args.quiet:
         return
-
-    print("=" * 72)
-    print(
-        f"Mode: {config.mode} | Source: {config.source} | Year: {config.year} | Round: {config.round_number}"
-    )
-    print(f"Model version: {result.version}")
-    print("=" * 72)
-    if result.table.empty:
-        print("Aucune prediction disponible.")
-    else:
-        print(result.table.to_string(index=False))
-    if result.notes:
-        print("\nNotes:")
-        for note in result.notes:
-            print(f"- {note}")
+    for batch_config, result in zip(configs, results):
+        print_result(batch_config, result)
+        print()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Resident prediction service (HTTP or Unix socket JSON API)."""
+
+from __future__ import annotations
+
+import argparse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rising Qualification Prediction service (warm providers, caches and models)"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", dest="socket_path", default=None)
+    parser.add_argument("--max-providers", type=int, default=4)
+    parser.add_argument("--max-training-frames", type=int, default=16)
+    parser.add_argument("--max-models", type=int, default=16)
+    parser.add_argument("--max-fetches", type=int, default=2048)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    from rqp.service import PredictionService, serve
+
+    service = PredictionService(
+        max_providers=args.max_providers,
+        max_training_frames=args.max_training_frames,
+        max_models=args.max_models,
+        max_fetches=args.max_fetches,
+    )
+    if not args.quiet:
+        target = args.socket_path or f"http://{args.host}:{args.port}"
+        print(f"Prediction service listening on {target}")
+    serve(
+        service,
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket_path,
+        quiet=args.quiet,
+    )
+
+
+if __name__ == "__main__":
+    main()
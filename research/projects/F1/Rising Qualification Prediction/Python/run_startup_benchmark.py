@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Startup benchmark: wall time and heavy modules loaded by common entry points."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HEAVY_MODULES = ["numpy", "pandas", "requests", "fastf1", "sklearn", "xgboost"]
+
+HERE = Path(__file__).resolve().parent
+
+
+def _script(name: str, *argv: str) -> str:
+    path = str(HERE / name)
+    return (
+        "import runpy, sys\n"
+        f"sys.argv = {[path, *argv]!r}\n"
+        "try:\n"
+        f"    runpy.run_path({path!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+
+
+CASES = [
+    ("import rqp", "import rqp\n"),
+    ("import rqp.config", "import rqp.config\n"),
+    ("import rqp.prediction", "import rqp.prediction\n"),
+    ("run_prediction.py --help", _script("run_prediction.py", "--help")),
+    ("run_backtest.py --help", _script("run_backtest.py", "--help")),
+    ("run_championship.py --help", _script("run_championship.py", "--help")),
+    (
+        "rqp.training candidates",
+        "from rqp.training import _candidate_models\n_candidate_models()\n",
+    ),
+]
+
+REPORT = (
+    "\nimport json as _json, sys as _sys\n"
+    f"_sys.__stderr__.write(_json.dumps([m for m in {HEAVY_MODULES!r} if m in _sys.modules]) + '\\n')\n"
+)
+
+
+def measure(code: str, repeat: int) -> tuple[list[float], list[str]]:
+    timings: list[float] = []
+    loaded: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", code + REPORT],
+            cwd=str(HERE),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+        lines = [line for line in proc.stderr.splitlines() if line.startswith("[")]
+        if lines:
+            loaded = json.loads(lines[-1])
+    return timings, loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rising Qualification Prediction startup benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output-format", choices=["text", "json"], default="text")
+    parser.add_argument("--output-path", default=None)
+    args = parser.parse_args()
+
+    baseline, _ = measure("pass\n", max(1, args.repeat))
+    results = []
+    for name, code in CASES:
+        timings, loaded = measure(code, max(1, args.repeat))
+        results.append({
+            "case": name,
+            "median_ms": round(statistics.median(timings), 1),
+            "min_ms": round(min(timings), 1),
+            "heavy_modules": loaded,
+        })
+
+    payload = {
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "interpreter_ms": round(statistics.median(baseline), 1),
+        "results": results,
+    }
+    if args.output_path:
+        with open(args.output_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+    if args.output_format == "json":
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        return
+
+    print(f"Python {payload['python']} | interpreter startup: {payload['interpreter_ms']} ms")
+    width = max(len(r["case"]) for r in results)
+    for r in results:
+        modules = ", ".join(r["heavy_modules"]) or "-"
+        print(f"{r['case']:<{width}}  {r['median_ms']:>8.1f} ms  (min {r['min_ms']:.1f})  {modules}")
+
+
+if __name__ == "__main__":
+    main()
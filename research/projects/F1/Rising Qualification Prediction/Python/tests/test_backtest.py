@@ -0,0 +1,38 @@
+from rqp import backtest, training
+from rqp.backtest import BacktestConfig, run_backtest
+from rqp.benchmarks import SyntheticProvider
+
+
+def test_each_round_is_scored_on_a_model_trained_before_it(monkeypatch):
+    candidates = training._candidate_models
+    monkeypatch.setattr(training, "_candidate_models", lambda: [c for c in candidates() if c.name == "ridge"])
+    trained_on = []
+    train_model = backtest.train_model
+
+    def recording_train_model(train, *args, **kwargs):
+        trained_on.append(train)
+        return train_model(train, *args, **kwargs)
+
+    monkeypatch.setattr(backtest, "train_model", recording_train_model)
+    config = BacktestConfig(
+        source="synthetic",
+        mode="qualifying",
+        seasons=[2024],
+        train_seasons=None,
+        include_standings=False,
+        cache_dir=None,
+        retrain_every=2,
+    )
+
+    result = run_backtest(config, SyntheticProvider([2023, 2024], rounds=5, drivers=8))
+
+    rounds = result.rounds
+    assert rounds["round_number"].tolist() == [1, 2, 3, 4, 5]
+    assert (rounds["year"] == 2024).all() and (rounds["drivers"] == 8).all()
+    assert rounds["retrained"].tolist() == [True, False, True, False, True]
+    assert result.overall["rounds"] == 5 and result.overall["trainings"] == len(trained_on) == 3
+    # A round only sees earlier rounds: 2023 in full, then 2024 up to the round before.
+    assert rounds["train_rows"].tolist() == [40, 48, 56, 64, 72]
+    for round_number, train in zip([1, 3, 5], trained_on):
+        assert train["event_key"].max() < 2024 * 100 + round_number
+        assert not ((train["event_year"] == 2024) & (train["event_round"] >= round_number)).any()
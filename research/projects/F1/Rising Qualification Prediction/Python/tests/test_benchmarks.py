@@ -0,0 +1,15 @@
+from rqp.benchmarks import CASES, compare_results
+
+
+def test_case_names_survive_the_comma_separated_cases_option():
+    names = [case.name for case in CASES]
+    assert len(set(names)) == len(names)
+    assert not [name for name in names if "," in name]
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold_and_noise():
+    def run(*timings):
+        return {"results": [{"case": case, "seasons": 5, "median_ms": ms} for case, ms in timings]}
+
+    rows = compare_results(run(("a", 100.0), ("b", 100.0), ("c", 0.2), ("d", 50.0)), run(("a", 125.0), ("b", 105.0), ("c", 0.6), ("d", 30.0)))
+    assert {row["case"]: row["status"] for row in rows} == {"a": "regression", "b": "same", "c": "same", "d": "improvement"}
@@ -0,0 +1,61 @@
+import pandas as pd
+
+from rqp.benchmarks import SyntheticProvider
+from rqp.data import NO_HISTORY_NOTE, build_training_data, slice_training_data
+
+
+class FlakyProvider(SyntheticProvider):
+    """Synthetic seasons where the FP fetch of some rounds fails."""
+
+    def __init__(self, years, failing):
+        super().__init__(years, rounds=6, drivers=8)
+        self.failing = set(failing)
+
+    def get_fp_features(self, year, round_number):
+        if (year, round_number) in self.failing:
+            raise RuntimeError("timeout")
+        return super().get_fp_features(year, round_number)
+
+
+def test_sliced_frame_equals_a_frame_built_for_the_earlier_target():
+    provider = SyntheticProvider([2024, 2025], rounds=6, drivers=8)
+    latest, notes = build_training_data(provider, "qualifying", [2024, 2025], 2025, 6, include_standings=False)
+    direct, _ = build_training_data(provider, "qualifying", [2024, 2025], 2025, 3, include_standings=False)
+
+    sliced, _ = slice_training_data(latest, notes, 2025, 3)
+
+    pd.testing.assert_frame_equal(sliced, direct)
+
+
+def test_failures_of_later_rounds_stay_with_later_targets():
+    provider = FlakyProvider([2024, 2025], failing=[(2024, 5), (2025, 2), (2025, 4)])
+    train, notes = build_training_data(provider, "qualifying", [2024, 2025], 2025, 6, include_standings=False)
+    assert len(notes) == 3
+
+    _, early = slice_training_data(train, notes, 2025, 3)
+    _, late = slice_training_data(train, notes, 2025, 6)
+
+    assert early == ["Echec FP 2024 round 5: timeout", "Echec FP 2025 round 2: timeout"]
+    assert late == notes
+
+
+def test_slice_before_any_history_reports_the_fallback_once():
+    provider = SyntheticProvider([2025], rounds=4, drivers=8)
+    train, notes = build_training_data(provider, "qualifying", [2025], 2025, 4, include_standings=False)
+
+    sliced, sliced_notes = slice_training_data(train, notes + [NO_HISTORY_NOTE], 2025, 1)
+
+    assert sliced.empty
+    assert sliced_notes == [NO_HISTORY_NOTE]
+
+
+def test_seasons_after_the_target_are_never_training_data():
+    provider = SyntheticProvider([2024, 2025], rounds=6, drivers=8)
+    latest, notes = build_training_data(provider, "qualifying", [2024, 2025], 2025, 4, include_standings=False)
+    direct, _ = build_training_data(provider, "qualifying", [2024, 2025], 2024, 3, include_standings=False)
+
+    sliced, _ = slice_training_data(latest, notes, 2024, 3)
+
+    assert (direct["event_year"] == 2024).all() and direct["event_round"].max() == 2
+    # Missing FP ranks in later rounds make the full frame store ranks as floats.
+    pd.testing.assert_frame_equal(sliced, direct, check_dtype=False)
@@ -0,0 +1,34 @@
+import dataclasses
+
+import pandas as pd
+
+from rqp import training
+from rqp.benchmarks import SyntheticProvider
+from rqp.config import PredictionConfig
+from rqp.prediction import run_prediction, run_prediction_batch
+
+
+def test_batch_targets_of_different_years_match_single_predictions(monkeypatch):
+    candidates = training._candidate_models
+    monkeypatch.setattr(training, "_candidate_models", lambda: [c for c in candidates() if c.name == "ridge"])
+    provider = SyntheticProvider([2023, 2024, 2025], rounds=5, drivers=8)
+    base = PredictionConfig(
+        source="fastf1",
+        mode="qualifying",
+        year=2025,
+        round_number=3,
+        train_seasons=[2023, 2024, 2025],
+        include_standings=False,
+        cache_dir=None,
+        meeting_name=None,
+        country_name=None,
+    )
+    # Same training group: the 2024 target must not train on the 2025 rows built for the other one.
+    configs = [dataclasses.replace(base, year=2024, round_number=4), base]
+
+    batch = run_prediction_batch(configs, provider=provider)
+
+    for config, result in zip(configs, batch):
+        single = run_prediction(config, provider=provider)
+        pd.testing.assert_frame_equal(result.table, single.table)
+        assert result.notes == single.notes
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rqp import training
+from rqp.prediction import predict_with_model
+from rqp.registry import ModelRegistry
+
+FEATURES = ["fp_mean_delta", "grid_form", "team_form", "never_observed"]
+
+
+@pytest.fixture
+def ridge_only(monkeypatch):
+    candidates = training._candidate_models
+    monkeypatch.setattr(training, "_candidate_models", lambda: [c for c in candidates() if c.name == "ridge"])
+
+
+def _train():
+    rng = np.random.default_rng(2)
+    n = 48
+    frame = pd.DataFrame(
+        {
+            "event_key": np.repeat(np.arange(2023001, 2023001 + n // 8), 8),
+            "fp_mean_delta": rng.normal(size=n),
+            "grid_form": rng.normal(size=n),
+            # Object columns are coerced to numbers, as at training time.
+            "team_form": pd.Series(rng.integers(0, 5, size=n).astype(str), dtype=object),
+        }
+    )
+    frame.loc[rng.random(n) < 0.25, "grid_form"] = np.nan
+    frame["target"] = 2.0 * frame["fp_mean_delta"] + rng.normal(scale=0.1, size=n)
+    return frame
+
+
+def _design_matrix(train):
+    # Training columns in feature order, missing values replaced by the training medians (0 when never observed).
+    X = train.reindex(columns=FEATURES).apply(pd.to_numeric, errors="coerce").astype(np.float32)
+    medians = X.median().fillna(0.0)
+    return X.fillna(medians).to_numpy(dtype=np.float32), medians
+
+
+def test_registry_round_trip_keeps_the_training_preprocessing(tmp_path, ridge_only):
+    train = _train()
+    fitted = training.train_model(train, FEATURES, registry=ModelRegistry(str(tmp_path)))
+    loaded = training.train_model(train, FEATURES, registry=ModelRegistry(str(tmp_path)))
+    assert loaded.notes[0].startswith("Modele charge depuis le registre")
+
+    expected, medians = _design_matrix(train)
+    preprocessor = loaded.preprocessor
+    assert preprocessor.columns == tuple(FEATURES)
+    np.testing.assert_allclose(preprocessor.medians, medians.to_numpy(), rtol=1e-6)
+    np.testing.assert_allclose(preprocessor.transform(train), expected, rtol=1e-6)
+    for row in [0, 5, 17]:
+        np.testing.assert_allclose(preprocessor.transform(train.iloc[[row]]), expected[[row]], rtol=1e-6)
+
+    # Inference frames may come with other columns, another order or without a training column.
+    weekend = train.iloc[[3, 9]].drop(columns=["grid_form"]).assign(unseen=1.0)[::-1]
+    X = preprocessor.transform(weekend)
+    np.testing.assert_allclose(X[:, 1], medians["grid_form"], rtol=1e-6)
+    np.testing.assert_allclose(X[:, [0, 2, 3]], expected[[9, 3]][:, [0, 2, 3]], rtol=1e-6)
+
+    predicted = predict_with_model(loaded.model, weekend, FEATURES, [], preprocessor=loaded.preprocessor)
+    reference = predict_with_model(fitted.model, weekend, FEATURES, [], preprocessor=fitted.preprocessor)
+    np.testing.assert_allclose(predicted.to_numpy(), reference.to_numpy())
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from rqp import registry as registry_module
+from rqp.registry import ModelRegistry, training_fingerprint
+from rqp.utils import LRUCache
+
+FEATURES = ["fp_mean_delta", "grid_form"]
+CANDIDATES = [("ridge", {"alpha": 1.0}, "1.0")]
+
+
+def _train():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "fp_mean_delta": rng.normal(size=12),
+            "grid_form": rng.normal(size=12),
+            "target": rng.integers(-5, 6, size=12).astype(float),
+            "event_key": np.repeat([2023001, 2023002, 2023003], 4),
+            "driver_name": [f"Driver {i}" for i in range(12)],
+        }
+    )
+
+
+def test_same_training_data_gives_the_same_key():
+    train = _train()
+    key = training_fingerprint(train, FEATURES, CANDIDATES)
+    assert training_fingerprint(train.copy(), FEATURES, CANDIDATES) == key
+    # Columns that are neither features, target nor event key do not change the model.
+    assert training_fingerprint(train.assign(driver_name="x"), FEATURES, CANDIDATES) == key
+
+
+def test_changed_target_feature_or_candidates_miss():
+    train = _train()
+    key = training_fingerprint(train, FEATURES, CANDIDATES)
+
+    target = train.copy()
+    target.loc[3, "target"] += 1
+    feature = train.copy()
+    feature.loc[7, "grid_form"] = np.nan
+    keys = {
+        training_fingerprint(target, FEATURES, CANDIDATES),
+        training_fingerprint(feature, FEATURES, CANDIDATES),
+        training_fingerprint(train, FEATURES[::-1], CANDIDATES),
+        training_fingerprint(train, FEATURES, [("ridge", {"alpha": 2.0}, "1.0")]),
+    }
+    assert key not in keys
+    assert len(keys) == 4
+
+
+def test_registry_version_bump_invalidates_keys(monkeypatch):
+    train = _train()
+    key = training_fingerprint(train, FEATURES, CANDIDATES)
+    monkeypatch.setattr(registry_module, "REGISTRY_VERSION", registry_module.REGISTRY_VERSION + 1)
+    assert training_fingerprint(train, FEATURES, CANDIDATES) != key
+
+
+def test_saved_entries_hit_from_disk_in_a_new_registry(tmp_path):
+    ModelRegistry(str(tmp_path)).save("abc", {"model": "ridge"})
+    assert ModelRegistry(str(tmp_path)).load("abc") == {"model": "ridge"}
+    assert ModelRegistry(str(tmp_path)).load("missing") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_memory_cache_evicts_the_least_recently_used_entry(tmp_path):
+    memory_only = ModelRegistry(memory=LRUCache(2))
+    for key in ["a", "b"]:
+        memory_only.save(key, [key])
+    memory_only.load("a")
+    memory_only.save("c", ["c"])
+    assert memory_only.load("b") is None
+    assert memory_only.load("a") == ["a"]
+    assert memory_only.load("c") == ["c"]
+
+    # With a root, evicted entries are reloaded from disk (and cached again).
+    memory = LRUCache(1)
+    backed = ModelRegistry(str(tmp_path), memory=memory)
+    backed.save("a", ["a"])
+    backed.save("b", ["b"])
+    assert memory.get("a") is None
+    assert backed.load("a") == ["a"]
+    assert memory.get("a") == ["a"]
+
+
+def test_loaded_entries_are_copies(tmp_path):
+    registry = ModelRegistry(str(tmp_path), memory=LRUCache(4))
+    registry.save("key", {"notes": ["a"]})
+    loaded = registry.load("key")
+    loaded["notes"] = ["changed"]
+    assert registry.load("key") == {"notes": ["a"]}
@@ -0,0 +1,17 @@
+import pytest
+
+from rqp.service import config_from_params
+
+BASE = {"mode": "race", "source": "fastf1", "year": 2025, "round": 4}
+
+
+@pytest.mark.parametrize("value, expected", [(True, True), (False, False), ("true", True), ("False", False), ("", False)])
+def test_boolean_params_accept_json_bools_and_their_spelling(value, expected):
+    config = config_from_params({**BASE, "include_standings": value, "incremental": value, "ensemble": value})
+    assert (config.include_standings, config.incremental, config.ensemble) == (expected, expected, expected)
+
+
+@pytest.mark.parametrize("value", ["yes", "0", 1, "flase"])
+def test_other_boolean_values_are_rejected(value):
+    with pytest.raises(ValueError, match="ensemble"):
+        config_from_params({**BASE, "ensemble": value})
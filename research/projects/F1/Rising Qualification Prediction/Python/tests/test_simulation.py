@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from rqp.simulation import simulate_championship, simulate_finishing_order
+
+PREDS = np.array([0.0, 0.1, 0.5, 1.0, 1.2])
+RESIDUALS = np.random.default_rng(0).normal(scale=0.4, size=64)
+
+
+def test_finishing_order_counts_fill_every_driver_and_position_once_per_simulation():
+    distribution = simulate_finishing_order(PREDS, RESIDUALS, simulations=3_000, seed=1, chunk_size=700)
+
+    counts = distribution.position_counts
+    assert counts.sum() == 3_000 * len(PREDS)
+    np.testing.assert_array_equal(counts.sum(axis=0), 3_000)
+    np.testing.assert_array_equal(counts.sum(axis=1), 3_000)
+    np.testing.assert_allclose(distribution.position_probabilities.sum(axis=1), 1.0)
+
+
+def test_finishing_order_does_not_depend_on_the_chunk_size():
+    whole = simulate_finishing_order(PREDS, RESIDUALS, simulations=2_000, seed=5, chunk_size=2_000)
+    chunked = simulate_finishing_order(PREDS, RESIDUALS, simulations=2_000, seed=5, chunk_size=333)
+    np.testing.assert_array_equal(whole.position_counts, chunked.position_counts)
+
+
+def test_finishing_order_without_noise_follows_the_predictions():
+    distribution = simulate_finishing_order(PREDS[::-1], np.zeros(3), simulations=10, seed=0)
+    np.testing.assert_array_equal(distribution.position_counts, np.fliplr(np.eye(len(PREDS), dtype=int)) * 10)
+    assert distribution.p_pole[-1] == 1.0
+
+
+def test_finishing_order_needs_a_finite_residual():
+    with pytest.raises(ValueError):
+        simulate_finishing_order(PREDS, np.array([np.nan]))
+
+
+def test_championship_totals_match_points_awarded_per_round():
+    points_table = {1: 10, 2: 6, 3: 3}
+    current = np.array([5.0, 0.0, 12.0, 1.0, 0.0])
+    simulations, n_rounds = 1_500, 4
+
+    distribution = simulate_championship(
+        PREDS, RESIDUALS, current, n_rounds, simulations=simulations, seed=2, points_table=points_table, chunk_size=400
+    )
+
+    counts = distribution.position_counts
+    np.testing.assert_array_equal(counts.sum(axis=0), simulations)
+    np.testing.assert_array_equal(counts.sum(axis=1), simulations)
+    # Each simulated round hands out the whole points table exactly once.
+    expected_total = simulations * (current.sum() + n_rounds * sum(points_table.values()))
+    assert distribution.points_sum.sum() == pytest.approx(expected_total)
+
+
+def test_championship_does_not_depend_on_the_chunk_size():
+    args = (PREDS, RESIDUALS, np.zeros(len(PREDS)), 3)
+    whole = simulate_championship(*args, simulations=800, seed=4, chunk_size=800)
+    chunked = simulate_championship(*args, simulations=800, seed=4, chunk_size=150)
+    np.testing.assert_array_equal(whole.position_counts, chunked.position_counts)
+    np.testing.assert_allclose(whole.points_sum, chunked.points_sum)
+
+
+def test_championship_with_no_rounds_left_keeps_the_current_order():
+    current = np.array([3.0, 25.0, 10.0, 0.0, 18.0])
+    distribution = simulate_championship(PREDS, RESIDUALS, current, 0, simulations=50)
+    assert distribution.p_title.tolist() == [0.0, 1.0, 0.0, 0.0, 0.0]
+    np.testing.assert_allclose(distribution.expected_points, current)
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rqp import training
+from rqp.training import _Candidate, _impute, _prefix_medians, _RidgeStatistics
+
+
+class ColumnModel:
+    """Predicts one feature column as is, whatever it was fitted on."""
+
+    def __init__(self, column=0, sign=1.0, n_estimators=None):
+        self.column = column
+        self.sign = sign
+
+    def fit(self, X, y):
+        return self
+
+    def predict(self, X):
+        return self.sign * np.asarray(X, dtype=np.float64)[:, self.column]
+
+
+def _noisy_columns(noise, events=12, drivers=10, seed=0):
+    # Column k is the target plus noise of scale noise[k]: the best predictor is the least noisy column.
+    rng = np.random.default_rng(seed)
+    n = events * drivers
+    target = rng.normal(scale=3.0, size=n)
+    frame = pd.DataFrame({f"c{k}": target + rng.normal(scale=scale, size=n) for k, scale in enumerate(noise)})
+    frame["target"] = target
+    frame["event_key"] = np.repeat(202401 + np.arange(events), drivers)
+    return frame, [f"c{k}" for k in range(len(noise))]
+
+
+def _use_candidates(monkeypatch, candidates):
+    monkeypatch.setattr(training, "_candidate_models", lambda: candidates)
+
+
+def test_prefix_medians_match_nanmedian_of_each_prefix():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 3)).astype(np.float32)
+    X[rng.random(X.shape) < 0.3] = np.nan
+    X[:12, 2] = np.nan  # a column with no value in the shortest prefixes
+    ends = np.array([1, 2, 5, 12, 13, 27, 40])
+
+    medians = _prefix_medians(X, ends)
+
+    for row, end in zip(medians, ends):
+        for j, column in enumerate(X[:end].T):
+            present = column[~np.isnan(column)].astype(np.float64)
+            expected = np.median(present) if present.size else 0.0
+            np.testing.assert_allclose(row[j], expected, rtol=1e-6)
+
+
+def test_prefix_medians_of_an_all_missing_column_are_zero():
+    X = np.column_stack([np.arange(6, dtype=np.float32), np.full(6, np.nan, dtype=np.float32)])
+    medians = _prefix_medians(X, np.array([3, 6]))
+    np.testing.assert_allclose(medians, [[1.0, 0.0], [2.5, 0.0]])
+
+
+def test_ridge_statistics_solve_like_ridge_fit_on_imputed_rows():
+    from sklearn.linear_model import Ridge
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(200, 4))
+    y = X @ np.array([0.5, -1.0, 0.0, 2.0]) + rng.normal(scale=0.1, size=200)
+    X[rng.random(X.shape) < 0.2] = np.nan
+    medians = np.array([0.1, -0.2, 0.0, 0.3])
+
+    stats = _RidgeStatistics(X.shape[1])
+    # Folds arrive in chunks; the statistics must not depend on how the rows were split.
+    for chunk in np.array_split(np.arange(len(X)), 3):
+        stats.update(X[chunk], y[chunk])
+    coef, intercept = stats.solve(medians, alpha=1.5)
+
+    reference = Ridge(alpha=1.5).fit(_impute(X, medians), y)
+    np.testing.assert_allclose(coef, reference.coef_, rtol=1e-8, atol=1e-10)
+    assert intercept == pytest.approx(reference.intercept_, rel=1e-8, abs=1e-10)
+
+
+def test_halving_keeps_the_best_candidate_and_reports_pruned_ones_apart(monkeypatch):
+    train, features = _noisy_columns([1.0, 0.1, 2.0, 0.5])
+    _use_candidates(
+        monkeypatch,
+        [
+            _Candidate(f"col{k}", ColumnModel, {"column": k, "n_estimators": 100}, iter_param="n_estimators")
+            for k in range(4)
+        ],
+    )
+
+    result = training.train_model(train, features, selection="halving")
+
+    assert result.model_name == "col1"
+    assert [name for name, _ in result.leaderboard] == ["col1"]
+    selection = next(note for note in result.notes if note.startswith("Model selection (successive halving"))
+    assert "col0" not in selection
+    pruned = next(note for note in result.notes if note.startswith("Elimines en cours de halving"))
+    # Two candidates go at the first rung, the runner-up at the second.
+    assert "col2=" in pruned and "col0=" in pruned and "col3=" in pruned and "col1=" not in pruned
+    assert "(rung 1," in pruned and "(rung 2," in pruned
+
+
+def _evaluations(P, y):
+    matrix = training._DesignMatrix(X=np.zeros((len(y), 0), dtype=np.float32), y=y, event_keys=np.arange(len(y)))
+    evaluations = [training._Evaluation(_Candidate(f"m{k}", ColumnModel, {}), 0.0, oof=P[:, k]) for k in range(P.shape[1])]
+    folds = [(start - 10, start, start + 10) for start in range(10, len(y), 10)]
+    return matrix, evaluations, folds
+
+
+def test_blend_weights_are_non_negative_and_scored_against_the_first_candidate():
+    rng = np.random.default_rng(3)
+    y = rng.normal(scale=3.0, size=120)
+    # The third candidate is anti-correlated with the target: a positive stack gives it no weight.
+    P = np.column_stack([y + rng.normal(size=120), y + rng.normal(size=120), -y])
+    P[:10] = np.nan
+    matrix, evaluations, folds = _evaluations(P, y)
+
+    blend_score, single_score, weights, _ = training._blend_evaluations(matrix, evaluations, folds)
+
+    assert (weights >= 0).all() and weights[2] == 0
+    scored = folds[training.MIN_BLEND_FOLDS:]
+    expected_single = np.mean([np.abs(y[start:end] - P[start:end, 0]).mean() for _, start, end in scored])
+    assert single_score == pytest.approx(expected_single)
+    assert blend_score < single_score
+
+
+@pytest.mark.parametrize("second, blended", [({"column": 1}, True), ({"column": 0, "sign": -1.0}, False)])
+def test_the_blend_is_retained_only_when_it_beats_the_best_candidate(monkeypatch, second, blended):
+    train, features = _noisy_columns([1.0, 1.0])
+    _use_candidates(monkeypatch, [_Candidate("a", ColumnModel, {"column": 0}), _Candidate("b", ColumnModel, second)])
+
+    result = training.train_model(train, features, ensemble=True)
+
+    blend_note = next(note for note in result.notes if note.startswith("Ensemble OOF (stacking positif)"))
+    blend_score, single_score = (float(part.split("=")[-1]) for part in blend_note.split(" sur ")[0].split(" vs "))
+    retained = [note for note in result.notes if note.startswith("Modele retenu")]
+    assert len(retained) == 1
+    if blended:
+        assert blend_score < single_score
+        assert result.model_name in {"ensemble(a+b)", "ensemble(b+a)"}
+        assert retained[0].startswith("Modele retenu: ensemble OOF")
+    else:
+        # The anti-correlated candidate gets no weight: a one-model "blend" is not an ensemble.
+        assert "b=" not in blend_note.split("poids")[1]
+        assert result.model_name == "a"
+        assert retained[0].startswith("Modele retenu: a ")
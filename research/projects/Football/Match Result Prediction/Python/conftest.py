@@ -0,0 +1 @@
+"""pytest puts this directory on sys.path, so `import mrp` works from `python -m pytest` here."""
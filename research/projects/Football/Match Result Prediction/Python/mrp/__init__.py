@@ -1,6 +1,18 @@
 """Match Result Prediction (football) package."""
 
-from .config import PredictionConfig
-from .prediction import PredictionResult, run_prediction
+from .config import MultiLeagueConfig, PredictionConfig
+from .data import load_fixtures, load_matches, load_teams
+from .parallel import run_multi_league
+from .prediction import PredictionResult, prediction_payload, run_prediction
 
-__all__ = ["PredictionConfig", "PredictionResult", "run_prediction"]
+__all__ = [
+    "MultiLeagueConfig",
+    "PredictionConfig",
+    "PredictionResult",
+    "load_fixtures",
+    "load_matches",
+    "load_teams",
+    "prediction_payload",
+    "run_multi_league",
+    "run_prediction",
+]
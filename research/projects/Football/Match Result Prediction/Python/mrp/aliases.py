@@ -0,0 +1,226 @@
+"""Team alias index: normalized-name hash map with a character n-gram fuzzy fallback."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .constants import ALIAS_MIN_MARGIN, ALIAS_MIN_SIMILARITY, ALIAS_NGRAM, ALIAS_NOISE_TOKENS, TEAM_ID_COLUMNS
+from .data import load_teams, resolve_table_path
+from .utils import LRUCache, file_fingerprint
+
+_INDEXES = LRUCache(8)
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """ASCII-folded, lower-case, punctuation-free names with club noise tokens dropped and tokens sorted."""
+    folded = (
+        names.astype(str)
+        .str.normalize("NFKD")
+        .str.encode("ascii", "ignore")
+        .str.decode("ascii")
+        .str.lower()
+        .str.replace(r"[^a-z0-9]+", " ", regex=True)
+    )
+    noise = set(ALIAS_NOISE_TOKENS)
+    keys = []
+    for value in folded.to_numpy():
+        tokens = value.split()
+        kept = [token for token in tokens if token not in noise] or tokens
+        keys.append(" ".join(sorted(kept)))
+    return pd.Series(keys, index=names.index, dtype=object)
+
+
+def _ngrams(keys: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(owner, gram) pairs of the distinct padded n-grams of each key, plus the gram count per key."""
+    owners: list[int] = []
+    grams: list[str] = []
+    sizes = np.zeros(len(keys), dtype=np.int64)
+    for idx, key in enumerate(keys):
+        padded = f" {key} "
+        distinct = {padded[pos:pos + n] for pos in range(max(1, len(padded) - n + 1))}
+        owners.extend([idx] * len(distinct))
+        grams.extend(distinct)
+        sizes[idx] = len(distinct)
+    return np.asarray(owners, dtype=np.int64), np.asarray(grams, dtype=object), sizes
+
+
+@dataclass
+class AliasIndex:
+    team_ids: pd.Index
+    exact: pd.Series
+    scoped: pd.Series
+    keys: np.ndarray
+    key_teams: np.ndarray
+    key_sizes: np.ndarray
+    vocabulary: pd.Index
+    postings: pd.DataFrame
+    ngram: int = ALIAS_NGRAM
+
+    @classmethod
+    def build(cls, teams: pd.DataFrame, ngram: int = ALIAS_NGRAM) -> "AliasIndex":
+        teams = teams.reset_index(drop=True)
+        names = [teams[["team_id", "team_name"]].rename(columns={"team_name": "name"})]
+        names.append(pd.DataFrame({"team_id": teams["team_id"], "name": teams["team_id"]}))
+        if "team_aliases" in teams.columns:
+            aliases = teams[["team_id", "team_aliases"]].dropna()
+            aliases = aliases.assign(name=aliases["team_aliases"].astype(str).str.split("|")).explode("name")
+            names.append(aliases[["team_id", "name"]])
+        league = teams["league"].astype(str) if "league" in teams.columns else pd.Series("", index=teams.index)
+        entries = pd.concat(
+            [frame.assign(league=league.loc[frame.index].to_numpy()) for frame in names], ignore_index=True
+        ).astype({"team_id": str, "name": str})
+        entries = entries.loc[entries["name"].str.strip() != ""]
+        entries["key"] = normalize_names(entries["name"]).to_numpy()
+        entries = entries.drop_duplicates(["key", "league", "team_id"])
+
+        # A key naming several teams only resolves within a league.
+        owners = entries.groupby("key")["team_id"].nunique()
+        unique = entries.loc[entries["key"].map(owners).to_numpy() == 1].drop_duplicates("key")
+        shared = entries.loc[entries["key"].map(owners).to_numpy() > 1]
+        scoped_owners = shared.groupby(["league", "key"])["team_id"].nunique()
+        shared = shared.set_index(["league", "key"])["team_id"]
+        scoped = shared.loc[~shared.index.duplicated()].loc[scoped_owners.index[scoped_owners.to_numpy() == 1]]
+
+        keys = unique["key"].to_numpy(dtype=object)
+        owners_idx, grams, sizes = _ngrams(keys, ngram)
+        gram_codes, vocabulary = pd.factorize(grams)
+        order = np.argsort(gram_codes, kind="stable")
+        return cls(
+            team_ids=pd.Index(teams["team_id"].astype(str).unique(), dtype=object),
+            exact=pd.Series(unique["team_id"].to_numpy(dtype=object), index=pd.Index(keys, dtype=object)),
+            scoped=scoped,
+            keys=keys,
+            key_teams=unique["team_id"].to_numpy(dtype=object),
+            key_sizes=sizes,
+            vocabulary=pd.Index(vocabulary, dtype=object),
+            postings=pd.DataFrame({"gram": gram_codes[order], "key": owners_idx[order]}),
+            ngram=ngram,
+        )
+
+    def _fuzzy(self, keys: np.ndarray, min_similarity: float) -> tuple[np.ndarray, np.ndarray]:
+        """Best Dice similarity over shared n-grams for each key, in one join against the postings."""
+        best_team = np.full(len(keys), None, dtype=object)
+        best_score = np.zeros(len(keys))
+        if not len(keys) or not len(self.keys):
+            return best_team, best_score
+        owners, grams, sizes = _ngrams(keys, self.ngram)
+        codes = self.vocabulary.get_indexer(grams)
+        known = codes >= 0
+        pairs = pd.DataFrame({"query": owners[known], "gram": codes[known]}).merge(self.postings, on="gram")
+        if pairs.empty:
+            return best_team, best_score
+        pair_codes, shared = np.unique(
+            pairs["query"].to_numpy() * len(self.keys) + pairs["key"].to_numpy(), return_counts=True
+        )
+        query, key = np.divmod(pair_codes, len(self.keys))
+        candidates = pd.DataFrame(
+            {"query": query, "team": self.key_teams[key], "score": 2.0 * shared / (sizes[query] + self.key_sizes[key])}
+        )
+        # Best key per (query, team), then the top two teams per query.
+        candidates = candidates.sort_values(["query", "score"], ascending=[True, False], kind="stable")
+        candidates = candidates.drop_duplicates(["query", "team"])
+        rank = candidates.groupby("query", sort=False).cumcount().to_numpy()
+        best = candidates.loc[rank == 0].set_index("query")
+        second = candidates.loc[rank == 1].set_index("query")["score"].reindex(best.index, fill_value=0.0)
+        # A near tie with another team is ambiguous: leave it unresolved.
+        accepted = (best["score"] >= min_similarity) & (best["score"] - second >= ALIAS_MIN_MARGIN)
+        rows = best.index.to_numpy()
+        best_score[rows] = best["score"].to_numpy()
+        best_team[rows[accepted.to_numpy()]] = best["team"].to_numpy(dtype=object)[accepted.to_numpy()]
+        return best_team, best_score
+
+    def resolve(
+        self,
+        names: pd.Series,
+        leagues: pd.Series | None = None,
+        min_similarity: float = ALIAS_MIN_SIMILARITY,
+    ) -> pd.DataFrame:
+        """Team id, method (id, exact, league, fuzzy or None) and score per row; work is done once per distinct name."""
+        raw = names.astype(str).to_numpy(dtype=object)
+        if leagues is not None:
+            scope = leagues.astype(str).to_numpy(dtype=object)
+        else:
+            scope = np.full(len(raw), "", dtype=object)
+        codes, uniques = pd.factorize(pd.MultiIndex.from_arrays([raw, scope]))
+        distinct = pd.DataFrame(list(uniques), columns=["name", "league"])
+        team = np.full(len(distinct), None, dtype=object)
+        method = np.full(len(distinct), None, dtype=object)
+        score = np.zeros(len(distinct))
+
+        is_id = self.team_ids.get_indexer(distinct["name"].to_numpy(dtype=object)) >= 0
+        team[is_id], method[is_id], score[is_id] = distinct["name"].to_numpy(dtype=object)[is_id], "id", 1.0
+        keys = normalize_names(distinct["name"]).to_numpy(dtype=object)
+        for label, lookup in (
+            ("exact", self.exact.reindex(keys).to_numpy(dtype=object)),
+            (
+                "league",
+                self.scoped.reindex(
+                    pd.MultiIndex.from_arrays([distinct["league"].to_numpy(dtype=object), keys])
+                ).to_numpy(dtype=object),
+            ),
+        ):
+            hit = pd.isna(method) & pd.notna(lookup)
+            team[hit], method[hit], score[hit] = lookup[hit], label, 1.0
+        pending = np.flatnonzero(pd.isna(method))
+        fuzzy_team, fuzzy_score = self._fuzzy(keys[pending], min_similarity)
+        score[pending] = fuzzy_score
+        found = pending[pd.notna(fuzzy_team)]
+        team[found], method[found] = fuzzy_team[pd.notna(fuzzy_team)], "fuzzy"
+        return pd.DataFrame(
+            {"name": raw, "team_id": team[codes], "method": method[codes], "score": score[codes]},
+            index=names.index,
+        )
+
+
+def load_alias_index(data_dir: str | Path | None = None) -> AliasIndex:
+    path = resolve_table_path("teams", data_dir)
+    if path is None:
+        raise FileNotFoundError(f"teams.parquet/.csv not found in {data_dir}")
+    key = file_fingerprint(path)
+    index = _INDEXES.get(key)
+    if index is None:
+        index = AliasIndex.build(load_teams(data_dir))
+        _INDEXES.put(key, index)
+    return index
+
+
+def resolve_team_columns(
+    frame: pd.DataFrame,
+    index: AliasIndex,
+    columns: tuple[str, ...] = TEAM_ID_COLUMNS,
+    min_similarity: float = ALIAS_MIN_SIMILARITY,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Replace team strings by `team_id` in one pass over all team columns; unresolved names are kept and reported."""
+    present = [column for column in columns if column in frame.columns]
+    if not present or frame.empty:
+        return frame, pd.DataFrame(columns=["column", "name", "rows", "score"])
+    stacked = pd.concat([frame[column].astype(str) for column in present], ignore_index=True)
+    leagues = pd.concat([frame["league"]] * len(present), ignore_index=True) if "league" in frame.columns else None
+    resolved = index.resolve(stacked, leagues, min_similarity)
+    ids = resolved["team_id"].where(resolved["team_id"].notna(), resolved["name"]).to_numpy(dtype=object)
+    teams = pd.Index(pd.unique(ids))
+    out = frame.copy(deep=False)
+    for position, column in enumerate(present):
+        values = ids[position * len(frame):(position + 1) * len(frame)]
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            values = pd.Categorical(values, categories=teams)
+        out[column] = values
+
+    missing = resolved["method"].isna().to_numpy()
+    report = pd.DataFrame(
+        {
+            "column": np.repeat(present, len(frame))[missing],
+            "name": resolved["name"].to_numpy()[missing],
+            "score": resolved["score"].to_numpy()[missing],
+        }
+    )
+    report = (
+        report.groupby(["column", "name"], sort=True)
+        .agg(rows=("score", "size"), score=("score", "max"))
+        .reset_index()
+    )
+    return out, report
@@ -0,0 +1,323 @@
+"""Hot-path benchmarks on deterministic synthetic leagues, with JSON results and regression checks."""
+
+from __future__ import annotations
+
+import dataclasses
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from . import data as data_module
+from . import dixon_coles as dixon_coles_module
+from . import features as features_module
+from . import ratings as ratings_module
+from .aliases import AliasIndex
+from .config import PredictionConfig
+from .data import load_matches, load_teams, with_rounds
+from .dixon_coles import fit_dixon_coles, time_decay_weights
+from .features import TeamForm, form_differences
+from .prediction import run_prediction
+from .ratings import EloEngine
+from .training import fit_outcome_model, match_outcomes
+
+DEFAULT_SIZES = (1, 5, 20)
+DEFAULT_THRESHOLD = 0.10
+# Differences below this are timer noise, whatever the ratio.
+MIN_REGRESSION_MS = 1.0
+LAST_SEASON = 2024
+TEAMS = 20
+LEAGUES = 2
+
+
+def synthetic_tables(leagues: int, seasons: int, teams: int = TEAMS, seed: int = 0) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Teams and double round-robin matches with Poisson goals from drifting team strengths."""
+    rng = np.random.default_rng(seed)
+    # Circle-method schedule: (round, home, away) for one season, second half mirrored.
+    order = np.arange(teams)
+    pairs = []
+    for rnd in range(teams - 1):
+        pairs.extend((rnd, order[i], order[teams - 1 - i]) for i in range(teams // 2))
+        order = np.concatenate([[order[0]], [order[-1]], order[1:-1]])
+    first = np.array(pairs)
+    schedule = np.vstack([first, np.column_stack([first[:, 0] + teams - 1, first[:, 2], first[:, 1]])])
+    team_frames, match_frames = [], []
+    for li in range(leagues):
+        league = f"L{li:02d}"
+        ids = np.array([f"{league}-T{t:02d}" for t in range(teams)], dtype=object)
+        team_frames.append(
+            pd.DataFrame(
+                {
+                    "team_id": ids,
+                    "team_name": [f"Club {league} {t}" for t in range(teams)],
+                    "league": league,
+                    "team_aliases": [f"{league} Club {t}|FC {league}{t}" for t in range(teams)],
+                }
+            )
+        )
+        attack = rng.normal(0.0, 0.3, teams)
+        defence = rng.normal(0.0, 0.3, teams)
+        for season in range(LAST_SEASON - seasons + 1, LAST_SEASON + 1):
+            attack = 0.8 * attack + rng.normal(0.0, 0.15, teams)
+            defence = 0.8 * defence + rng.normal(0.0, 0.15, teams)
+            rnd, home, away = schedule.T
+            home_rate = np.exp(0.25 + attack[home] - defence[away])
+            away_rate = np.exp(attack[away] - defence[home])
+            match_frames.append(
+                pd.DataFrame(
+                    {
+                        "match_id": [f"{league}-{season}-{r + 1}-{h}-{a}" for r, h, a in schedule],
+                        "date": pd.Timestamp(f"{season}-08-10") + pd.to_timedelta(7 * rnd, unit="D"),
+                        "season": season,
+                        "league": league,
+                        "home_team_id": ids[home],
+                        "away_team_id": ids[away],
+                        "home_goals": rng.poisson(home_rate),
+                        "away_goals": rng.poisson(away_rate),
+                        "home_xg": (home_rate * rng.uniform(0.7, 1.3, len(rnd))).round(2),
+                        "away_xg": (away_rate * rng.uniform(0.7, 1.3, len(rnd))).round(2),
+                    }
+                )
+            )
+    matches = pd.concat(match_frames, ignore_index=True).sort_values("date", kind="stable", ignore_index=True)
+    return pd.concat(team_frames, ignore_index=True), matches
+
+
+def write_tables(directory: Path, teams: pd.DataFrame, matches: pd.DataFrame) -> None:
+    try:
+        teams.to_parquet(directory / "teams.parquet", index=False)
+        matches.to_parquet(directory / "matches.parquet", index=False)
+    except ImportError:
+        teams.to_csv(directory / "teams.csv", index=False)
+        matches.to_csv(directory / "matches.csv", index=False)
+
+
+def clear_state() -> None:
+    """Drop every in-memory table, rating, form and fit cache so the next run starts cold."""
+    data_module.clear_cache()
+    ratings_module._ENGINES.clear()
+    features_module._FORMS.clear()
+    dixon_coles_module._FITS.clear()
+
+
+@dataclass
+class BenchmarkContext:
+    data_dir: Path
+    league: str
+    matches: pd.DataFrame
+    season: int
+    round_number: int
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    setup: Callable[[BenchmarkContext], Callable[[], object]]
+
+
+def _league_matches(context: BenchmarkContext) -> pd.DataFrame:
+    frame = context.matches
+    return frame.loc[(frame["league"].astype(str) == context.league).to_numpy()].reset_index(drop=True)
+
+
+def _setup_load(context: BenchmarkContext) -> Callable[[], object]:
+    def run() -> object:
+        data_module.clear_cache()
+        return load_matches(context.data_dir)
+
+    return run
+
+
+def _setup_rounds(context: BenchmarkContext) -> Callable[[], object]:
+    matches = context.matches.drop(columns="round_number")
+    return lambda: with_rounds(matches)
+
+
+def _setup_elo(context: BenchmarkContext) -> Callable[[], object]:
+    matches = _league_matches(context)
+    return lambda: EloEngine(league=context.league).advance(matches)
+
+
+def _setup_form_full(context: BenchmarkContext) -> Callable[[], object]:
+    matches = _league_matches(context)
+    return lambda: TeamForm(league=context.league).update(matches)
+
+
+def _setup_form_round(context: BenchmarkContext) -> Callable[[], object]:
+    matches = _league_matches(context)
+    last = (matches["season"] == matches["season"].max()).to_numpy() & (
+        matches["round_number"] == matches.loc[matches["season"] == matches["season"].max(), "round_number"].max()
+    ).to_numpy()
+    base = TeamForm(league=context.league)
+    base.update(matches.loc[~last])
+    # update() rebinds rows/tails/rounds instead of mutating them, so a shallow copy is a fresh state.
+    return lambda: dataclasses.replace(base).update(matches)
+
+
+def _setup_dixon_coles(context: BenchmarkContext) -> Callable[[], object]:
+    matches = _league_matches(context)
+    weights = time_decay_weights(matches["date"], pd.Timestamp(matches["date"].max()))
+    return lambda: fit_dixon_coles(
+        matches["home_team_id"],
+        matches["away_team_id"],
+        matches["home_goals"].to_numpy(),
+        matches["away_goals"].to_numpy(),
+        weights=weights,
+    )
+
+
+def _setup_outcome_model(context: BenchmarkContext) -> Callable[[], object]:
+    matches = _league_matches(context)
+    engine = EloEngine(league=context.league)
+    engine.advance(matches)
+    form = TeamForm(league=context.league)
+    form.update(matches)
+    pre = engine.pre_match_ratings(matches["match_id"])
+    features = np.column_stack([(pre[:, 0] - pre[:, 1]) / engine.params.scale, form_differences(form.features(matches))])
+    outcomes = match_outcomes(matches["home_goals"].to_numpy(), matches["away_goals"].to_numpy())
+    return lambda: fit_outcome_model(features, outcomes)
+
+
+def _setup_aliases(context: BenchmarkContext) -> Callable[[], object]:
+    teams = load_teams(context.data_dir)
+    index = AliasIndex.build(teams)
+    names = dict(zip(teams["team_id"].astype(str), teams["team_name"].astype(str)))
+    spelled = context.matches["home_team_id"].astype(str).map(names)
+    # A few misspellings per team so the fuzzy path is exercised too.
+    spelled = spelled.where(np.arange(len(spelled)) % 50 != 0, spelled.str.replace("Club", "Clb", regex=False))
+    return lambda: index.resolve(spelled, context.matches["league"])
+
+
+def _setup_prediction(mode: str, cold: bool) -> Callable[[BenchmarkContext], Callable[[], object]]:
+    def setup(context: BenchmarkContext) -> Callable[[], object]:
+        config = PredictionConfig(
+            league=context.league,
+            season=context.season,
+            round_number=context.round_number,
+            mode=mode,
+            data_source=str(context.data_dir),
+        )
+
+        def run() -> object:
+            if cold:
+                clear_state()
+            return run_prediction(config)
+
+        return run
+
+    return setup
+
+
+CASES = [
+    BenchmarkCase("load_matches", _setup_load),
+    BenchmarkCase("with_rounds", _setup_rounds),
+    BenchmarkCase("EloEngine.advance", _setup_elo),
+    BenchmarkCase("TeamForm.update[full]", _setup_form_full),
+    BenchmarkCase("TeamForm.update[round]", _setup_form_round),
+    BenchmarkCase("fit_dixon_coles", _setup_dixon_coles),
+    BenchmarkCase("fit_outcome_model", _setup_outcome_model),
+    BenchmarkCase("AliasIndex.resolve", _setup_aliases),
+    BenchmarkCase("run_prediction[match_result/cold]", _setup_prediction("match_result", cold=True)),
+    BenchmarkCase("run_prediction[match_result/warm]", _setup_prediction("match_result", cold=False)),
+    BenchmarkCase("run_prediction[scoreline/cold]", _setup_prediction("scoreline", cold=True)),
+]
+
+
+def _time(fn: Callable[[], object], repeat: int) -> list[float]:
+    fn()  # first-call caches and lazy imports are not what is being measured
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def run_benchmarks(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = 3,
+    cases: list[str] | None = None,
+    leagues: int = LEAGUES,
+    progress: Callable[[dict[str, object]], None] | None = None,
+) -> dict[str, object]:
+    unknown = sorted(set(cases or []) - {case.name for case in CASES})
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+    selected = [case for case in CASES if not cases or case.name in cases]
+    results: list[dict[str, object]] = []
+    for seasons in sizes:
+        teams, matches = synthetic_tables(leagues, seasons)
+        with tempfile.TemporaryDirectory() as directory:
+            data_dir = Path(directory)
+            write_tables(data_dir, teams, matches)
+            clear_state()
+            loaded, _ = with_rounds(load_matches(data_dir))
+            context = BenchmarkContext(
+                data_dir=data_dir,
+                league="L00",
+                matches=loaded,
+                season=LAST_SEASON,
+                round_number=int(loaded["round_number"].max()),
+            )
+            for case in selected:
+                timings = _time(case.setup(context), max(1, repeat))
+                record = {
+                    "case": case.name,
+                    "seasons": seasons,
+                    "median_ms": round(statistics.median(timings), 3),
+                    "min_ms": round(min(timings), 3),
+                    "repeat": len(timings),
+                }
+                results.append(record)
+                if progress is not None:
+                    progress(record)
+            clear_state()
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sizes": list(sizes),
+        "leagues": leagues,
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, object],
+    current: dict[str, object],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_ms: float = MIN_REGRESSION_MS,
+) -> list[dict[str, object]]:
+    """One row per (case, seasons) in both runs; `status` is regression, improvement or same."""
+    before = {(r["case"], r["seasons"]): r for r in baseline.get("results", [])}
+    rows: list[dict[str, object]] = []
+    for record in current.get("results", []):
+        key = (record["case"], record["seasons"])
+        if key not in before:
+            continue
+        old, new = float(before[key]["median_ms"]), float(record["median_ms"])
+        ratio = new / old if old > 0 else float("inf")
+        status = "same"
+        if ratio > 1.0 + threshold and new - old > min_ms:
+            status = "regression"
+        elif ratio < 1.0 - threshold and old - new > min_ms:
+            status = "improvement"
+        rows.append(
+            {
+                "case": record["case"],
+                "seasons": record["seasons"],
+                "baseline_ms": old,
+                "current_ms": new,
+                "ratio": round(ratio, 3),
+                "status": status,
+            }
+        )
+    return rows
@@ -0,0 +1,364 @@
+"""Odds-implied probabilities and vectorized flat / fractional Kelly staking backtests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .constants import CALIBRATION_BINS, KELLY_FRACTION, MAX_KELLY_STAKE, MIN_TRAIN_MATCHES
+from .data import data_source_dir, load_matches, with_rounds
+from .features import form_differences, load_form
+from .ratings import load_engine
+from .training import fit_outcome_model, match_outcomes
+
+IMPLIED_METHODS = ("basic", "additive", "power", "shin")
+STAKING_METHODS = ("flat", "kelly")
+ODDS_COLUMNS = ("home_odds", "draw_odds", "away_odds")
+SOLVER_ITERATIONS = 50
+
+SEASON_COLUMNS = [
+    "season",
+    "matches",
+    "bets",
+    "staked",
+    "profit",
+    "roi",
+    "hit_rate",
+    "max_drawdown",
+    "final_bankroll",
+    "model_log_loss",
+    "market_log_loss",
+    "model_brier",
+    "market_brier",
+]
+
+
+def odds_matrix(frame: pd.DataFrame) -> np.ndarray:
+    """(n, 3) decimal odds ordered home, draw, away; missing or invalid prices are NaN."""
+    odds = np.column_stack([frame[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in ODDS_COLUMNS])
+    return np.where(odds > 1.0, odds, np.nan)
+
+
+def _solve_power(inverse: np.ndarray) -> np.ndarray:
+    # Newton on k for sum(inverse ** k) = 1, all rows at once.
+    log_inverse = np.log(inverse)
+    k = np.ones(len(inverse))
+    for _ in range(SOLVER_ITERATIONS):
+        powered = inverse ** k[:, None]
+        step = (powered.sum(axis=1) - 1.0) / (powered * log_inverse).sum(axis=1)
+        k = k - np.nan_to_num(step)
+        if np.nanmax(np.abs(step), initial=0.0) < 1e-12:
+            break
+    return inverse ** k[:, None]
+
+
+def _solve_shin(inverse: np.ndarray) -> np.ndarray:
+    # Fixed point on the insider share z (Shin 1993), all rows at once.
+    booksum = inverse.sum(axis=1, keepdims=True)
+    outcomes = inverse.shape[1]
+    z = np.zeros((len(inverse), 1))
+    for _ in range(SOLVER_ITERATIONS):
+        roots = np.sqrt(z * z + 4.0 * (1.0 - z) * inverse * inverse / booksum)
+        updated = (roots.sum(axis=1, keepdims=True) - 2.0) / (outcomes - 2.0)
+        if np.nanmax(np.abs(updated - z), initial=0.0) < 1e-12:
+            z = updated
+            break
+        z = updated
+    roots = np.sqrt(z * z + 4.0 * (1.0 - z) * inverse * inverse / booksum)
+    return (roots - z) / (2.0 * (1.0 - z))
+
+
+def implied_probabilities(odds: np.ndarray, method: str = "basic") -> np.ndarray:
+    """Margin-free probabilities from (n, 3) decimal odds; rows with a missing price stay NaN."""
+    if method not in IMPLIED_METHODS:
+        raise ValueError(f"method must be one of {', '.join(IMPLIED_METHODS)}")
+    inverse = 1.0 / np.asarray(odds, dtype=np.float64)
+    if method == "basic":
+        probs = inverse
+    elif method == "additive":
+        margin = inverse.sum(axis=1, keepdims=True) - 1.0
+        probs = np.clip(inverse - margin / inverse.shape[1], 1e-9, None)
+    elif method == "power":
+        probs = _solve_power(inverse)
+    else:
+        probs = _solve_shin(inverse)
+    return probs / probs.sum(axis=1, keepdims=True)
+
+
+def outcome_index(home_goals: np.ndarray, away_goals: np.ndarray) -> np.ndarray:
+    """Column of the realised outcome in home/draw/away probability arrays."""
+    return 2 - match_outcomes(home_goals, away_goals).astype(np.int64)
+
+
+def log_loss(probs: np.ndarray, outcome: np.ndarray) -> float:
+    picked = probs[np.arange(len(outcome)), outcome]
+    return float(-np.log(np.clip(picked, 1e-12, None)).mean()) if len(outcome) else float("nan")
+
+
+def brier_score(probs: np.ndarray, outcome: np.ndarray) -> float:
+    if not len(outcome):
+        return float("nan")
+    target = np.zeros_like(probs)
+    target[np.arange(len(outcome)), outcome] = 1.0
+    return float(((probs - target) ** 2).sum(axis=1).mean())
+
+
+def calibration_table(probs: np.ndarray, outcome: np.ndarray, bins: int = CALIBRATION_BINS) -> pd.DataFrame:
+    """Reliability bins over every (match, outcome) probability: mean forecast vs observed frequency."""
+    target = np.zeros_like(probs)
+    target[np.arange(len(outcome)), outcome] = 1.0
+    flat = probs.ravel()
+    codes = np.minimum((flat * bins).astype(np.int64), bins - 1)
+    counts = np.bincount(codes, minlength=bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        predicted = np.bincount(codes, weights=flat, minlength=bins) / counts
+        observed = np.bincount(codes, weights=target.ravel(), minlength=bins) / counts
+    edges = np.arange(bins + 1) / bins
+    table = pd.DataFrame(
+        {"low": edges[:-1], "high": edges[1:], "count": counts, "predicted": predicted, "observed": observed}
+    )
+    return table.loc[table["count"] > 0].reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class StakingPlan:
+    staking: str = "flat"
+    kelly_fraction: float = KELLY_FRACTION
+    max_stake: float = MAX_KELLY_STAKE
+    min_edge: float = 0.0
+
+
+def select_bets(probs: np.ndarray, odds: np.ndarray, min_edge: float = 0.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Best-edge outcome per match (-1 = no bet), its edge p * o - 1 and full-Kelly fraction edge / (o - 1)."""
+    edge = np.nan_to_num(probs * odds - 1.0, nan=-np.inf)
+    choice = edge.argmax(axis=1)
+    rows = np.arange(len(choice))
+    best = edge[rows, choice]
+    bet = best > min_edge
+    kelly = np.where(bet, best / (odds[rows, choice] - 1.0), 0.0)
+    return np.where(bet, choice, -1), np.where(bet, best, 0.0), kelly
+
+
+def staking_backtest(
+    seasons: np.ndarray,
+    dates: np.ndarray,
+    probs: np.ndarray,
+    odds: np.ndarray,
+    outcome: np.ndarray,
+    plan: StakingPlan,
+) -> pd.DataFrame:
+    """Per-match stakes and bankroll path, vectorized over every season (bankroll resets to 1 each season)."""
+    if plan.staking not in STAKING_METHODS:
+        raise ValueError(f"staking must be one of {', '.join(STAKING_METHODS)}")
+    order = np.lexsort((dates, seasons))
+    seasons, dates = seasons[order], dates[order]
+    probs, odds, outcome = probs[order], odds[order], outcome[order]
+    choice, edge, kelly = select_bets(probs, odds, plan.min_edge)
+    rows = np.arange(len(choice))
+    bet = choice >= 0
+    price = np.where(bet, odds[rows, np.maximum(choice, 0)], np.nan)
+    # Return per unit staked: odds - 1 on a win, -1 on a loss.
+    unit_return = np.where(bet, np.where(choice == outcome, price - 1.0, -1.0), 0.0)
+
+    season_start = np.r_[True, seasons[1:] != seasons[:-1]]
+    season_id = np.cumsum(season_start) - 1
+    if plan.staking == "flat":
+        stake = bet.astype(np.float64)
+        profit = stake * unit_return
+        cumulative = np.cumsum(profit)
+        bankroll = cumulative - np.r_[0.0, cumulative][np.flatnonzero(season_start)][season_id]
+    else:
+        # Bets on the same day are sized from the bankroll at the start of that day.
+        fraction = np.minimum(kelly * plan.kelly_fraction, plan.max_stake)
+        day_start = season_start | np.r_[True, dates[1:] != dates[:-1]]
+        day_id = np.cumsum(day_start) - 1
+        growth = 1.0 + np.bincount(day_id, weights=fraction * unit_return)
+        log_growth = np.log(np.maximum(growth, 1e-12))
+        cumulative = np.cumsum(log_growth)
+        first_day = day_id[season_start]
+        season_of_day = season_id[day_start]
+        season_offset = np.r_[0.0, cumulative][first_day][season_of_day]
+        end_of_day = np.exp(cumulative - season_offset)
+        start_of_day = end_of_day / growth
+        stake = fraction * start_of_day[day_id]
+        profit = stake * unit_return
+        bankroll = end_of_day[day_id]
+    return pd.DataFrame(
+        {
+            "season": seasons,
+            "date": dates,
+            "bet": choice,
+            "edge": edge,
+            "stake": stake,
+            "profit": profit,
+            "bankroll": bankroll,
+            "_order": order,
+        }
+    )
+
+
+def _max_drawdown(ledger: pd.DataFrame, staking: str) -> pd.Series:
+    bankroll = ledger["bankroll"]
+    if staking == "flat":
+        # Flat staking starts from 0 units; drawdown is in units lost from the running peak.
+        peak = bankroll.groupby(ledger["season"]).cummax().clip(lower=0.0)
+        return (peak - bankroll).groupby(ledger["season"]).max()
+    peak = bankroll.groupby(ledger["season"]).cummax().clip(lower=1.0)
+    return (1.0 - bankroll / peak).groupby(ledger["season"]).max()
+
+
+def summarize_backtest(
+    ledger: pd.DataFrame,
+    probs: np.ndarray,
+    market: np.ndarray,
+    outcome: np.ndarray,
+    staking: str,
+) -> tuple[pd.DataFrame, dict[str, float]]:
+    order = ledger["_order"].to_numpy()
+    probs, market, outcome = probs[order], market[order], outcome[order]
+    placed = ledger["bet"].to_numpy() >= 0
+    won = placed & (ledger["bet"].to_numpy() == outcome)
+    grouped = ledger.assign(placed=placed, won=won).groupby("season")
+    table = grouped.agg(
+        matches=("bet", "size"),
+        bets=("placed", "sum"),
+        wins=("won", "sum"),
+        staked=("stake", "sum"),
+        profit=("profit", "sum"),
+        final_bankroll=("bankroll", "last"),
+    )
+    table["roi"] = table["profit"] / table["staked"].where(table["staked"] > 0)
+    table["hit_rate"] = table["wins"] / table["bets"].where(table["bets"] > 0)
+    table["max_drawdown"] = _max_drawdown(ledger, staking)
+    if staking == "flat":
+        table["final_bankroll"] = np.nan
+    seasons = ledger["season"].to_numpy()
+    for label, values in (("model", probs), ("market", market)):
+        table[f"{label}_log_loss"] = [log_loss(values[seasons == s], outcome[seasons == s]) for s in table.index]
+        table[f"{label}_brier"] = [brier_score(values[seasons == s], outcome[seasons == s]) for s in table.index]
+    table = table.reset_index()[SEASON_COLUMNS]
+
+    staked = float(table["staked"].sum())
+    overall = {
+        "seasons": int(len(table)),
+        "matches": int(table["matches"].sum()),
+        "bets": int(table["bets"].sum()),
+        "staked": staked,
+        "profit": float(table["profit"].sum()),
+        "roi": float(table["profit"].sum() / staked) if staked else float("nan"),
+        "hit_rate": float(won.sum() / placed.sum()) if placed.any() else float("nan"),
+        "max_drawdown": float(table["max_drawdown"].max()) if len(table) else float("nan"),
+        "model_log_loss": log_loss(probs, outcome),
+        "market_log_loss": log_loss(market, outcome),
+        "model_brier": brier_score(probs, outcome),
+        "market_brier": brier_score(market, outcome),
+    }
+    return table, overall
+
+
+@dataclass
+class BettingConfig:
+    leagues: list[str]
+    seasons: list[int]
+    data_source: str | None = None
+    cache_dir: str | None = None
+    method: str = "shin"
+    staking: str = "kelly"
+    kelly_fraction: float = KELLY_FRACTION
+    max_stake: float = MAX_KELLY_STAKE
+    min_edge: float = 0.0
+    train_window: int = 2
+
+
+@dataclass
+class BettingResult:
+    seasons: pd.DataFrame
+    overall: dict[str, float]
+    calibration: pd.DataFrame
+    notes: list[str] = field(default_factory=list)
+
+
+def league_features(matches: pd.DataFrame, league: str, cache_dir: str | None) -> pd.DataFrame:
+    """Pre-match Elo and form differences for every match of one league (states advanced and cached)."""
+    engine = load_engine(league, cache_dir=cache_dir)
+    engine.advance(matches)
+    form = load_form(league, cache_dir=cache_dir)
+    form.update(matches)
+    pre = engine.pre_match_ratings(matches["match_id"])
+    features = np.column_stack([(pre[:, 0] - pre[:, 1]) / engine.params.scale, form_differences(form.features(matches))])
+    return pd.DataFrame(features, index=matches.index).add_prefix("x")
+
+
+def walk_forward_probabilities(frame: pd.DataFrame, seasons: list[int], train_window: int) -> tuple[np.ndarray, list[str]]:
+    """1X2 probabilities per match, each season predicted by a model fitted on the previous `train_window` seasons."""
+    features = frame.filter(regex=r"^x\d+$").to_numpy()
+    outcomes = match_outcomes(frame["home_goals"].to_numpy(), frame["away_goals"].to_numpy())
+    season_values = frame["season"].to_numpy()
+    probs = np.full((len(frame), 3), np.nan)
+    notes: list[str] = []
+    for season in seasons:
+        train = (season_values < season) & (season_values >= season - train_window) & np.isfinite(features).all(axis=1)
+        target = season_values == season
+        if train.sum() < MIN_TRAIN_MATCHES or not target.any():
+            notes.append(f"Saison {season}: historique insuffisant ({int(train.sum())} matchs).")
+            continue
+        model = fit_outcome_model(features[train], outcomes[train])
+        probs[target] = model.predict(np.nan_to_num(features[target]))
+    return probs, notes
+
+
+def run_betting_backtest(config: BettingConfig) -> BettingResult:
+    if config.method not in IMPLIED_METHODS:
+        raise ValueError(f"method must be one of {', '.join(IMPLIED_METHODS)}")
+    if config.staking not in STAKING_METHODS:
+        raise ValueError(f"staking must be one of {', '.join(STAKING_METHODS)}")
+    data_dir = data_source_dir(config.data_source)
+    notes: list[str] = []
+    frames = []
+    for league in config.leagues:
+        matches = load_matches(data_dir, leagues=[league])
+        if matches.empty:
+            notes.append(f"Aucun match pour la ligue {league}.")
+            continue
+        matches, _ = with_rounds(matches)
+        frames.append(pd.concat([matches, league_features(matches, league, config.cache_dir)], axis=1))
+    if not frames:
+        return BettingResult(pd.DataFrame(columns=SEASON_COLUMNS), {}, pd.DataFrame(), notes)
+    frame = pd.concat(frames, ignore_index=True)
+
+    probs, fit_notes = walk_forward_probabilities(frame, sorted(config.seasons), config.train_window)
+    notes.extend(fit_notes)
+    odds = odds_matrix(frame) if set(ODDS_COLUMNS) <= set(frame.columns) else np.full((len(frame), 3), np.nan)
+    usable = np.isfinite(probs).all(axis=1) & np.isfinite(odds).all(axis=1) & frame["season"].isin(config.seasons).to_numpy()
+    if not usable.any():
+        notes.append("Aucun match avec cotes et probabilites modele.")
+        return BettingResult(pd.DataFrame(columns=SEASON_COLUMNS), {}, pd.DataFrame(), notes)
+    skipped = int((frame["season"].isin(config.seasons).to_numpy() & ~usable).sum())
+    if skipped:
+        notes.append(f"{skipped} matchs ignores (cotes ou probabilites manquantes).")
+
+    frame = frame.loc[usable]
+    probs, odds = probs[usable], odds[usable]
+    market = implied_probabilities(odds, config.method)
+    outcome = outcome_index(frame["home_goals"].to_numpy(), frame["away_goals"].to_numpy())
+    plan = StakingPlan(config.staking, config.kelly_fraction, config.max_stake, config.min_edge)
+    ledger = staking_backtest(
+        frame["season"].to_numpy(dtype=np.int64),
+        frame["date"].to_numpy(dtype="datetime64[ns]"),
+        probs,
+        odds,
+        outcome,
+        plan,
+    )
+    seasons, overall = summarize_backtest(ledger, probs, market, outcome, config.staking)
+    notes.append(
+        f"Marge retiree par methode {config.method}; mise {config.staking}"
+        + (
+            f" (fraction {config.kelly_fraction}, plafond {config.max_stake})."
+            if config.staking == "kelly"
+            else " (1 unite)."
+        )
+    )
+    return BettingResult(seasons, overall, calibration_table(probs, outcome), notes)
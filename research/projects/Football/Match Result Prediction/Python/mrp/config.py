@@ -14,3 +14,26 @@ class PredictionConfig:
     data_source: str | None = None
     train_seasons: list[int] | None = None
     cache_dir: str | None = None
+
+
+@dataclass(frozen=True)
+class MultiLeagueConfig:
+    leagues: list[str]
+    season: int
+    round_number: int
+    mode: str
+    data_source: str | None = None
+    train_seasons: list[int] | None = None
+    cache_dir: str | None = None
+    workers: int | None = None
+
+    def league_config(self, league: str) -> PredictionConfig:
+        return PredictionConfig(
+            league=league,
+            season=self.season,
+            round_number=self.round_number,
+            mode=self.mode,
+            data_source=self.data_source,
+            train_seasons=self.train_seasons,
+            cache_dir=self.cache_dir,
+        )
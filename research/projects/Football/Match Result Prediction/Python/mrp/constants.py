@@ -1,3 +1,75 @@
-"""Shared constants for match result prediction (placeholder)."""
+"""Shared constants for match result prediction."""
 
-# TODO: Define league identifiers, feature names, and label mappings.
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[6]
+DATA_DIR = Path(os.environ.get("MRP_DATA_DIR") or REPO_ROOT / "data" / "football")
+TABLE_FORMATS = ("parquet", "csv")
+
+# Column -> compact dtype. "category" ids share categories across home/away columns.
+TEAMS_REQUIRED = {"team_id": "category", "team_name": "str"}
+TEAMS_OPTIONAL = {"league": "category", "country": "category", "team_aliases": "str"}
+
+MATCHES_REQUIRED = {
+    "match_id": "str",
+    "date": "datetime64[ns]",
+    "season": "int16",
+    "league": "category",
+    "home_team_id": "category",
+    "away_team_id": "category",
+    "home_goals": "int8",
+    "away_goals": "int8",
+}
+MATCHES_OPTIONAL = {
+    "home_xg": "float32",
+    "away_xg": "float32",
+    "home_odds": "float32",
+    "draw_odds": "float32",
+    "away_odds": "float32",
+    "venue": "category",
+    "home_red": "Int8",
+    "away_red": "Int8",
+}
+
+# Fixtures share the matches schema; goals are empty, so they stay nullable.
+FIXTURES_REQUIRED = {
+    **{k: v for k, v in MATCHES_REQUIRED.items() if k not in {"home_goals", "away_goals"}},
+}
+FIXTURES_OPTIONAL = {**MATCHES_OPTIONAL, "home_goals": "Int8", "away_goals": "Int8"}
+
+TEAM_ID_COLUMNS = ("home_team_id", "away_team_id")
+
+MODES = ("match_result", "scoreline")
+LOCAL_SOURCES = {None, "", "placeholder", "local"}
+MODEL_VERSION = "0.2.0"
+MIN_TRAIN_MATCHES = 50
+MAX_GOALS = 10
+OVER_UNDER_LINES = (1.5, 2.5, 3.5)
+
+# Dixon-Coles: exponential time decay per day (half-life ~1 year) and bound on rho.
+DC_TIME_DECAY = 0.0019
+DC_RHO_BOUND = 0.2
+
+# Team form: rolling window (matches) for the team-long features.
+FORM_WINDOW = 5
+
+# Team alias resolution: tokens ignored in names, n-gram size, minimum Dice similarity for fuzzy
+# matches and the lead required over the best candidate of another team.
+ALIAS_NOISE_TOKENS = ("fc", "afc", "cf", "sc", "ac", "cd", "club", "the")
+ALIAS_NGRAM = 3
+ALIAS_MIN_SIMILARITY = 0.8
+ALIAS_MIN_MARGIN = 0.1
+
+# Betting backtests: fractional Kelly multiplier, stake cap (share of bankroll) and calibration bins.
+KELLY_FRACTION = 0.25
+MAX_KELLY_STAKE = 0.05
+CALIBRATION_BINS = 10
+
+# In-play: regulation length, prior weight of pre-match rates (in matches) and red-card rate factors.
+MATCH_MINUTES = 90
+INPLAY_PRIOR_MATCHES = 4.0
+RED_CARD_OWN_FACTOR = 0.7
+RED_CARD_OPPONENT_FACTOR = 1.2
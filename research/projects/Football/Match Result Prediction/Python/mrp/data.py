@@ -1,3 +1,324 @@
-"""Data loading and feature engineering (placeholder)."""
+"""Football data loading: schema validation and compact columnar tables."""
 
-# TODO: Load fixtures, results, and team-level features for training and inference.
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    DATA_DIR,
+    FIXTURES_OPTIONAL,
+    FIXTURES_REQUIRED,
+    LOCAL_SOURCES,
+    MATCHES_OPTIONAL,
+    MATCHES_REQUIRED,
+    TABLE_FORMATS,
+    TEAM_ID_COLUMNS,
+    TEAMS_OPTIONAL,
+    TEAMS_REQUIRED,
+)
+from .utils import LRUCache, file_fingerprint
+
+try:
+    import pyarrow.parquet as pq
+except Exception:  # pragma: no cover - optional dependency
+    pq = None
+
+_TABLE_CACHE = LRUCache(32)
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    name: str
+    required: dict[str, str]
+    optional: dict[str, str]
+    sort_by: str | None = None
+
+    @property
+    def dtypes(self) -> dict[str, str]:
+        return {**self.required, **self.optional}
+
+
+TEAMS = TableSchema("teams", TEAMS_REQUIRED, TEAMS_OPTIONAL)
+MATCHES = TableSchema("matches", MATCHES_REQUIRED, MATCHES_OPTIONAL, sort_by="date")
+FIXTURES = TableSchema("fixtures", FIXTURES_REQUIRED, FIXTURES_OPTIONAL, sort_by="date")
+
+
+def data_source_dir(data_source: str | None) -> Path:
+    if data_source in LOCAL_SOURCES:
+        return DATA_DIR
+    return Path(str(data_source))
+
+
+def resolve_table_path(name: str, data_dir: str | Path | None = None) -> Path | None:
+    base = Path(data_dir) if data_dir else DATA_DIR
+    for fmt in TABLE_FORMATS:
+        path = base / f"{name}.{fmt}"
+        if path.exists():
+            return path
+    return None
+
+
+def _file_columns(path: Path) -> list[str]:
+    if path.suffix == ".parquet":
+        if pq is None:
+            raise SystemExit("pyarrow is not installed. Install with: pip install pyarrow")
+        return list(pq.read_schema(path).names)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def _projection(
+    schema: TableSchema,
+    available: list[str],
+    columns: Iterable[str] | None,
+    filter_columns: Iterable[str],
+) -> list[str]:
+    missing = [c for c in schema.required if c not in available]
+    if missing:
+        raise ValueError(f"{schema.name}: missing required columns: {', '.join(missing)}")
+    wanted = set(columns) if columns is not None else set(schema.dtypes)
+    unknown = sorted(wanted - set(schema.dtypes))
+    if unknown:
+        raise ValueError(f"{schema.name}: unknown columns: {', '.join(unknown)}")
+    wanted |= set(filter_columns)
+    return [c for c in schema.dtypes if c in wanted and c in available]
+
+
+def _read_parquet(path: Path, columns: list[str], filters: list[tuple]) -> pd.DataFrame:
+    # Column projection and row-group predicate pushdown happen in pyarrow.
+    return pd.read_parquet(path, columns=columns, filters=filters or None)
+
+
+def _read_csv(path: Path, schema: TableSchema, columns: list[str]) -> pd.DataFrame:
+    dtype: dict[str, str] = {}
+    for column in columns:
+        kind = schema.dtypes[column]
+        if kind in {"category", "str"}:
+            dtype[column] = kind
+        elif kind.startswith("float"):
+            dtype[column] = kind
+    engine = "c" if pq is None else "pyarrow"
+    return pd.read_csv(path, usecols=columns, dtype=dtype, engine=engine)
+
+
+def _filter_rows(
+    frame: pd.DataFrame,
+    leagues: list[str] | None,
+    seasons: list[int] | None,
+) -> pd.DataFrame:
+    mask = np.ones(len(frame), dtype=bool)
+    if leagues is not None:
+        mask &= frame["league"].astype(str).isin(leagues).to_numpy()
+    if seasons is not None:
+        mask &= pd.to_numeric(frame["season"], errors="coerce").isin(seasons).to_numpy()
+    if mask.all():
+        return frame
+    return frame.loc[mask].reset_index(drop=True)
+
+
+def _coerce_integer(series: pd.Series, dtype: str, label: str) -> pd.Series:
+    values = pd.to_numeric(series, errors="coerce")
+    if (values.isna() & series.notna()).any():
+        raise ValueError(f"{label}: non-numeric values")
+    present = values.dropna()
+    info = np.iinfo(dtype.lower())
+    if len(present) and ((present % 1 != 0).any() or present.min() < info.min or present.max() > info.max):
+        raise ValueError(f"{label}: values out of range for {dtype.lower()}")
+    if dtype.islower() and values.isna().any():
+        raise ValueError(f"{label}: {int(values.isna().sum())} missing values")
+    return values.astype(dtype)
+
+
+def _coerce(frame: pd.DataFrame, schema: TableSchema) -> pd.DataFrame:
+    out: dict[str, pd.Series] = {}
+    for column in frame.columns:
+        kind = schema.dtypes[column]
+        series = frame[column]
+        label = f"{schema.name}.{column}"
+        if kind == "category":
+            out[column] = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype("category")
+        elif kind == "str":
+            # Missing values stay missing (astype alone turns them into "nan" before pandas 3).
+            out[column] = series.astype("str").where(series.notna())
+        elif kind.startswith("datetime"):
+            parsed = pd.to_datetime(series, errors="coerce", format="ISO8601")
+            bad = parsed.isna() & series.notna()
+            if bad.any():
+                raise ValueError(f"{label}: {int(bad.sum())} unparseable dates")
+            out[column] = parsed.astype(kind)
+        elif kind.startswith("float"):
+            out[column] = pd.to_numeric(series, errors="coerce").astype(kind)
+        else:
+            out[column] = _coerce_integer(series, kind, label)
+        if column in schema.required and out[column].isna().any():
+            raise ValueError(f"{label}: {int(out[column].isna().sum())} missing values")
+    coerced = pd.DataFrame(out)
+    categorical = [c for c in coerced.columns if isinstance(coerced[c].dtype, pd.CategoricalDtype)]
+    for column in categorical:
+        coerced[column] = coerced[column].cat.remove_unused_categories()
+    _share_team_categories(coerced)
+    return coerced
+
+
+def _share_team_categories(frame: pd.DataFrame) -> None:
+    # Home and away ids use one category set so their codes index the same team arrays.
+    present = [c for c in TEAM_ID_COLUMNS if c in frame.columns]
+    if len(present) < 2:
+        return
+    teams = pd.Index([])
+    for column in present:
+        teams = teams.union(frame[column].cat.categories)
+    for column in present:
+        frame[column] = frame[column].cat.set_categories(teams)
+
+
+def load_table(
+    schema: TableSchema,
+    path: str | Path,
+    columns: Iterable[str] | None = None,
+    leagues: Iterable[str] | None = None,
+    seasons: Iterable[int] | None = None,
+) -> pd.DataFrame:
+    path = Path(path)
+    leagues = sorted({str(league) for league in leagues}) if leagues is not None else None
+    seasons = sorted({int(season) for season in seasons}) if seasons is not None else None
+    columns = sorted(set(columns)) if columns is not None else None
+    key = (
+        schema.name,
+        file_fingerprint(path),
+        None if columns is None else tuple(columns),
+        None if leagues is None else tuple(leagues),
+        None if seasons is None else tuple(seasons),
+    )
+    cached = _TABLE_CACHE.get(key)
+    if cached is not None:
+        return cached.copy(deep=False)
+
+    filter_columns = [c for c, values in (("league", leagues), ("season", seasons)) if values is not None]
+    for column in filter_columns:
+        if column not in schema.dtypes:
+            raise ValueError(f"{schema.name}: cannot filter on {column}")
+    projection = _projection(schema, _file_columns(path), columns, filter_columns)
+    if path.suffix == ".parquet":
+        filters = []
+        if leagues is not None:
+            filters.append(("league", "in", leagues))
+        if seasons is not None:
+            filters.append(("season", "in", seasons))
+        frame = _read_parquet(path, projection, filters)
+    else:
+        frame = _read_csv(path, schema, projection)
+    frame = _coerce(_filter_rows(frame, leagues, seasons), schema)
+    if schema.sort_by in frame.columns and not frame[schema.sort_by].is_monotonic_increasing:
+        frame = frame.sort_values(schema.sort_by, kind="stable").reset_index(drop=True)
+    if columns is not None:
+        frame = frame[[c for c in frame.columns if c in columns]]
+    _TABLE_CACHE.put(key, frame)
+    return frame.copy(deep=False)
+
+
+def _load_named(
+    schema: TableSchema,
+    data_dir: str | Path | None,
+    **kwargs: object,
+) -> pd.DataFrame:
+    path = resolve_table_path(schema.name, data_dir)
+    if path is None:
+        base = Path(data_dir) if data_dir else DATA_DIR
+        raise FileNotFoundError(f"{schema.name}.parquet/.csv not found in {base}")
+    return load_table(schema, path, **kwargs)
+
+
+def load_teams(data_dir: str | Path | None = None, columns: Iterable[str] | None = None) -> pd.DataFrame:
+    return _load_named(TEAMS, data_dir, columns=columns)
+
+
+def load_matches(
+    data_dir: str | Path | None = None,
+    columns: Iterable[str] | None = None,
+    leagues: Iterable[str] | None = None,
+    seasons: Iterable[int] | None = None,
+) -> pd.DataFrame:
+    return _load_named(MATCHES, data_dir, columns=columns, leagues=leagues, seasons=seasons)
+
+
+def load_fixtures(
+    data_dir: str | Path | None = None,
+    columns: Iterable[str] | None = None,
+    leagues: Iterable[str] | None = None,
+    seasons: Iterable[int] | None = None,
+) -> pd.DataFrame:
+    return _load_named(FIXTURES, data_dir, columns=columns, leagues=leagues, seasons=seasons)
+
+
+def _team_codes(frame: pd.DataFrame) -> np.ndarray:
+    home, away = frame["home_team_id"], frame["away_team_id"]
+    if (
+        isinstance(home.dtype, pd.CategoricalDtype)
+        and isinstance(away.dtype, pd.CategoricalDtype)
+        and home.cat.categories.equals(away.cat.categories)
+    ):
+        return np.concatenate([home.cat.codes.to_numpy(), away.cat.codes.to_numpy()])
+    codes, _ = pd.factorize(np.concatenate([home.astype(str).to_numpy(), away.astype(str).to_numpy()]))
+    return codes
+
+
+def assign_rounds(frame: pd.DataFrame) -> np.ndarray:
+    """Round of each match, in date order: one more than the latest round of either team in their league season.
+
+    A team therefore plays at most once per round, so a round can be rated in a single step.
+    """
+    n = len(frame)
+    if n == 0:
+        return np.zeros(0, dtype=np.int16)
+    rank = np.empty(n, dtype=np.int64)
+    rank[np.argsort(frame["date"].to_numpy(), kind="stable")] = np.arange(n)
+    sides = pd.DataFrame(
+        {
+            "league": np.tile(pd.factorize(frame["league"].astype(str))[0], 2),
+            "season": np.tile(frame["season"].to_numpy(), 2),
+            "team": _team_codes(frame),
+        }
+    )
+    order = np.argsort(np.concatenate([rank, rank]), kind="stable")
+    grouped = sides.iloc[order].groupby(["league", "season", "team"], sort=False)
+    games = np.empty(2 * n, dtype=np.int64)
+    games[order] = grouped.cumcount().to_numpy() + 1
+    # Match played by the same team just before (-1 for its first game of the season).
+    previous = np.empty(2 * n, dtype=np.int64)
+    previous[order] = pd.Series(order % n).groupby(grouped.ngroup().to_numpy()).shift().fillna(-1).to_numpy(dtype=np.int64)
+    has_previous = previous >= 0
+    # The n-th game of a team is at least round n; push rounds later until no team repeats one.
+    rounds = np.maximum(games[:n], games[n:])
+    while True:
+        after = np.zeros(2 * n, dtype=np.int64)
+        after[has_previous] = rounds[previous[has_previous]] + 1
+        pushed = np.maximum(rounds, np.maximum(after[:n], after[n:]))
+        if np.array_equal(pushed, rounds):
+            return rounds.astype(np.int16)
+        rounds = pushed
+
+
+def with_rounds(matches: pd.DataFrame, fixtures: pd.DataFrame | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Add `round_number` to matches and fixtures (fixtures continue their season's numbering)."""
+    matches = matches.assign(round_number=assign_rounds(matches))
+    if fixtures is None or fixtures.empty:
+        empty = matches.iloc[0:0] if fixtures is None else fixtures
+        return matches, empty.assign(round_number=np.zeros(0, dtype=np.int16))
+    played = matches.loc[
+        matches["league"].astype(str).isin(fixtures["league"].astype(str).unique()).to_numpy()
+        & matches["season"].isin(fixtures["season"].unique()).to_numpy()
+    ]
+    columns = ["league", "season", "date", "home_team_id", "away_team_id"]
+    as_str = {"league": str, "home_team_id": str, "away_team_id": str}
+    combined = pd.concat([played[columns].astype(as_str), fixtures[columns].astype(as_str)], ignore_index=True)
+    rounds = assign_rounds(combined)[len(played):]
+    return matches, fixtures.assign(round_number=rounds)
+
+
+def clear_cache() -> None:
+    _TABLE_CACHE.clear()
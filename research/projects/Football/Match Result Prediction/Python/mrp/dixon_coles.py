@@ -0,0 +1,174 @@
+"""Dixon-Coles team-strength scoreline model with a vectorized likelihood and warm starts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .constants import DC_RHO_BOUND, DC_TIME_DECAY, MAX_GOALS
+from .scorelines import ScorelineDistribution, scoreline_distribution
+from .training import minimize_lbfgs
+from .utils import LRUCache, load_pickle, safe_name, save_pickle
+
+_FITS = LRUCache(64)
+
+
+@dataclass(frozen=True)
+class DixonColesModel:
+    teams: pd.Index
+    attack: np.ndarray
+    defence: np.ndarray
+    home: float
+    rho: float
+    iterations: int = 0
+
+    def _codes(self, names: pd.Series) -> np.ndarray:
+        return self.teams.get_indexer(names.astype(str))
+
+    def _strength(self, values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        # Teams unseen in training get the league-average strength (0).
+        return np.where(codes >= 0, values[np.maximum(codes, 0)], 0.0)
+
+    def rates(self, home_teams: pd.Series, away_teams: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        home = self._codes(home_teams)
+        away = self._codes(away_teams)
+        home_rate = np.exp(self.home + self._strength(self.attack, home) - self._strength(self.defence, away))
+        away_rate = np.exp(self._strength(self.attack, away) - self._strength(self.defence, home))
+        return home_rate, away_rate
+
+    def distribution(
+        self, home_teams: pd.Series, away_teams: pd.Series, max_goals: int = MAX_GOALS
+    ) -> ScorelineDistribution:
+        home_rate, away_rate = self.rates(home_teams, away_teams)
+        return scoreline_distribution(home_rate, away_rate, rho=self.rho, max_goals=max_goals)
+
+
+def time_decay_weights(dates: pd.Series, reference: pd.Timestamp, xi: float = DC_TIME_DECAY) -> np.ndarray:
+    days = (reference - pd.to_datetime(dates)).dt.days.to_numpy(dtype=np.float64)
+    return np.exp(-xi * np.maximum(days, 0.0))
+
+
+def negative_log_likelihood(
+    theta: np.ndarray,
+    home: np.ndarray,
+    away: np.ndarray,
+    home_goals: np.ndarray,
+    away_goals: np.ndarray,
+    weights: np.ndarray,
+    n_teams: int,
+) -> tuple[float, np.ndarray]:
+    """Weighted Dixon-Coles NLL and its gradient over theta = [attack, defence, home, rho]."""
+    attack = theta[:n_teams] - theta[:n_teams].mean()
+    defence = theta[n_teams : 2 * n_teams]
+    gamma, rho = theta[-2], theta[-1]
+    lam = np.exp(gamma + attack[home] - defence[away])
+    mu = np.exp(attack[away] - defence[home])
+
+    x, y = home_goals, away_goals
+    c00 = (x == 0) & (y == 0)
+    c01 = (x == 0) & (y == 1)
+    c10 = (x == 1) & (y == 0)
+    c11 = (x == 1) & (y == 1)
+    tau = np.ones_like(lam)
+    tau[c00] = 1.0 - lam[c00] * mu[c00] * rho
+    tau[c01] = 1.0 + lam[c01] * rho
+    tau[c10] = 1.0 + mu[c10] * rho
+    tau[c11] = 1.0 - rho
+    tau = np.maximum(tau, 1e-10)
+
+    loglik = np.log(tau) + x * np.log(lam) - lam + y * np.log(mu) - mu
+    value = -float((weights * loglik).sum())
+
+    # d log tau / d log lambda, d log mu and d rho on the four corrected cells.
+    dtau_lam = np.zeros_like(lam)
+    dtau_mu = np.zeros_like(lam)
+    dtau_rho = np.zeros_like(lam)
+    dtau_lam[c00] = -lam[c00] * mu[c00] * rho / tau[c00]
+    dtau_mu[c00] = dtau_lam[c00]
+    dtau_lam[c01] = lam[c01] * rho / tau[c01]
+    dtau_mu[c10] = mu[c10] * rho / tau[c10]
+    dtau_rho[c00] = -lam[c00] * mu[c00] / tau[c00]
+    dtau_rho[c01] = lam[c01] / tau[c01]
+    dtau_rho[c10] = mu[c10] / tau[c10]
+    dtau_rho[c11] = -1.0 / tau[c11]
+
+    g_lam = -weights * (x - lam + dtau_lam)
+    g_mu = -weights * (y - mu + dtau_mu)
+    g_attack = np.bincount(home, g_lam, n_teams) + np.bincount(away, g_mu, n_teams)
+    g_defence = -np.bincount(away, g_lam, n_teams) - np.bincount(home, g_mu, n_teams)
+    grad = np.concatenate(
+        [
+            g_attack - g_attack.mean(),
+            g_defence,
+            [g_lam.sum(), -float((weights * dtau_rho).sum())],
+        ]
+    )
+    return value, grad
+
+
+def fit_dixon_coles(
+    home_teams: pd.Series,
+    away_teams: pd.Series,
+    home_goals: np.ndarray,
+    away_goals: np.ndarray,
+    weights: np.ndarray | None = None,
+    warm_start: DixonColesModel | None = None,
+) -> DixonColesModel:
+    names = pd.concat([home_teams.astype(str), away_teams.astype(str)], ignore_index=True)
+    codes, teams = pd.factorize(names, sort=True)
+    teams = pd.Index(teams)
+    n_teams = len(teams)
+    n = len(home_teams)
+    home, away = codes[:n], codes[n:]
+    x = np.asarray(home_goals, dtype=np.float64)
+    y = np.asarray(away_goals, dtype=np.float64)
+    w = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    theta0 = np.zeros(2 * n_teams + 2)
+    theta0[-2] = np.log(max((w * x).sum(), 1e-3) / max((w * y).sum(), 1e-3))
+    if warm_start is not None:
+        # Previous round's parameters mapped onto the current team set; new teams start at 0.
+        prev = warm_start.teams.get_indexer(teams)
+        known = prev >= 0
+        theta0[:n_teams][known] = warm_start.attack[prev[known]]
+        theta0[n_teams : 2 * n_teams][known] = warm_start.defence[prev[known]]
+        theta0[-2] = warm_start.home
+        theta0[-1] = warm_start.rho
+
+    bounds = [(None, None)] * (2 * n_teams + 1) + [(-DC_RHO_BOUND, DC_RHO_BOUND)]
+    result = minimize_lbfgs(
+        lambda theta: negative_log_likelihood(theta, home, away, x, y, w, n_teams), theta0, bounds=bounds
+    )
+    theta = result.x
+    attack = theta[:n_teams] - theta[:n_teams].mean()
+    return DixonColesModel(
+        teams=teams,
+        attack=attack,
+        defence=theta[n_teams : 2 * n_teams].copy(),
+        home=float(theta[-2]),
+        rho=float(theta[-1]),
+        iterations=int(result.nit),
+    )
+
+
+def _fit_path(cache_dir: str | Path, league: str) -> Path:
+    return Path(cache_dir) / "models" / f"dixon-coles-{safe_name(league)}.pkl"
+
+
+def previous_fit(league: str, cache_dir: str | Path | None = None) -> DixonColesModel | None:
+    key = (league, str(cache_dir))
+    model = _FITS.get(key)
+    if model is None and cache_dir:
+        model = load_pickle(_fit_path(cache_dir, league))
+        if model is not None:
+            _FITS.put(key, model)
+    return model
+
+
+def store_fit(league: str, model: DixonColesModel, cache_dir: str | Path | None = None) -> None:
+    _FITS.put((league, str(cache_dir)), model)
+    if cache_dir:
+        save_pickle(_fit_path(cache_dir, league), model)
@@ -0,0 +1,264 @@
+"""Rolling team-form features over a team-long view of matches, updated incrementally per matchday."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .constants import FORM_WINDOW
+from .utils import LRUCache, load_pickle, safe_name, save_pickle
+
+_FORMS = LRUCache(64)
+
+FORM_STATS = ("goals_for", "goals_against", "xg_for", "xg_against", "points")
+VENUE_STATS = ("goals_for", "goals_against", "points")
+LONG_COLUMNS = ["match_id", "date", "team", "opponent", "is_home", *FORM_STATS]
+FEATURE_COLUMNS = [
+    *(f"form_{stat}" for stat in FORM_STATS),
+    *(f"venue_{stat}" for stat in VENUE_STATS),
+    "form_games",
+    "rest_days",
+]
+
+
+def team_long_view(matches: pd.DataFrame) -> pd.DataFrame:
+    """One row per (match, team) with the team's own and conceded goals/xG and points, ordered by team and date."""
+    n = len(matches)
+    # Fixtures may carry no goal or xG columns at all: those rows only need ids and dates.
+    missing = np.full(n, np.nan, dtype=np.float32)
+    home_goals = matches["home_goals"].to_numpy(dtype=np.float32, na_value=np.nan) if "home_goals" in matches else missing
+    away_goals = matches["away_goals"].to_numpy(dtype=np.float32, na_value=np.nan) if "away_goals" in matches else missing
+    home_xg = matches["home_xg"].to_numpy(dtype=np.float32) if "home_xg" in matches else missing
+    away_xg = matches["away_xg"].to_numpy(dtype=np.float32) if "away_xg" in matches else missing
+    home_points = np.where(home_goals > away_goals, 3.0, np.where(home_goals == away_goals, 1.0, 0.0))
+    home_points = np.where(np.isnan(home_goals) | np.isnan(away_goals), np.nan, home_points).astype(np.float32)
+    away_points = np.where(np.isnan(home_points), np.nan, np.where(home_points == 1.0, 1.0, 3.0 - home_points))
+    home_ids = matches["home_team_id"].astype(str).to_numpy()
+    away_ids = matches["away_team_id"].astype(str).to_numpy()
+    # Ids stay object arrays: state lookups go through hashtables instead of arrow-string conversions.
+    long = pd.DataFrame(
+        {
+            "match_id": pd.Series(np.tile(matches["match_id"].astype(str).to_numpy(), 2), dtype=object),
+            "date": np.tile(matches["date"].to_numpy(), 2),
+            "team": pd.Series(np.concatenate([home_ids, away_ids]), dtype=object),
+            "opponent": pd.Series(np.concatenate([away_ids, home_ids]), dtype=object),
+            "is_home": np.repeat([True, False], n),
+            "goals_for": np.concatenate([home_goals, away_goals]),
+            "goals_against": np.concatenate([away_goals, home_goals]),
+            "xg_for": np.concatenate([home_xg, away_xg]),
+            "xg_against": np.concatenate([away_xg, home_xg]),
+            "points": np.concatenate([home_points, away_points.astype(np.float32)]),
+        }
+    )
+    return long.sort_values(["team", "date"], kind="stable", ignore_index=True)
+
+
+def _group_starts(keys: list[np.ndarray]) -> np.ndarray:
+    # Index of the first row of each row's group; rows must already be grouped contiguously.
+    n = len(keys[0])
+    change = np.zeros(n, dtype=bool)
+    if n:
+        change[0] = True
+        for key in keys:
+            change[1:] |= key[1:] != key[:-1]
+    return np.maximum.accumulate(np.where(change, np.arange(n), 0))
+
+
+def _previous_means(values: np.ndarray, starts: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Mean of each column over the group's previous `window` rows (NaNs skipped), via prefix sums."""
+    valid = ~np.isnan(values)
+    sums = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(valid, axis=0)])
+    stop = np.arange(len(values))
+    start = np.maximum(starts, stop - window)
+    total = sums[stop] - sums[start]
+    seen = counts[stop] - counts[start]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(seen > 0, total / seen, np.nan)
+    return means, stop - start
+
+
+def rolling_form(long: pd.DataFrame, window: int = FORM_WINDOW) -> pd.DataFrame:
+    """Pre-match form of every row of a team-long view sorted by team and date (the row's own result is excluded)."""
+    team = long["team"].to_numpy()
+    is_home = long["is_home"].to_numpy()
+    out: dict[str, np.ndarray] = {}
+    means, games = _previous_means(long[list(FORM_STATS)].to_numpy(dtype=np.float64), _group_starts([team]), window)
+    for idx, stat in enumerate(FORM_STATS):
+        out[f"form_{stat}"] = means[:, idx]
+
+    # Home/away split: the same windows over (team, venue) groups, then scattered back.
+    order = np.lexsort((np.arange(len(long)), is_home, team))
+    venue_values = long[list(VENUE_STATS)].to_numpy(dtype=np.float64)[order]
+    venue_means, _ = _previous_means(venue_values, _group_starts([team[order], is_home[order]]), window)
+    for idx, stat in enumerate(VENUE_STATS):
+        column = np.empty(len(long))
+        column[order] = venue_means[:, idx]
+        out[f"venue_{stat}"] = column
+
+    out["form_games"] = games
+    dates = long["date"].to_numpy(dtype="datetime64[ns]")
+    rest = np.full(len(long), np.nan)
+    if len(long) > 1:
+        same_team = team[1:] == team[:-1]
+        gaps = (dates[1:] - dates[:-1]) / np.timedelta64(1, "D")
+        rest[1:] = np.where(same_team, gaps, np.nan)
+    out["rest_days"] = rest
+    return pd.DataFrame({column: out[column].astype(np.float32) for column in FEATURE_COLUMNS}, index=long.index)
+
+
+def round_digests(matches: pd.DataFrame, keys: np.ndarray) -> pd.Series:
+    # Order-independent fingerprint of each round's inputs (dates and xG included: both feed the form).
+    # Match ids are all distinct, so categorizing them first only adds a factorize pass.
+    columns = [
+        c
+        for c in ("match_id", "date", "home_team_id", "away_team_id", "home_goals", "away_goals", "home_xg", "away_xg")
+        if c in matches
+    ]
+    hashed = pd.util.hash_pandas_object(matches[columns], index=False, categorize=False)
+    return hashed.groupby(keys).sum()
+
+
+def _round_keys(matches: pd.DataFrame) -> np.ndarray:
+    return matches["season"].to_numpy(dtype=np.int64) * 1000 + matches["round_number"].to_numpy(dtype=np.int64)
+
+
+def _empty_rows() -> pd.DataFrame:
+    return pd.DataFrame(columns=[*LONG_COLUMNS, "round_key", *FEATURE_COLUMNS])
+
+
+@dataclass
+class TeamForm:
+    league: str
+    window: int = FORM_WINDOW
+    rows: pd.DataFrame = field(default_factory=_empty_rows)
+    # Last `window` rows per (team, venue): the only context a later round needs.
+    tails: pd.DataFrame = field(default_factory=_empty_rows)
+    rounds: dict[tuple[int, int], int] = field(default_factory=dict)
+
+    def _tails(self, long: pd.DataFrame, recompute_later: bool) -> tuple[pd.DataFrame, np.ndarray]:
+        """Features of `long` rows computed against each team's stored tail; optionally also the stored rows they precede."""
+        cutoff = long.groupby("team", sort=False)["date"].min()
+        stored_cutoff = self.rows["team"].map(cutoff)
+        affected = stored_cutoff.notna().to_numpy()
+        before = affected & (self.rows["date"] < stored_cutoff).to_numpy()
+        # The last `window` rows per (team, venue) cover both the overall and the venue windows.
+        context = (
+            self.rows.loc[before].drop(columns=FEATURE_COLUMNS).groupby(["team", "is_home"], sort=False).tail(self.window)
+        )
+        later = affected & ~before if recompute_later else np.zeros(len(self.rows), dtype=bool)
+        parts = [
+            context.assign(_target=False),
+            self.rows.loc[later].drop(columns=FEATURE_COLUMNS).assign(_target=True),
+            long.assign(_target=True),
+        ]
+        return self._compute(parts), later
+
+    def _compute(self, parts: list[pd.DataFrame]) -> pd.DataFrame:
+        subset = pd.concat(parts, ignore_index=True).sort_values(["team", "date"], kind="stable", ignore_index=True)
+        subset = pd.concat([subset, rolling_form(subset, self.window)], axis=1)
+        return subset.loc[subset["_target"].to_numpy()].drop(columns="_target")
+
+    def _rollback(self, valid: tuple[int, int] | None) -> None:
+        floor = valid[0] * 1000 + valid[1] if valid else -1
+        self.rows = self.rows.loc[(self.rows["round_key"] <= floor).to_numpy()].reset_index(drop=True)
+        self.tails = self.rows.groupby(["team", "is_home"], sort=False).tail(self.window)
+        self.rounds = {key: digest for key, digest in self.rounds.items() if valid and key <= valid}
+
+    def update(self, matches: pd.DataFrame) -> int:
+        """Add rounds not yet in the state; returns the number of teams whose tails were recomputed.
+
+        Same bookkeeping as `EloEngine.advance`: rounds whose digest changed (and every later round) are dropped
+        and recomputed, so an ordinary matchday only costs the new rows and the affected teams' tails.
+        """
+        if matches.empty:
+            return 0
+        keys = _round_keys(matches)
+        digests = {divmod(int(key), 1000): int(value) for key, value in round_digests(matches, keys).items()}
+        valid: tuple[int, int] | None = None
+        for key in sorted(set(digests) | set(self.rounds)):
+            if key not in self.rounds or digests.get(key) != self.rounds[key]:
+                break
+            valid = key
+        if any(valid is None or key > valid for key in self.rounds):
+            self._rollback(valid)
+        mask = keys > (valid[0] * 1000 + valid[1] if valid else -1)
+        if not mask.any():
+            return 0
+
+        pending = matches.loc[mask]
+        long = team_long_view(pending)
+        position = pd.Index(pending["match_id"].astype(str).to_numpy(), dtype=object).get_indexer(long["match_id"])
+        long["round_key"] = keys[mask][position]
+        first = long.groupby("team", sort=False)["date"].min()
+        last = self.tails.groupby("team", sort=False)["date"].max().reindex(first.index)
+        if self.rows.empty:
+            self.rows = pd.concat([long, rolling_form(long, self.window)], axis=1)
+            tails = self.rows
+        elif bool((last.isna() | (first > last)).all()):
+            # Every new row follows its team's stored rows: the tails are enough context, nothing stored moves.
+            context = self.tails.loc[self.tails["team"].isin(first.index).to_numpy()].drop(columns=FEATURE_COLUMNS)
+            computed = self._compute([context.assign(_target=False), long.assign(_target=True)])
+            self.rows = pd.concat([self.rows, computed], ignore_index=True)
+            tails = pd.concat([self.tails, computed], ignore_index=True)
+        else:
+            # A new round dated before stored rows of the same team (postponed match): recompute those too.
+            # Recomputed rows all follow each team's kept rows, so appending keeps per-team date order.
+            computed, later = self._tails(long, recompute_later=True)
+            self.rows = pd.concat([self.rows.loc[~later], computed], ignore_index=True)
+            tails = self.rows
+        self.tails = tails.groupby(["team", "is_home"], sort=False).tail(self.window)
+        self.rounds = {**self.rounds, **{key: digest for key, digest in digests.items() if not valid or key > valid}}
+        return int(long["team"].nunique())
+
+    def features(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Home/away pre-match form for each row of a matches or fixtures frame, aligned to its rows."""
+        ids = pd.Index(frame["match_id"].astype(str).to_numpy(), dtype=object)
+        stored = ids.isin(self.rows["match_id"])
+        parts = [self.rows.loc[pd.Index(self.rows["match_id"], dtype=object).isin(ids[stored])]]
+        if (~stored).any():
+            computed, _ = self._tails(team_long_view(frame.loc[~stored]), recompute_later=False)
+            parts.append(computed)
+        sides = pd.concat(parts, ignore_index=True).set_index(["match_id", "is_home"])[FEATURE_COLUMNS]
+        home = sides.reindex(pd.MultiIndex.from_arrays([ids, np.ones(len(ids), dtype=bool)])).set_axis(frame.index)
+        away = sides.reindex(pd.MultiIndex.from_arrays([ids, np.zeros(len(ids), dtype=bool)])).set_axis(frame.index)
+        return pd.concat([home.add_prefix("home_"), away.add_prefix("away_")], axis=1)
+
+
+def form_differences(features: pd.DataFrame) -> np.ndarray:
+    """(n, 4) home-minus-away form: points, goal difference, xG difference and venue points (missing -> 0)."""
+    def side(prefix: str) -> np.ndarray:
+        return np.column_stack(
+            [
+                features[f"{prefix}form_points"],
+                features[f"{prefix}form_goals_for"] - features[f"{prefix}form_goals_against"],
+                features[f"{prefix}form_xg_for"] - features[f"{prefix}form_xg_against"],
+                features[f"{prefix}venue_points"],
+            ]
+        ).astype(np.float64)
+
+    return np.nan_to_num(side("home_") - side("away_"), nan=0.0)
+
+
+def _form_path(cache_dir: str | Path, league: str, window: int) -> Path:
+    # v2: per-round digests and tails; older pickles hold per-match digests and are not reused.
+    return Path(cache_dir) / "features" / f"form-v2-{safe_name(league)}-w{window}.pkl"
+
+
+def load_form(league: str, window: int = FORM_WINDOW, cache_dir: str | Path | None = None) -> TeamForm:
+    key = (league, window, str(cache_dir))
+    form = _FORMS.get(key)
+    if form is None and cache_dir:
+        form = load_pickle(_form_path(cache_dir, league, window))
+    if form is None:
+        form = TeamForm(league=league, window=window)
+    _FORMS.put(key, form)
+    return form
+
+
+def save_form(form: TeamForm, cache_dir: str | Path | None) -> None:
+    if cache_dir:
+        save_pickle(_form_path(cache_dir, form.league, form.window), form)
@@ -0,0 +1,307 @@
+"""In-play forecasts: Gamma-Poisson scoring rates updated per event, served from an asyncio event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import zlib
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    INPLAY_PRIOR_MATCHES,
+    MATCH_MINUTES,
+    MAX_GOALS,
+    RED_CARD_OPPONENT_FACTOR,
+    RED_CARD_OWN_FACTOR,
+)
+
+EVENT_KINDS = ("kickoff", "tick", "goal", "red_card", "full_time")
+SIDES = ("home", "away")
+
+
+@dataclass(frozen=True)
+class MatchEvent:
+    match_id: str
+    minute: float
+    kind: str
+    side: str | None = None
+    home_rate: float | None = None
+    away_rate: float | None = None
+
+
+@dataclass(frozen=True)
+class InPlayForecast:
+    match_id: str
+    minute: float
+    home_goals: int
+    away_goals: int
+    p_home: float
+    p_draw: float
+    p_away: float
+    remaining_home: float
+    remaining_away: float
+    p_no_more_goals: float
+    p_over_2_5: float
+    finished: bool = False
+
+
+def _predictive_pmf(shape: float, rate: float, exposure: float, max_goals: int) -> list[float]:
+    """Negative binomial pmf of goals over `exposure` match-lengths under a Gamma(shape, rate) scoring rate."""
+    # Plain floats: for a dozen cells per event this beats numpy's per-call overhead several times over.
+    if exposure <= 0.0:
+        return [1.0] + [0.0] * max_goals
+    p = rate / (rate + exposure)
+    q = 1.0 - p
+    value = p ** shape
+    pmf = [value]
+    for k in range(max_goals):
+        value *= (k + shape) / (k + 1.0) * q
+        pmf.append(value)
+    return pmf
+
+
+class MatchState:
+    """Score, cards and Gamma posteriors of one match; every event is O(1) in the match length."""
+
+    __slots__ = (
+        "match_id",
+        "home_shape",
+        "away_shape",
+        "home_rate",
+        "away_rate",
+        "minute",
+        "home_goals",
+        "away_goals",
+        "home_red",
+        "away_red",
+        "finished",
+    )
+
+    def __init__(self, match_id: str, home_rate: float, away_rate: float, prior_matches: float = INPLAY_PRIOR_MATCHES):
+        # Gamma(shape, rate) per team: prior mean is the pre-match rate, worth `prior_matches` full matches.
+        self.match_id = match_id
+        self.home_shape = home_rate * prior_matches
+        self.away_shape = away_rate * prior_matches
+        self.home_rate = prior_matches
+        self.away_rate = prior_matches
+        self.minute = 0.0
+        self.home_goals = 0
+        self.away_goals = 0
+        self.home_red = 0
+        self.away_red = 0
+        self.finished = False
+
+    def multipliers(self) -> tuple[float, float]:
+        """Scoring-rate multipliers from red cards (own dismissals slow a team, the opponent's speed it up)."""
+        home = RED_CARD_OWN_FACTOR ** self.home_red * RED_CARD_OPPONENT_FACTOR ** self.away_red
+        away = RED_CARD_OWN_FACTOR ** self.away_red * RED_CARD_OPPONENT_FACTOR ** self.home_red
+        return home, away
+
+    def advance(self, minute: float) -> None:
+        # Elapsed play adds exposure to the posterior rate, scaled by the current red-card multipliers.
+        elapsed = min(max(minute, self.minute), MATCH_MINUTES) - min(self.minute, MATCH_MINUTES)
+        if elapsed > 0:
+            home, away = self.multipliers()
+            self.home_rate += home * elapsed / MATCH_MINUTES
+            self.away_rate += away * elapsed / MATCH_MINUTES
+        self.minute = max(minute, self.minute)
+
+    def apply(self, event: MatchEvent) -> None:
+        if event.kind not in EVENT_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(EVENT_KINDS)}")
+        if event.kind in {"goal", "red_card"} and event.side not in SIDES:
+            raise ValueError(f"{event.kind} requires side 'home' or 'away'")
+        # Validated first: a rejected event leaves the state untouched and the match keeps going.
+        self.advance(event.minute)
+        if event.kind == "goal":
+            if event.side == "home":
+                self.home_goals += 1
+                self.home_shape += 1.0
+            else:
+                self.away_goals += 1
+                self.away_shape += 1.0
+        elif event.kind == "red_card":
+            if event.side == "home":
+                self.home_red += 1
+            else:
+                self.away_red += 1
+        elif event.kind == "full_time":
+            self.finished = True
+
+    def forecast(self, max_goals: int = MAX_GOALS) -> InPlayForecast:
+        remaining = 0.0 if self.finished else max(MATCH_MINUTES - self.minute, 0.0) / MATCH_MINUTES
+        home_mult, away_mult = self.multipliers()
+        home_exposure = remaining * home_mult
+        away_exposure = remaining * away_mult
+        home_pmf = _predictive_pmf(self.home_shape, self.home_rate, home_exposure, max_goals)
+        away_pmf = _predictive_pmf(self.away_shape, self.away_rate, away_exposure, max_goals)
+        home_cdf = list(accumulate(home_pmf))
+        home_mass = home_cdf[-1]
+        lead = self.home_goals - self.away_goals
+        # O(max_goals): condition on the away team's remaining goals a; home needs more than a - lead.
+        p_home = p_draw = 0.0
+        for away_goals, p_away_goals in enumerate(away_pmf):
+            threshold = away_goals - lead
+            if threshold < 0:
+                p_home += p_away_goals * home_mass
+            elif threshold <= max_goals:
+                p_home += p_away_goals * (home_mass - home_cdf[threshold])
+                p_draw += p_away_goals * home_pmf[threshold]
+        mass = home_mass * sum(away_pmf)
+        needed = max(0, 3 - self.home_goals - self.away_goals)
+        under = sum(home_pmf[h] * away_pmf[t - h] for t in range(needed) for h in range(t + 1))
+        return InPlayForecast(
+            match_id=self.match_id,
+            minute=self.minute,
+            home_goals=self.home_goals,
+            away_goals=self.away_goals,
+            p_home=p_home / mass,
+            p_draw=p_draw / mass,
+            p_away=(mass - p_home - p_draw) / mass,
+            remaining_home=self.home_shape * home_exposure / self.home_rate,
+            remaining_away=self.away_shape * away_exposure / self.away_rate,
+            p_no_more_goals=home_pmf[0] * away_pmf[0],
+            p_over_2_5=(mass - under) / mass,
+            finished=self.finished,
+        )
+
+
+ForecastSink = Callable[[InPlayForecast], Awaitable[None] | None]
+
+
+class InPlayEngine:
+    def __init__(self, prior_matches: float = INPLAY_PRIOR_MATCHES, max_goals: int = MAX_GOALS) -> None:
+        self.prior_matches = prior_matches
+        self.max_goals = max_goals
+        self.states: dict[str, MatchState] = {}
+        # Ids of matches past full time: feeds keep sending late ticks and duplicates after the whistle.
+        self.finished: set[str] = set()
+        self.events = 0
+        self.ignored = 0
+        self.errors: list[str] = []
+
+    def update(self, event: MatchEvent) -> InPlayForecast | None:
+        """Apply one event and return the match's refreshed forecast; events after full time are ignored (None)."""
+        if event.match_id in self.finished:
+            self.ignored += 1
+            return None
+        state = self.states.get(event.match_id)
+        if event.kind == "kickoff" or state is None:
+            if event.home_rate is None or event.away_rate is None:
+                raise ValueError(f"{event.match_id}: kickoff event with home_rate/away_rate required first")
+            state = MatchState(event.match_id, event.home_rate, event.away_rate, self.prior_matches)
+            self.states[event.match_id] = state
+        if event.kind != "kickoff":
+            state.apply(event)
+        self.events += 1
+        forecast = state.forecast(self.max_goals)
+        if state.finished:
+            del self.states[event.match_id]
+            self.finished.add(event.match_id)
+        return forecast
+
+    async def consume(self, queue: "asyncio.Queue[MatchEvent | None]", sink: ForecastSink | None = None) -> None:
+        while True:
+            event = await queue.get()
+            if event is None:
+                return
+            # One consumer serves every match: a bad event is recorded and skipped, never fatal to the others.
+            try:
+                forecast = self.update(event)
+                if forecast is not None and sink is not None:
+                    result = sink(forecast)
+                    if asyncio.iscoroutine(result):
+                        await result
+            except Exception as exc:
+                self.errors.append(f"{event.match_id} ({event.kind}, minute {event.minute}): {exc}")
+
+    async def run(self, sources: Iterable[AsyncIterator[MatchEvent]], sink: ForecastSink | None = None) -> int:
+        """Merge many event streams (one task each) into a single consumer; returns the number of events."""
+        queue: asyncio.Queue[MatchEvent | None] = asyncio.Queue()
+
+        async def pump(source: AsyncIterator[MatchEvent]) -> None:
+            async for event in source:
+                queue.put_nowait(event)
+
+        consumer = asyncio.create_task(self.consume(queue, sink))
+        await asyncio.gather(*(pump(source) for source in sources))
+        queue.put_nowait(None)
+        await consumer
+        return self.events
+
+
+def _event_minutes(match_id: str, count: int) -> list[float]:
+    # Data has no event times: deterministic uniform minutes per match.
+    if count <= 0:
+        return []
+    rng = np.random.default_rng(zlib.crc32(match_id.encode("utf-8")))
+    return sorted(float(m) for m in rng.uniform(1.0, MATCH_MINUTES, size=count).round(1))
+
+
+async def replay_match(
+    match_id: str,
+    home_rate: float,
+    away_rate: float,
+    home_goals: int,
+    away_goals: int,
+    home_red: int = 0,
+    away_red: int = 0,
+    tick: float = 1.0,
+    seconds_per_minute: float = 0.0,
+) -> AsyncIterator[MatchEvent]:
+    """Replay one finished match as kickoff, minute ticks, goals/red cards at synthetic minutes and full time."""
+    incidents = [(m, "goal", "home") for m in _event_minutes(f"{match_id}:hg", home_goals)]
+    incidents += [(m, "goal", "away") for m in _event_minutes(f"{match_id}:ag", away_goals)]
+    incidents += [(m, "red_card", "home") for m in _event_minutes(f"{match_id}:hr", home_red)]
+    incidents += [(m, "red_card", "away") for m in _event_minutes(f"{match_id}:ar", away_red)]
+    ticks = [(float(m), "tick", None) for m in np.arange(tick, MATCH_MINUTES, tick)] if tick > 0 else []
+    timeline = sorted(incidents + ticks, key=lambda item: (item[0], item[1] == "tick"))
+
+    yield MatchEvent(match_id, 0.0, "kickoff", home_rate=home_rate, away_rate=away_rate)
+    clock = 0.0
+    for minute, kind, side in timeline:
+        # Yield control between events even at full speed, so thousands of replays interleave.
+        await asyncio.sleep((minute - clock) * seconds_per_minute)
+        clock = minute
+        yield MatchEvent(match_id, minute, kind, side)
+    await asyncio.sleep((MATCH_MINUTES - clock) * seconds_per_minute)
+    yield MatchEvent(match_id, float(MATCH_MINUTES), "full_time")
+
+
+def replay_sources(
+    matches: pd.DataFrame,
+    home_rates: np.ndarray,
+    away_rates: np.ndarray,
+    tick: float = 1.0,
+    seconds_per_minute: float = 0.0,
+) -> list[AsyncIterator[MatchEvent]]:
+    """One replay stream per row of `matches` (red cards are used when the columns are present)."""
+    no_cards = np.zeros(len(matches), dtype=np.int64)
+    home_red = matches["home_red"].fillna(0).to_numpy(dtype=np.int64) if "home_red" in matches else no_cards
+    away_red = matches["away_red"].fillna(0).to_numpy(dtype=np.int64) if "away_red" in matches else no_cards
+    return [
+        replay_match(
+            str(match_id),
+            float(home_rate),
+            float(away_rate),
+            int(home_goals),
+            int(away_goals),
+            int(hr),
+            int(ar),
+            tick=tick,
+            seconds_per_minute=seconds_per_minute,
+        )
+        for match_id, home_rate, away_rate, home_goals, away_goals, hr, ar in zip(
+            matches["match_id"].astype(str),
+            home_rates,
+            away_rates,
+            matches["home_goals"].to_numpy(),
+            matches["away_goals"].to_numpy(),
+            home_red,
+            away_red,
+        )
+    ]
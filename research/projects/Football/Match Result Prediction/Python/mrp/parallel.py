@@ -0,0 +1,153 @@
+"""Multi-league predictions: league shards of one shared Arrow buffer, fitted in a process pool."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .config import MultiLeagueConfig
+from .constants import MODEL_VERSION, MODES
+from .data import data_source_dir
+from .prediction import PredictionResult, _team_names, load_frames, predict_league, prepare_frames
+
+try:
+    import pyarrow as pa
+except Exception:  # pragma: no cover - optional dependency
+    pa = None
+
+# Per worker process: the attached segment, the Arrow tables mapped over it and team names.
+_WORKER: dict[str, object] = {}
+
+
+@dataclass(frozen=True)
+class SharedFrames:
+    """Location of the matches/fixtures Arrow streams in a shared memory segment and each league's row range."""
+
+    name: str
+    sizes: tuple[int, int]
+    ranges: dict[str, tuple[int, int, int, int]]
+
+
+def _league_ranges(frame: pd.DataFrame, leagues: list[str]) -> tuple[pd.DataFrame, dict[str, tuple[int, int]]]:
+    # Stable sort by league keeps date order inside each league, so every shard is one contiguous slice.
+    codes = pd.Categorical(frame["league"].astype(str), categories=leagues).codes
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(leagues) + 1))
+    ranges = {league: (int(bounds[i]), int(bounds[i + 1] - bounds[i])) for i, league in enumerate(leagues)}
+    return frame.iloc[order].reset_index(drop=True), ranges
+
+
+def _stream_size(table: "pa.Table") -> int:
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.size()
+
+
+def share_frames(
+    matches: pd.DataFrame, fixtures: pd.DataFrame, leagues: list[str]
+) -> tuple[shared_memory.SharedMemory, SharedFrames]:
+    """Write both tables, sorted by league, as Arrow IPC streams straight into one shared memory segment."""
+    if pa is None:
+        raise SystemExit("pyarrow is not installed. Install with: pip install pyarrow")
+    matches, match_ranges = _league_ranges(matches, leagues)
+    fixtures, fixture_ranges = _league_ranges(fixtures, leagues)
+    tables = [pa.Table.from_pandas(frame, preserve_index=False) for frame in (matches, fixtures)]
+    sizes = tuple(_stream_size(table) for table in tables)
+    segment = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+    offset = 0
+    for table, size in zip(tables, sizes):
+        sink = pa.FixedSizeBufferWriter(pa.py_buffer(segment.buf[offset:offset + size]))
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        offset += size
+    ranges = {league: (*match_ranges[league], *fixture_ranges[league]) for league in leagues}
+    return segment, SharedFrames(segment.name, sizes, ranges)
+
+
+def _map_tables(buffer: memoryview, sizes: tuple[int, int]) -> tuple["pa.Table", "pa.Table"]:
+    # Zero-copy: record batches reference the shared buffer; only a league slice is ever converted.
+    matches = pa.ipc.open_stream(pa.py_buffer(buffer[:sizes[0]])).read_all()
+    fixtures = pa.ipc.open_stream(pa.py_buffer(buffer[sizes[0]:sizes[0] + sizes[1]])).read_all()
+    return matches, fixtures
+
+
+def _init_worker(shared: SharedFrames, names: dict[str, str]) -> None:
+    segment = shared_memory.SharedMemory(name=shared.name)
+    _WORKER.update(segment=segment, tables=_map_tables(segment.buf, shared.sizes), shared=shared, names=names)
+
+
+def _predict_shard(config: MultiLeagueConfig, league: str) -> PredictionResult:
+    shared: SharedFrames = _WORKER["shared"]
+    matches, fixtures = _WORKER["tables"]
+    match_start, match_rows, fixture_start, fixture_rows = shared.ranges[league]
+    return predict_league(
+        config.league_config(league),
+        matches.slice(match_start, match_rows).to_pandas(),
+        fixtures.slice(fixture_start, fixture_rows).to_pandas(),
+        _WORKER["names"],
+    )
+
+
+def merge_results(leagues: list[str], results: list[PredictionResult], notes: list[str]) -> PredictionResult:
+    rows: list[dict[str, str]] = []
+    merged = list(notes)
+    for league, result in zip(leagues, results):
+        rows.extend({"league": league, **row} for row in result.rows)
+        merged.extend(f"[{league}] {note}" for note in result.notes)
+    return PredictionResult(MODEL_VERSION, rows, merged)
+
+
+def run_multi_league(config: MultiLeagueConfig) -> PredictionResult:
+    """Predict the same round for several leagues, one per-league model per pool task, merged in league order."""
+    if config.mode not in MODES:
+        raise ValueError(f"mode must be one of {', '.join(MODES)}")
+    leagues = list(dict.fromkeys(str(league) for league in config.leagues))
+    if not leagues:
+        raise ValueError("leagues must not be empty")
+    notes: list[str] = []
+    data_dir = data_source_dir(config.data_source)
+    try:
+        matches, fixtures = load_frames(data_dir, leagues, config.season)
+    except FileNotFoundError as exc:
+        return PredictionResult(MODEL_VERSION, [], [f"Donnees football introuvables: {exc}"])
+    # One read, one alias pass and one round numbering for all leagues.
+    matches, fixtures = prepare_frames(data_dir, matches, fixtures, notes)
+    present = set(matches["league"].astype(str).unique())
+    for league in leagues:
+        if league not in present:
+            notes.append(f"Aucun match historique pour la ligue {league}.")
+    leagues = [league for league in leagues if league in present]
+    if not leagues:
+        return PredictionResult(MODEL_VERSION, [], notes)
+
+    names = _team_names(data_dir)
+    workers = max(1, min(config.workers or os.cpu_count() or 1, len(leagues)))
+    notes.append(f"{len(leagues)} ligues sur {workers} processus.")
+    if workers == 1:
+        league_values = matches["league"].astype(str).to_numpy()
+        fixture_values = fixtures["league"].astype(str).to_numpy()
+        results = [
+            predict_league(
+                config.league_config(league),
+                matches.loc[league_values == league].reset_index(drop=True),
+                fixtures.loc[fixture_values == league].reset_index(drop=True),
+                names,
+            )
+            for league in leagues
+        ]
+        return merge_results(leagues, results, notes)
+
+    segment, shared = share_frames(matches, fixtures, leagues)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(shared, names)) as executor:
+            results = list(executor.map(_predict_shard, [config] * len(leagues), leagues))
+    finally:
+        segment.close()
+        segment.unlink()
+    return merge_results(leagues, results, notes)
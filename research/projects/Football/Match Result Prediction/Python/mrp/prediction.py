@@ -1,10 +1,24 @@
-"""Prediction orchestration (placeholder implementation)."""
+"""Prediction orchestration: Elo and form 1X2 or Dixon-Coles scoreline probabilities per fixture."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
 
-from .config import PredictionConfig
+import numpy as np
+import pandas as pd
+
+from .aliases import load_alias_index, resolve_team_columns
+from .config import MultiLeagueConfig, PredictionConfig
+from .constants import MAX_GOALS, MIN_TRAIN_MATCHES, MODEL_VERSION, MODES
+from .data import data_source_dir, load_fixtures, load_matches, load_teams, with_rounds
+from .dixon_coles import fit_dixon_coles, previous_fit, store_fit, time_decay_weights
+from .features import form_differences, load_form, save_form
+from .ratings import EloEngine, load_engine, save_engine
+from .training import fit_outcome_model, match_outcomes
+
+OUTCOME_LABELS = np.array(["1", "X", "2"])
 
 
 @dataclass(frozen=True)
@@ -14,12 +28,206 @@ class PredictionResult:
     notes: list[str]
 
 
-def run_prediction(config: PredictionConfig) -> PredictionResult:
-    _ = config
-    return PredictionResult(
-        version="0.1.0",
-        rows=[],
-        notes=[
-            "Model not implemented yet. Populate mrp/data.py and mrp/training.py once research is complete."
-        ],
+def prediction_payload(config: PredictionConfig | MultiLeagueConfig, result: PredictionResult) -> dict[str, object]:
+    return {
+        "version": result.version,
+        "sport": "Football",
+        "project": "Match Result Prediction",
+        "config": asdict(config),
+        "rows": result.rows,
+        "notes": result.notes,
+        "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
+
+
+def resolve_data_dir(config: PredictionConfig) -> Path:
+    return data_source_dir(config.data_source)
+
+
+def _train_seasons(config: PredictionConfig) -> list[int]:
+    if config.train_seasons:
+        return list(config.train_seasons)
+    return [config.season - 2, config.season - 1, config.season]
+
+
+def _target_fixtures(config: PredictionConfig, matches: pd.DataFrame, fixtures: pd.DataFrame) -> pd.DataFrame:
+    target = fixtures.loc[
+        (fixtures["season"] == config.season).to_numpy() & (fixtures["round_number"] == config.round_number).to_numpy()
+    ]
+    if target.empty:
+        # Round already played: replay it from matches without using its results.
+        target = matches.loc[
+            (matches["season"] == config.season).to_numpy() & (matches["round_number"] == config.round_number).to_numpy()
+        ]
+    return target.reset_index(drop=True)
+
+
+def _training_matches(config: PredictionConfig, matches: pd.DataFrame, engine: EloEngine) -> pd.DataFrame:
+    before = (matches["season"] < config.season) | (
+        (matches["season"] == config.season) & (matches["round_number"] < config.round_number)
     )
+    train = matches.loc[before.to_numpy() & matches["season"].isin(_train_seasons(config)).to_numpy()]
+    pre = engine.pre_match_ratings(train["match_id"])
+    diff = (pre[:, 0] - pre[:, 1]) / engine.params.scale if len(pre) else np.zeros(0)
+    return train.assign(diff=diff).dropna(subset=["diff"]).reset_index(drop=True)
+
+
+def _resolve_team_names(data_dir: Path, frames: list[pd.DataFrame], notes: list[str]) -> list[pd.DataFrame]:
+    # Sources that spell teams instead of using team ids go through the alias index.
+    try:
+        index = load_alias_index(data_dir)
+    except (FileNotFoundError, ValueError):
+        return frames
+    resolved = []
+    for frame in frames:
+        values = pd.unique(pd.concat([frame["home_team_id"].astype(str), frame["away_team_id"].astype(str)]))
+        if (index.team_ids.get_indexer(values) >= 0).all():
+            resolved.append(frame)
+            continue
+        frame, unresolved = resolve_team_columns(frame, index)
+        if not unresolved.empty:
+            names = ", ".join(sorted(unresolved["name"].unique())[:5])
+            notes.append(f"Alias equipes: {unresolved['name'].nunique()} noms non resolus ({names}).")
+        resolved.append(frame)
+    return resolved
+
+
+def _team_names(data_dir: Path) -> dict[str, str]:
+    try:
+        teams = load_teams(data_dir, columns=["team_id", "team_name"])
+    except (FileNotFoundError, ValueError):
+        return {}
+    return dict(zip(teams["team_id"].astype(str), teams["team_name"].astype(str)))
+
+
+def _fmt(value: float, digits: int = 3) -> str:
+    return f"{value:.{digits}f}"
+
+
+def load_frames(data_dir: Path, leagues: list[str], season: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Matches of `leagues` and their `season` fixtures (empty when there is no fixtures table)."""
+    matches = load_matches(data_dir, leagues=leagues)
+    try:
+        fixtures = load_fixtures(data_dir, leagues=leagues, seasons=[season])
+    except FileNotFoundError:
+        fixtures = matches.iloc[0:0]
+    return matches, fixtures
+
+
+def prepare_frames(
+    data_dir: Path, matches: pd.DataFrame, fixtures: pd.DataFrame, notes: list[str]
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    matches, fixtures = _resolve_team_names(data_dir, [matches, fixtures], notes)
+    return with_rounds(matches, fixtures)
+
+
+def run_prediction(config: PredictionConfig) -> PredictionResult:
+    if config.mode not in MODES:
+        raise ValueError(f"mode must be one of {', '.join(MODES)}")
+    notes: list[str] = []
+    data_dir = resolve_data_dir(config)
+    try:
+        matches, fixtures = load_frames(data_dir, [config.league], config.season)
+    except FileNotFoundError as exc:
+        return PredictionResult(MODEL_VERSION, [], [f"Donnees football introuvables: {exc}"])
+    if matches.empty:
+        return PredictionResult(MODEL_VERSION, [], [f"Aucun match historique pour la ligue {config.league}."])
+    matches, fixtures = prepare_frames(data_dir, matches, fixtures, notes)
+    return predict_league(config, matches, fixtures, _team_names(data_dir), notes)
+
+
+def predict_league(
+    config: PredictionConfig,
+    matches: pd.DataFrame,
+    fixtures: pd.DataFrame,
+    names: dict[str, str],
+    notes: list[str] | None = None,
+) -> PredictionResult:
+    """Predict one league round from its prepared (resolved, round-numbered) matches and fixtures."""
+    notes = list(notes or [])
+    engine = load_engine(config.league, cache_dir=config.cache_dir)
+    applied = engine.advance(matches)
+    if applied:
+        save_engine(engine, config.cache_dir)
+    notes.append(f"Elo: {applied} rounds appliques (etat en cache jusqu'a {engine.position}).")
+    form = load_form(config.league, cache_dir=config.cache_dir)
+    refreshed = form.update(matches)
+    if refreshed:
+        save_form(form, config.cache_dir)
+    notes.append(f"Forme ({form.window} derniers matchs): {refreshed} equipes recalculees.")
+
+    target = _target_fixtures(config, matches, fixtures)
+    if target.empty:
+        notes.append(f"Aucun match pour {config.league} saison {config.season} round {config.round_number}.")
+        return PredictionResult(MODEL_VERSION, [], notes)
+
+    train = _training_matches(config, matches, engine)
+    if len(train) < MIN_TRAIN_MATCHES:
+        notes.append(f"Historique insuffisant ({len(train)} matchs < {MIN_TRAIN_MATCHES}).")
+        return PredictionResult(MODEL_VERSION, [], notes)
+    notes.append(f"Entrainement sur {len(train)} matchs (saisons {', '.join(map(str, _train_seasons(config)))}).")
+
+    home_elo = engine.team_ratings(target["home_team_id"], config.season, config.round_number)
+    away_elo = engine.team_ratings(target["away_team_id"], config.season, config.round_number)
+    diff = (home_elo - away_elo) / engine.params.scale
+    target_form = form.features(target)
+    home_goals = train["home_goals"].to_numpy()
+    away_goals = train["away_goals"].to_numpy()
+
+    extra: dict[str, list[str]] = {}
+    if config.mode == "match_result":
+        train_features = np.column_stack([train["diff"].to_numpy(), form_differences(form.features(train))])
+        model = fit_outcome_model(train_features, match_outcomes(home_goals, away_goals))
+        probabilities = model.predict(np.column_stack([diff, form_differences(target_form)]))
+    else:
+        warm_start = previous_fit(config.league, config.cache_dir)
+        model = fit_dixon_coles(
+            train["home_team_id"],
+            train["away_team_id"],
+            home_goals,
+            away_goals,
+            weights=time_decay_weights(train["date"], pd.Timestamp(target["date"].min())),
+            warm_start=warm_start,
+        )
+        store_fit(config.league, model, config.cache_dir)
+        notes.append(
+            f"Dixon-Coles: {model.iterations} iterations"
+            f"{' (warm start)' if warm_start is not None else ''}, rho={model.rho:.3f}."
+        )
+        distribution = model.distribution(target["home_team_id"], target["away_team_id"], MAX_GOALS)
+        probabilities = distribution.outcome
+        best_home, best_away, best_p = distribution.most_likely()
+        extra = {
+            "xg_home": [_fmt(v, 2) for v in distribution.expected_home_goals],
+            "xg_away": [_fmt(v, 2) for v in distribution.expected_away_goals],
+            "scoreline": [f"{h}-{a}" for h, a in zip(best_home, best_away)],
+            "p_scoreline": [_fmt(v) for v in best_p],
+            "p_over_2_5": [_fmt(v) for v in distribution.p_over[2.5]],
+            "p_btts": [_fmt(v) for v in distribution.p_btts],
+        }
+
+    home_form = target_form["home_form_points"].to_numpy()
+    away_form = target_form["away_form_points"].to_numpy()
+    picks = OUTCOME_LABELS[probabilities.argmax(axis=1)]
+    rows: list[dict[str, str]] = []
+    for idx, fixture in enumerate(target.itertuples(index=False)):
+        home_id = str(fixture.home_team_id)
+        away_id = str(fixture.away_team_id)
+        row = {
+            "match_id": str(fixture.match_id),
+            "date": pd.Timestamp(fixture.date).strftime("%Y-%m-%d"),
+            "home_team": names.get(home_id, home_id),
+            "away_team": names.get(away_id, away_id),
+            "home_elo": _fmt(home_elo[idx], 1),
+            "away_elo": _fmt(away_elo[idx], 1),
+            "home_form": _fmt(home_form[idx], 2),
+            "away_form": _fmt(away_form[idx], 2),
+            "p_home": _fmt(probabilities[idx, 0]),
+            "p_draw": _fmt(probabilities[idx, 1]),
+            "p_away": _fmt(probabilities[idx, 2]),
+            "prediction": str(picks[idx]),
+        }
+        for column, values in extra.items():
+            row[column] = values[idx]
+        rows.append(row)
+    return PredictionResult(MODEL_VERSION, rows, notes)
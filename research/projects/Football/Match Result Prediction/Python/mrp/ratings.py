@@ -0,0 +1,212 @@
+"""Incremental Elo team ratings over match history, checkpointed per season and round."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .utils import LRUCache, load_pickle, safe_name, save_pickle
+
+_ENGINES = LRUCache(64)
+
+
+@dataclass(frozen=True)
+class EloParams:
+    k: float = 20.0
+    home_advantage: float = 60.0
+    scale: float = 400.0
+    initial: float = 1500.0
+    season_carry: float = 0.75
+
+    @property
+    def key(self) -> str:
+        raw = ",".join(f"{k}={v}" for k, v in sorted(asdict(self).items()))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass
+class RoundCheckpoint:
+    ratings: np.ndarray
+    played: np.ndarray
+    digest: int
+
+
+def goal_difference_multiplier(goal_diff: np.ndarray) -> np.ndarray:
+    gd = np.abs(goal_diff).astype(np.float64)
+    return np.where(gd <= 1, 1.0, np.where(gd == 2, 1.5, (11.0 + gd) / 8.0))
+
+
+def expected_home_score(home: np.ndarray, away: np.ndarray, params: EloParams) -> np.ndarray:
+    return 1.0 / (1.0 + 10.0 ** (-(home + params.home_advantage - away) / params.scale))
+
+
+def round_digests(matches: pd.DataFrame) -> pd.Series:
+    # Order-independent fingerprint of each round's results, to detect rewritten history.
+    hashed = pd.util.hash_pandas_object(
+        matches[["match_id", "home_team_id", "away_team_id", "home_goals", "away_goals"]], index=False
+    )
+    return hashed.groupby([matches["season"].astype(int), matches["round_number"].astype(int)]).sum()
+
+
+@dataclass
+class EloEngine:
+    league: str
+    params: EloParams = field(default_factory=EloParams)
+    teams: pd.Index = field(default_factory=lambda: pd.Index([], dtype=object))
+    ratings: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    played: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    position: tuple[int, int] | None = None
+    checkpoints: dict[tuple[int, int], RoundCheckpoint] = field(default_factory=dict)
+    pre_match: dict[str, tuple[float, float]] = field(default_factory=dict)
+
+    def _team_codes(self, names: pd.Series) -> np.ndarray:
+        names = names.astype(str)
+        new = pd.Index(names.unique()).difference(self.teams)
+        if len(new):
+            self.teams = self.teams.append(new)
+            self.ratings = np.concatenate([self.ratings, np.full(len(new), self.params.initial)])
+            self.played = np.concatenate([self.played, np.zeros(len(new), dtype=bool)])
+        return self.teams.get_indexer(names)
+
+    def _regress(self, ratings: np.ndarray, played: np.ndarray) -> None:
+        # Between seasons ratings move part of the way back to the league mean.
+        if played.any():
+            mean = ratings[played].mean()
+            ratings[played] = mean + self.params.season_carry * (ratings[played] - mean)
+
+    def _restore(self, checkpoint: RoundCheckpoint) -> tuple[np.ndarray, np.ndarray]:
+        extra = len(self.teams) - len(checkpoint.ratings)
+        ratings = np.concatenate([checkpoint.ratings, np.full(extra, self.params.initial)])
+        played = np.concatenate([checkpoint.played, np.zeros(extra, dtype=bool)])
+        return ratings, played
+
+    def _rollback(self, position: tuple[int, int] | None) -> None:
+        stale = [key for key in self.checkpoints if position is None or key > position]
+        for key in stale:
+            del self.checkpoints[key]
+        if position is None:
+            self.ratings = np.full(len(self.teams), self.params.initial)
+            self.played = np.zeros(len(self.teams), dtype=bool)
+            self.pre_match = {}
+        else:
+            self.ratings, self.played = self._restore(self.checkpoints[position])
+        self.position = position
+
+    def apply_round(
+        self,
+        season: int,
+        round_number: int,
+        home: np.ndarray,
+        away: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        digest: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Apply one round of integer-coded results; returns the pre-match home/away ratings."""
+        if self.position is not None and season > self.position[0]:
+            self._regress(self.ratings, self.played)
+        # Teams play at most once per round: the whole round updates in one vectorized step.
+        home_rating = self.ratings[home]
+        away_rating = self.ratings[away]
+        expected = expected_home_score(home_rating, away_rating, self.params)
+        actual = np.where(home_goals > away_goals, 1.0, np.where(home_goals == away_goals, 0.5, 0.0))
+        delta = self.params.k * goal_difference_multiplier(home_goals - away_goals) * (actual - expected)
+        np.add.at(self.ratings, home, delta)
+        np.add.at(self.ratings, away, -delta)
+        self.played[home] = True
+        self.played[away] = True
+        self.position = (season, round_number)
+        self.checkpoints[self.position] = RoundCheckpoint(self.ratings.copy(), self.played.copy(), digest)
+        return home_rating, away_rating
+
+    def advance(self, matches: pd.DataFrame) -> int:
+        """Apply rounds not yet in the state; rewritten rounds are replayed from the last valid checkpoint."""
+        if matches.empty:
+            return 0
+        digests = {key: int(value) for key, value in round_digests(matches).items()}
+        valid: tuple[int, int] | None = None
+        for key in sorted(set(digests) | set(self.checkpoints)):
+            checkpoint = self.checkpoints.get(key)
+            if checkpoint is None or digests.get(key) != checkpoint.digest:
+                break
+            valid = key
+        if valid != self.position:
+            self._rollback(valid)
+
+        seasons = matches["season"].to_numpy(dtype=np.int64)
+        rounds = matches["round_number"].to_numpy(dtype=np.int64)
+        keys = seasons * 1000 + rounds
+        mask = keys > (valid[0] * 1000 + valid[1] if valid else -1)
+        if not mask.any():
+            return 0
+        # Convert once to integer-coded arrays, then walk the rounds in order.
+        order = np.argsort(keys[mask], kind="stable")
+        pending = matches.loc[mask].iloc[order]
+        keys = keys[mask][order]
+        home = self._team_codes(pending["home_team_id"])
+        away = self._team_codes(pending["away_team_id"])
+        home_goals = pending["home_goals"].to_numpy(dtype=np.int16)
+        away_goals = pending["away_goals"].to_numpy(dtype=np.int16)
+        pre_home = np.empty(len(pending))
+        pre_away = np.empty(len(pending))
+        bounds = np.concatenate([[0], np.flatnonzero(np.diff(keys)) + 1, [len(keys)]])
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            season, round_number = divmod(int(keys[start]), 1000)
+            pre_home[start:stop], pre_away[start:stop] = self.apply_round(
+                season,
+                round_number,
+                home[start:stop],
+                away[start:stop],
+                home_goals[start:stop],
+                away_goals[start:stop],
+                digests[(season, round_number)],
+            )
+        self.pre_match.update(zip(pending["match_id"].astype(str), zip(pre_home.tolist(), pre_away.tolist())))
+        return len(bounds) - 1
+
+    def ratings_before(self, season: int, round_number: int) -> np.ndarray:
+        earlier = [key for key in self.checkpoints if key < (season, round_number)]
+        if not earlier:
+            return np.full(len(self.teams), self.params.initial)
+        last = max(earlier)
+        ratings, played = self._restore(self.checkpoints[last])
+        if last[0] < season:
+            self._regress(ratings, played)
+        return ratings
+
+    def team_ratings(self, names: pd.Series, season: int, round_number: int) -> np.ndarray:
+        ratings = self.ratings_before(season, round_number)
+        codes = self.teams.get_indexer(names.astype(str))
+        out = np.full(len(codes), self.params.initial)
+        known = codes >= 0
+        out[known] = ratings[codes[known]]
+        return out
+
+    def pre_match_ratings(self, match_ids: pd.Series) -> np.ndarray:
+        missing = (np.nan, np.nan)
+        return np.array([self.pre_match.get(m, missing) for m in match_ids.astype(str)], dtype=np.float64)
+
+
+def _engine_path(cache_dir: str | Path, league: str, params: EloParams) -> Path:
+    return Path(cache_dir) / "ratings" / f"elo-{safe_name(league)}-{params.key}.pkl"
+
+
+def load_engine(league: str, params: EloParams | None = None, cache_dir: str | Path | None = None) -> EloEngine:
+    params = params or EloParams()
+    key = (league, params.key, str(cache_dir))
+    engine = _ENGINES.get(key)
+    if engine is None and cache_dir:
+        engine = load_pickle(_engine_path(cache_dir, league, params))
+    if engine is None:
+        engine = EloEngine(league=league, params=params)
+    _ENGINES.put(key, engine)
+    return engine
+
+
+def save_engine(engine: EloEngine, cache_dir: str | Path | None) -> None:
+    if cache_dir:
+        save_pickle(_engine_path(cache_dir, engine.league, engine.params), engine)
@@ -0,0 +1,110 @@
+"""Batched scoreline probability tensors and their betting-market marginals."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import lgamma
+
+import numpy as np
+
+from .constants import MAX_GOALS, OVER_UNDER_LINES
+
+
+def poisson_pmf(rates: np.ndarray, max_goals: int = MAX_GOALS) -> np.ndarray:
+    """(n, max_goals + 1) Poisson probabilities for each rate."""
+    rates = np.maximum(np.asarray(rates, dtype=np.float64), 1e-9)[:, None]
+    goals = np.arange(max_goals + 1, dtype=np.float64)
+    log_factorial = np.array([lgamma(k + 1.0) for k in range(max_goals + 1)])
+    return np.exp(goals * np.log(rates) - rates - log_factorial)
+
+
+def scoreline_matrices(home_rates: np.ndarray, away_rates: np.ndarray, max_goals: int = MAX_GOALS) -> np.ndarray:
+    """(n, max_goals + 1, max_goals + 1) independent-Poisson scoreline probabilities (home x away)."""
+    return poisson_pmf(home_rates, max_goals)[:, :, None] * poisson_pmf(away_rates, max_goals)[:, None, :]
+
+
+def apply_low_score_correction(
+    matrices: np.ndarray, home_rate: np.ndarray, away_rate: np.ndarray, rho: float
+) -> np.ndarray:
+    """Dixon-Coles tau on the 0-0, 0-1, 1-0 and 1-1 cells, in place."""
+    matrices[:, 0, 0] *= 1.0 - home_rate * away_rate * rho
+    matrices[:, 0, 1] *= 1.0 + home_rate * rho
+    matrices[:, 1, 0] *= 1.0 + away_rate * rho
+    matrices[:, 1, 1] *= 1.0 - rho
+    return matrices
+
+
+@lru_cache(maxsize=16)
+def _marginal_masks(max_goals: int, lines: tuple[float, ...]) -> np.ndarray:
+    # One weight grid per marginal: total, home, draw, away, home goals, away goals, btts, over lines.
+    home_goals, away_goals = np.indices((max_goals + 1, max_goals + 1), dtype=np.float64)
+    masks = [
+        np.ones_like(home_goals),
+        (home_goals > away_goals).astype(np.float64),
+        (home_goals == away_goals).astype(np.float64),
+        (home_goals < away_goals).astype(np.float64),
+        home_goals,
+        away_goals,
+        ((home_goals > 0) & (away_goals > 0)).astype(np.float64),
+    ]
+    masks.extend((home_goals + away_goals > line).astype(np.float64) for line in lines)
+    stacked = np.stack(masks)
+    stacked.setflags(write=False)
+    return stacked
+
+
+@dataclass(frozen=True)
+class ScorelineDistribution:
+    matrices: np.ndarray
+    p_home: np.ndarray
+    p_draw: np.ndarray
+    p_away: np.ndarray
+    expected_home_goals: np.ndarray
+    expected_away_goals: np.ndarray
+    p_btts: np.ndarray
+    p_over: dict[float, np.ndarray]
+
+    @property
+    def outcome(self) -> np.ndarray:
+        """(n, 3) home/draw/away probabilities."""
+        return np.column_stack([self.p_home, self.p_draw, self.p_away])
+
+    def p_under(self, line: float) -> np.ndarray:
+        return 1.0 - self.p_over[line]
+
+    def most_likely(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        flat = self.matrices.reshape(len(self.matrices), -1)
+        best = flat.argmax(axis=1)
+        home, away = np.divmod(best, self.matrices.shape[2])
+        return home, away, flat[np.arange(len(flat)), best]
+
+
+def scoreline_distribution(
+    home_rates: np.ndarray,
+    away_rates: np.ndarray,
+    rho: float = 0.0,
+    max_goals: int = MAX_GOALS,
+    lines: tuple[float, ...] = OVER_UNDER_LINES,
+) -> ScorelineDistribution:
+    """Scoreline tensor for every fixture of a round and all marginals in one contraction."""
+    home_rates = np.asarray(home_rates, dtype=np.float64)
+    away_rates = np.asarray(away_rates, dtype=np.float64)
+    matrices = scoreline_matrices(home_rates, away_rates, max_goals)
+    if rho:
+        apply_low_score_correction(matrices, home_rates, away_rates, rho)
+    sums = np.einsum("nij,kij->nk", matrices, _marginal_masks(max_goals, tuple(lines)))
+    # Renormalise over the truncated grid (and the tau correction).
+    total = sums[:, 0]
+    matrices /= total[:, None, None]
+    sums = sums / total[:, None]
+    return ScorelineDistribution(
+        matrices=matrices,
+        p_home=sums[:, 1],
+        p_draw=sums[:, 2],
+        p_away=sums[:, 3],
+        expected_home_goals=sums[:, 4],
+        expected_away_goals=sums[:, 5],
+        p_btts=sums[:, 6],
+        p_over={line: sums[:, 7 + idx] for idx, line in enumerate(lines)},
+    )
@@ -1,3 +1,76 @@
-"""Model training routines (placeholder)."""
+"""Model fitting on rating and form differences: ordered-logit 1X2 probabilities."""
 
-# TODO: Implement model training and evaluation once research is validated.
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def minimize_lbfgs(fun, x0: np.ndarray, bounds: list[tuple[float | None, float | None]] | None = None):
+    """scipy L-BFGS-B on a `fun` returning (value, gradient); shared by every likelihood fit in mrp."""
+    try:
+        from scipy.optimize import minimize
+    except Exception:
+        raise SystemExit("scipy is not installed. Install with: pip install scipy")
+    return minimize(fun, x0, jac=True, method="L-BFGS-B", bounds=bounds)
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+def match_outcomes(home_goals: np.ndarray, away_goals: np.ndarray) -> np.ndarray:
+    """0 = away win, 1 = draw, 2 = home win."""
+    return (np.sign(np.asarray(home_goals, dtype=np.int16) - np.asarray(away_goals, dtype=np.int16)) + 1).astype(np.int8)
+
+
+def _design(features: np.ndarray) -> np.ndarray:
+    features = np.asarray(features, dtype=np.float64)
+    return features[:, None] if features.ndim == 1 else features
+
+
+@dataclass(frozen=True)
+class OutcomeModel:
+    coefficients: np.ndarray
+    away_cut: float
+    draw_cut: float
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """(n, 3) probabilities ordered home, draw, away; `features` columns match the fit (Elo diff first)."""
+        z = _design(features) @ self.coefficients
+        p_away = _sigmoid(self.away_cut - z)
+        p_not_home = _sigmoid(self.draw_cut - z)
+        return np.column_stack([1.0 - p_not_home, p_not_home - p_away, p_away])
+
+
+def fit_outcome_model(features: np.ndarray, outcomes: np.ndarray) -> OutcomeModel:
+    x = _design(features)
+    k = x.shape[1]
+    outcomes = np.asarray(outcomes)
+    counts = np.bincount(outcomes, minlength=3).astype(np.float64) + 1.0
+    cum = np.cumsum(counts)[:2] / counts.sum()
+    cuts = [np.log(cum[0] / (1 - cum[0])), np.log(np.log(cum[1] / (1 - cum[1])) - np.log(cum[0] / (1 - cum[0])))]
+    start = np.concatenate([[1.0], np.zeros(k - 1), cuts])
+
+    def nll(theta: np.ndarray) -> tuple[float, np.ndarray]:
+        # Cut points are parametrised as c1 and c1 + exp(g) to keep them ordered.
+        beta, c1, g = theta[:k], theta[k], theta[k + 1]
+        c2 = c1 + np.exp(g)
+        z = x @ beta
+        f1 = _sigmoid(c1 - z)
+        f2 = _sigmoid(c2 - z)
+        probs = np.where(outcomes == 0, f1, np.where(outcomes == 1, f2 - f1, 1.0 - f2))
+        probs = np.maximum(probs, 1e-12)
+        d1 = f1 * (1 - f1)
+        d2 = f2 * (1 - f2)
+        # d log p / d c1, d c2 and d z for each outcome.
+        dc1 = np.where(outcomes == 0, d1, np.where(outcomes == 1, -d1, 0.0)) / probs
+        dc2 = np.where(outcomes == 1, d2, np.where(outcomes == 2, -d2, 0.0)) / probs
+        dz = -(dc1 + dc2)
+        grad = -np.concatenate([x.T @ dz, [dc1.sum() + dc2.sum(), (dc2 * np.exp(g)).sum()]])
+        return float(-np.log(probs).sum()), grad
+
+    result = minimize_lbfgs(nll, start)
+    beta, c1, g = result.x[:k], result.x[k], result.x[k + 1]
+    return OutcomeModel(coefficients=beta, away_cut=float(c1), draw_cut=float(c1 + np.exp(g)))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Hot-path benchmarks at several history sizes; JSON results and regression comparison."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+
+from mrp.benchmarks import CASES, DEFAULT_THRESHOLD, LEAGUES, compare_results, run_benchmarks
+
+
+def parse_csv_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_comparison(rows: list[dict[str, object]]) -> None:
+    if not rows:
+        print("Aucun cas commun entre les deux resultats.")
+        return
+    width = max(len(str(row["case"])) for row in rows)
+    for row in rows:
+        flag = {"regression": "REGRESSION", "improvement": "mieux"}.get(str(row["status"]), "")
+        print(
+            f"{row['case']:<{width}}  {row['seasons']:>3} saisons  "
+            f"{row['baseline_ms']:>10.2f} -> {row['current_ms']:>10.2f} ms  x{row['ratio']:<6}  {flag}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Match Result Prediction hot-path benchmarks")
+    parser.add_argument("--sizes", default="1,5,20", help="Nombre de saisons d'historique (ex: 1,5,20)")
+    parser.add_argument("--cases", default=None, help="Cas a executer (defaut: tous)")
+    parser.add_argument("--leagues", type=int, default=LEAGUES, help="Nombre de ligues synthetiques")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output-path", default=None, help="Fichier JSON des resultats")
+    parser.add_argument("--baseline", default=None, help="JSON de reference: compare apres execution")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        default=None,
+        help="Compare deux fichiers JSON sans rien executer",
+    )
+    parser.add_argument("--threshold", type=float, default=None, help="Ralentissement tolere (defaut 0.10 = +10%%)")
+    parser.add_argument("--list", action="store_true", help="Liste les cas disponibles")
+    args = parser.parse_args()
+
+    threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+    if args.list:
+        for case in CASES:
+            print(case.name)
+        return
+    if args.compare:
+        rows = compare_results(load_results(args.compare[0]), load_results(args.compare[1]), threshold)
+        print_comparison(rows)
+        sys.exit(1 if any(row["status"] == "regression" for row in rows) else 0)
+
+    def progress(record: dict[str, object]) -> None:
+        print(
+            f"{record['case']:<34} {record['seasons']:>3} saisons  "
+            f"{record['median_ms']:>10.2f} ms  (min {record['min_ms']:.2f})",
+            flush=True,
+        )
+
+    payload = run_benchmarks(
+        sizes=tuple(int(size) for size in parse_csv_list(args.sizes)),
+        repeat=args.repeat,
+        cases=parse_csv_list(args.cases) if args.cases else None,
+        leagues=args.leagues,
+        progress=progress,
+    )
+    payload["generated_at"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    if args.output_path:
+        with open(args.output_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        rows = compare_results(load_results(args.baseline), payload, threshold)
+        print()
+        print_comparison(rows)
+        if any(row["status"] == "regression" for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Betting backtest: walk-forward 1X2 probabilities staked against bookmaker odds (flat or fractional Kelly)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from mrp.betting import IMPLIED_METHODS, STAKING_METHODS, BettingConfig, run_betting_backtest
+from mrp.constants import KELLY_FRACTION, MAX_KELLY_STAKE
+
+
+def parse_years(value: str) -> list[int]:
+    years: set[int] = set()
+    for item in value.split(","):
+        item = item.strip()
+        if "-" in item:
+            start, end = item.split("-", 1)
+            years.update(range(int(start), int(end) + 1))
+        elif item:
+            years.add(int(item))
+    return sorted(years)
+
+
+def json_number(value: object) -> object:
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Match Result Prediction betting backtest (ROI, drawdown, calibration)")
+    parser.add_argument("--leagues", required=True, help="Ligues (ex: epl,liga)")
+    parser.add_argument("--seasons", required=True, help="Saisons rejouees (ex: 2016-2024)")
+    parser.add_argument("--data-source", default="placeholder")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--method", choices=IMPLIED_METHODS, default="shin", help="Retrait de la marge bookmaker")
+    parser.add_argument("--staking", choices=STAKING_METHODS, default="kelly")
+    parser.add_argument("--kelly-fraction", type=float, default=KELLY_FRACTION)
+    parser.add_argument("--max-stake", type=float, default=MAX_KELLY_STAKE, help="Mise max (part de bankroll)")
+    parser.add_argument("--min-edge", type=float, default=0.0, help="Avantage minimum p * cote - 1")
+    parser.add_argument("--train-window", type=int, default=2, help="Saisons precedentes pour l'entrainement")
+    parser.add_argument("--output-format", choices=["text", "json"], default="text")
+    parser.add_argument("--output-path", default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    config = BettingConfig(
+        leagues=[league.strip() for league in args.leagues.split(",") if league.strip()],
+        seasons=parse_years(args.seasons),
+        data_source=args.data_source,
+        cache_dir=args.cache_dir,
+        method=args.method,
+        staking=args.staking,
+        kelly_fraction=args.kelly_fraction,
+        max_stake=args.max_stake,
+        min_edge=args.min_edge,
+        train_window=args.train_window,
+    )
+    result = run_betting_backtest(config)
+
+    payload = {
+        "sport": "Football",
+        "project": "Match Result Prediction",
+        "config": asdict(config),
+        "overall": {key: json_number(value) for key, value in result.overall.items()},
+        "seasons": [
+            {key: json_number(value) for key, value in row.items()}
+            for row in result.seasons.to_dict(orient="records")
+        ],
+        "calibration": result.calibration.to_dict(orient="records"),
+        "notes": result.notes,
+        "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
+    if args.output_path:
+        with open(args.output_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+    if args.quiet:
+        return
+    if args.output_format == "json":
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        return
+
+    print("=" * 72)
+    print(
+        f"Betting backtest | Leagues: {', '.join(config.leagues)} | Seasons: {', '.join(map(str, config.seasons))} | "
+        f"Staking: {config.staking} | Margin: {config.method}"
+    )
+    print("=" * 72)
+    if result.seasons.empty:
+        print("Aucune saison evaluee.")
+    else:
+        print(result.seasons.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+        overall = result.overall
+        print("-" * 72)
+        print(
+            f"Overall: bets={overall['bets']} ROI={overall['roi']:.3%} drawdown={overall['max_drawdown']:.3f} "
+            f"log-loss model={overall['model_log_loss']:.4f} market={overall['market_log_loss']:.4f}"
+        )
+        print("\nCalibration (probabilites modele):")
+        print(result.calibration.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    if result.notes:
+        print("\nNotes:")
+        for note in result.notes:
+            print(f"- {note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Replay finished matches as concurrent in-play event streams and score the live forecasts."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+
+from mrp.betting import brier_score, log_loss, outcome_index
+from mrp.data import data_source_dir, load_matches
+from mrp.dixon_coles import fit_dixon_coles, time_decay_weights
+from mrp.inplay import InPlayEngine, InPlayForecast, replay_sources
+
+
+def parse_minutes(value: str) -> list[float]:
+    return sorted({float(item) for item in value.split(",") if item.strip()})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Match Result Prediction in-play replay")
+    parser.add_argument("--leagues", required=True, help="Ligues (ex: epl,liga)")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--data-source", default="placeholder")
+    parser.add_argument("--limit", type=int, default=None, help="Nombre max de matchs rejoues")
+    parser.add_argument("--tick", type=float, default=1.0, help="Minutes entre deux ticks")
+    parser.add_argument("--speed", type=float, default=0.0, help="Secondes reelles par minute de jeu (0 = max)")
+    parser.add_argument("--checkpoints", default="0,15,30,45,60,75,85", help="Minutes evaluees")
+    args = parser.parse_args()
+
+    data_dir = data_source_dir(args.data_source)
+    leagues = [league.strip() for league in args.leagues.split(",") if league.strip()]
+    frames, home_rates, away_rates = [], [], []
+    for league in leagues:
+        matches = load_matches(data_dir, leagues=[league])
+        target = matches.loc[(matches["season"] == args.season).to_numpy()]
+        train = matches.loc[(matches["season"] < args.season).to_numpy() & (matches["season"] >= args.season - 2).to_numpy()]
+        if target.empty or train.empty:
+            print(f"- {league}: aucun match {args.season} ou historique vide, ignoree.")
+            continue
+        # Pre-match rates from a Dixon-Coles fit on the two previous seasons.
+        model = fit_dixon_coles(
+            train["home_team_id"],
+            train["away_team_id"],
+            train["home_goals"].to_numpy(),
+            train["away_goals"].to_numpy(),
+            weights=time_decay_weights(train["date"], pd.Timestamp(target["date"].min())),
+        )
+        home_rate, away_rate = model.rates(target["home_team_id"], target["away_team_id"])
+        frames.append(target)
+        home_rates.append(home_rate)
+        away_rates.append(away_rate)
+    if not frames:
+        print("Aucun match a rejouer.")
+        return
+    matches = pd.concat(frames, ignore_index=True)
+    home_rate = np.concatenate(home_rates)
+    away_rate = np.concatenate(away_rates)
+    if args.limit:
+        matches, home_rate, away_rate = matches.iloc[: args.limit], home_rate[: args.limit], away_rate[: args.limit]
+
+    checkpoints = parse_minutes(args.checkpoints)
+    snapshots: dict[float, dict[str, InPlayForecast]] = {minute: {} for minute in checkpoints}
+    latest: dict[str, InPlayForecast] = {}
+
+    def sink(forecast: InPlayForecast) -> None:
+        # Keep the last forecast issued at or before each checkpoint minute.
+        previous = latest.get(forecast.match_id)
+        for minute in checkpoints:
+            if (previous is None or previous.minute <= minute) and forecast.minute <= minute:
+                snapshots[minute][forecast.match_id] = forecast
+        latest[forecast.match_id] = forecast
+
+    engine = InPlayEngine()
+    started = time.perf_counter()
+    events = asyncio.run(engine.run(replay_sources(matches, home_rate, away_rate, args.tick, args.speed), sink))
+    elapsed = time.perf_counter() - started
+
+    outcome = outcome_index(matches["home_goals"].to_numpy(), matches["away_goals"].to_numpy())
+    ids = matches["match_id"].astype(str).to_numpy()
+    print("=" * 72)
+    print(f"In-play replay | Leagues: {', '.join(leagues)} | Season: {args.season} | Matches: {len(matches)}")
+    print("=" * 72)
+    print(
+        f"{events} evenements en {elapsed:.2f}s ({events / max(elapsed, 1e-9):.0f} ev/s), "
+        f"{len(matches)} matchs simultanes."
+    )
+    if engine.ignored or engine.errors:
+        print(f"{engine.ignored} evenements apres la fin du match ignores, {len(engine.errors)} evenements en erreur.")
+        for error in engine.errors[:5]:
+            print(f"- {error}")
+    print(f"{'minute':>6} | {'log-loss':>8} | {'brier':>6} | {'p_over_2_5 brier':>16}")
+    total_goals = matches["home_goals"].to_numpy(dtype=np.int64) + matches["away_goals"].to_numpy(dtype=np.int64)
+    over = (total_goals > 2).astype(float)
+    for minute in checkpoints:
+        forecasts = [snapshots[minute][match_id] for match_id in ids]
+        probs = np.array([[f.p_home, f.p_draw, f.p_away] for f in forecasts])
+        p_over = np.array([f.p_over_2_5 for f in forecasts])
+        print(
+            f"{minute:>6.0f} | {log_loss(probs, outcome):>8.4f} | {brier_score(probs, outcome):>6.4f} | "
+            f"{float(((p_over - over) ** 2).mean()):>16.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
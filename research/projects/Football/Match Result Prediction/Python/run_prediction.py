@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
-"""Entry point for football match result prediction (stub)."""
+"""Entry point for football match result prediction."""
 
 from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import asdict
-from datetime import datetime, timezone
 
-from mrp import PredictionConfig, run_prediction
+from mrp import MultiLeagueConfig, PredictionConfig, prediction_payload, run_multi_league, run_prediction
 
 
 def parse_train_seasons(value: str, target_season: int) -> list[int]:
@@ -38,40 +36,52 @@ def format_rows(rows: list[dict[str, str]]) -> str:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Match Result Prediction (football)")
     parser.add_argument("--mode", choices=["match_result", "scoreline"], required=True)
-    parser.add_argument("--league", required=True)
+    parser.add_argument("--league", required=True, help="Ligue, ou plusieurs separees par des virgules (ex: epl,liga)")
     parser.add_argument("--season", type=int, required=True)
     parser.add_argument("--round", dest="round_number", type=int, required=True)
-    parser.add_argument("--data-source", default="placeholder")
+    parser.add_argument(
+        "--data-source",
+        default="placeholder",
+        help="placeholder/local = data/football (ou MRP_DATA_DIR), sinon dossier de donnees",
+    )
     parser.add_argument("--train-seasons", default="auto")
     parser.add_argument("--cache-dir", default=None)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processus pour plusieurs ligues (defaut: nombre de coeurs)"
+    )
     parser.add_argument("--output-format", choices=["text", "json"], default="text")
     parser.add_argument("--output-path", default=None)
     parser.add_argument("--quiet", action="store_true")
 
     args = parser.parse_args()
 
-    config = PredictionConfig(
-        league=args.league,
-        season=args.season,
-        round_number=args.round_number,
-        mode=args.mode,
-        data_source=args.data_source,
-        train_seasons=parse_train_seasons(args.train_seasons, args.season),
-        cache_dir=args.cache_dir,
-    )
-
-    result = run_prediction(config)
+    leagues = [league.strip() for league in args.league.split(",") if league.strip()]
+    if len(leagues) > 1:
+        config = MultiLeagueConfig(
+            leagues=leagues,
+            season=args.season,
+            round_number=args.round_number,
+            mode=args.mode,
+            data_source=args.data_source,
+            train_seasons=parse_train_seasons(args.train_seasons, args.season),
+            cache_dir=args.cache_dir,
+            workers=args.workers,
+        )
+        result = run_multi_league(config)
+    else:
+        config = PredictionConfig(
+            league=args.league,
+            season=args.season,
+            round_number=args.round_number,
+            mode=args.mode,
+            data_source=args.data_source,
+            train_seasons=parse_train_seasons(args.train_seasons, args.season),
+            cache_dir=args.cache_dir,
+        )
+        result = run_prediction(config)
 
     if args.output_format == "json":
-        payload = {
-            "version": result.version,
-            "sport": "Football",
-            "project": "Match Result Prediction",
-            "config": asdict(config),
-            "rows": result.rows,
-            "notes": result.notes,
-            "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        }
+        payload = prediction_payload(config, result)
         if args.output_path:
             with open(args.output_path, "w", encoding="utf-8") as f:
                 json.dump(payload, f, ensure_ascii=False, indent=2)
@@ -84,7 +94,7 @@ def main() -> None:
 
     print("=" * 72)
     print(
-        f"Mode: {config.mode} | League: {config.league} | Season: {config.season} | Round: {config.round_number}"
+        f"Mode: {config.mode} | League: {args.league} | Season: {config.season} | Round: {config.round_number}"
     )
     print(f"Model version: {result.version}")
     print("=" * 72)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Resolve team names in a matches or fixtures export to team ids using the teams alias index."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from mrp.aliases import load_alias_index, resolve_team_columns
+from mrp.constants import ALIAS_MIN_SIMILARITY, DATA_DIR, TEAM_ID_COLUMNS
+
+
+def read_frame(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+
+
+def write_frame(frame: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resolve football team names to team ids")
+    parser.add_argument("input", help="matches/fixtures file (.csv or .parquet)")
+    parser.add_argument("--data-source", default=None, help="dossier contenant teams.csv/.parquet (defaut: data/football)")
+    parser.add_argument("--output", default=None, help="fichier resolu (defaut: aucun, rapport seulement)")
+    parser.add_argument("--report", default=None, help="CSV des noms non resolus")
+    parser.add_argument("--columns", default=",".join(TEAM_ID_COLUMNS))
+    parser.add_argument("--min-similarity", type=float, default=ALIAS_MIN_SIMILARITY)
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_source) if args.data_source else DATA_DIR
+    frame = read_frame(Path(args.input))
+    columns = tuple(c.strip() for c in args.columns.split(",") if c.strip())
+    missing = [c for c in columns if c not in frame.columns]
+    if missing:
+        raise SystemExit(f"Colonnes absentes de {args.input}: {', '.join(missing)}")
+
+    index = load_alias_index(data_dir)
+    resolved, unresolved = resolve_team_columns(frame, index, columns, args.min_similarity)
+    if args.output:
+        write_frame(resolved, Path(args.output))
+    if args.report:
+        write_frame(unresolved, Path(args.report))
+
+    rows = len(frame) * len(columns)
+    unresolved_rows = int(unresolved["rows"].sum()) if not unresolved.empty else 0
+    print(f"{len(frame)} lignes, {rows - unresolved_rows}/{rows} equipes resolues, {len(unresolved)} noms non resolus.")
+    for item in unresolved.sort_values("rows", ascending=False).head(20).itertuples(index=False):
+        print(f"- {item.column}: {item.name!r} ({item.rows} lignes, meilleur score {item.score:.2f})")
+    if not unresolved.empty:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
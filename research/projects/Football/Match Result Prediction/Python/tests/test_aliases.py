@@ -0,0 +1,60 @@
+import pandas as pd
+
+from mrp.aliases import AliasIndex, normalize_names, resolve_team_columns
+
+TEAMS = pd.DataFrame(
+    {
+        "team_id": ["ars", "mci", "mun", "rma", "atm", "uni-es", "uni-de"],
+        "team_name": [
+            "Arsenal FC", "Manchester City", "Manchester United", "Real Madrid", "Atlético Madrid", "Unión", "Union"
+        ],
+        "league": ["epl", "epl", "epl", "liga", "liga", "liga", "bundesliga"],
+        "team_aliases": [
+            "The Gunners", "Man City|City", "Man United|Man Utd", "Real Madrid CF", "Atleti", None, "Union Berlin"
+        ],
+    }
+)
+
+
+def test_normalized_names_drop_accents_punctuation_noise_and_order():
+    names = pd.Series(["Atlético  Madrid", "FC Arsenal", "madrid, atletico"])
+    assert normalize_names(names).tolist() == ["atletico madrid", "arsenal", "atletico madrid"]
+
+
+def test_ids_exact_names_and_aliases_resolve_without_fuzzy_matching():
+    index = AliasIndex.build(TEAMS)
+    resolved = index.resolve(pd.Series(["mci", "Arsenal", "Man Utd", "ATLETI", "Real Madrid CF"]))
+    assert resolved["team_id"].tolist() == ["mci", "ars", "mun", "atm", "rma"]
+    assert resolved["method"].tolist() == ["id", "exact", "exact", "exact", "exact"]
+
+
+def test_a_name_shared_across_leagues_only_resolves_with_its_league():
+    index = AliasIndex.build(TEAMS)
+    names = pd.Series(["Union", "Union", "Union"])
+    resolved = index.resolve(names, pd.Series(["liga", "bundesliga", "epl"]))
+    assert resolved["team_id"].tolist()[:2] == ["uni-es", "uni-de"]
+    assert resolved["method"].tolist()[:2] == ["league", "league"]
+    assert pd.isna(resolved["team_id"].iloc[2])
+
+
+def test_misspellings_fall_back_to_ngrams_and_near_ties_stay_unresolved():
+    index = AliasIndex.build(TEAMS)
+    resolved = index.resolve(pd.Series(["Manchestr United", "Athletico Madrid", "Manchester"]))
+    assert resolved["team_id"].tolist()[:2] == ["mun", "atm"]
+    assert resolved["method"].tolist()[:2] == ["fuzzy", "fuzzy"]
+    assert (resolved["score"].iloc[:2] >= 0.8).all()
+    # "Manchester" is about as close to City as to United: ambiguous, left unresolved.
+    assert pd.isna(resolved["team_id"].iloc[2])
+
+
+def test_resolve_team_columns_replaces_names_and_reports_the_rest():
+    index = AliasIndex.build(TEAMS)
+    frame = pd.DataFrame(
+        {"league": ["epl", "epl"], "home_team_id": ["Arsenal", "Nowhere Rovers"], "away_team_id": ["Man City", "mun"]}
+    )
+
+    out, report = resolve_team_columns(frame, index)
+
+    assert out["home_team_id"].tolist() == ["ars", "Nowhere Rovers"]
+    assert out["away_team_id"].tolist() == ["mci", "mun"]
+    assert report["name"].tolist() == ["Nowhere Rovers"]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from mrp.betting import IMPLIED_METHODS, StakingPlan, implied_probabilities, select_bets, staking_backtest
+
+
+def _book(seed=0, n=200):
+    rng = np.random.default_rng(seed)
+    seasons = np.repeat([2023, 2024], n // 2)
+    # Several matches per day, so same-day sizing is exercised; rows are deliberately unsorted.
+    dates = np.sort(rng.integers(0, 30, n)).astype("datetime64[D]") + np.timedelta64(19000, "D")
+    shuffle = rng.permutation(n)
+    probs = rng.dirichlet([3.0, 2.0, 2.5], n)
+    odds = 1.0 / np.clip(probs * rng.uniform(0.85, 1.15, (n, 3)), 0.02, None) * 0.95
+    outcome = np.array([rng.choice(3, p=p) for p in probs])
+    return seasons[shuffle], dates[shuffle], probs[shuffle], odds[shuffle], outcome[shuffle]
+
+
+def _reference_kelly(seasons, dates, probs, odds, outcome, plan):
+    """Plain loop: each day's bets are sized from the bankroll at the start of the day."""
+    order = np.lexsort((dates, seasons))
+    choice, _, kelly = select_bets(probs[order], odds[order], plan.min_edge)
+    stake, profit, bankroll = (np.zeros(len(order)) for _ in range(3))
+    current, day_start = 1.0, 1.0
+    for i, row in enumerate(order):
+        if i == 0 or seasons[row] != seasons[order[i - 1]]:
+            current = day_start = 1.0
+        elif dates[row] != dates[order[i - 1]]:
+            day_start = current
+        if choice[i] >= 0:
+            stake[i] = min(kelly[i] * plan.kelly_fraction, plan.max_stake) * day_start
+            won = choice[i] == outcome[row]
+            profit[i] = stake[i] * (odds[row, choice[i]] - 1.0) if won else -stake[i]
+        current += profit[i]
+        bankroll[i] = current
+    # The ledger reports the end-of-day bankroll on every row of the day.
+    keys = [(seasons[row], dates[row]) for row in order]
+    last = {key: bankroll[i] for i, key in enumerate(keys)}
+    return stake, profit, np.array([last[key] for key in keys])
+
+
+@pytest.mark.parametrize(
+    "plan", [StakingPlan("kelly"), StakingPlan("kelly", kelly_fraction=1.0, max_stake=0.5, min_edge=0.02)]
+)
+def test_kelly_ledger_matches_a_day_by_day_loop(plan):
+    book = _book()
+    ledger = staking_backtest(*book, plan)
+    stake, profit, bankroll = _reference_kelly(*book, plan)
+
+    assert (ledger["bet"] >= 0).sum() > 20
+    np.testing.assert_allclose(ledger["stake"], stake, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(ledger["profit"], profit, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(ledger["bankroll"], bankroll, rtol=1e-9)
+
+
+def test_flat_ledger_counts_units_from_zero_each_season():
+    book = _book(seed=1)
+    ledger = staking_backtest(*book, StakingPlan("flat"))
+
+    assert set(ledger["stake"].unique()) <= {0.0, 1.0}
+    final = ledger.groupby("season")["bankroll"].last()
+    np.testing.assert_allclose(final, ledger.groupby("season")["profit"].sum())
+
+
+@pytest.mark.parametrize("method", IMPLIED_METHODS)
+def test_implied_probabilities_remove_the_margin(method):
+    fair = np.array([[0.5, 0.3, 0.2], [0.25, 0.25, 0.5]])
+    exact = implied_probabilities(1.0 / fair, method)
+    np.testing.assert_allclose(exact, fair, atol=1e-9)
+
+    with_margin = implied_probabilities(1.0 / (fair * 1.06), method)
+    np.testing.assert_allclose(with_margin.sum(axis=1), 1.0)
+    # Every method keeps the favourite first.
+    assert (with_margin.argmax(axis=1) == fair.argmax(axis=1)).all()
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mrp import data
+from mrp.benchmarks import synthetic_tables
+from mrp.data import assign_rounds, load_fixtures, load_matches, load_teams, with_rounds
+
+
+def test_round_robin_rounds_follow_the_schedule():
+    _, matches = synthetic_tables(leagues=2, seasons=2, teams=6)
+    rounds = assign_rounds(matches)
+    # Synthetic match ids are "<league>-<season>-<round>-<home>-<away>".
+    scheduled = matches["match_id"].str.split("-").str[2].astype(int).to_numpy()
+    np.testing.assert_array_equal(rounds, scheduled)
+
+
+def test_rounds_do_not_depend_on_row_order():
+    _, matches = synthetic_tables(leagues=1, seasons=1, teams=6)
+    shuffled = matches.sample(frac=1.0, random_state=3)
+    np.testing.assert_array_equal(assign_rounds(shuffled), assign_rounds(matches)[shuffled.index.to_numpy()])
+
+
+def test_a_team_plays_at_most_once_per_round():
+    matches = pd.DataFrame(
+        {
+            "league": "L",
+            "season": 2024,
+            "date": pd.to_datetime(["2024-08-01", "2024-08-08", "2024-08-08", "2024-08-20"]),
+            "home_team_id": ["A", "A", "B", "C"],
+            "away_team_id": ["B", "C", "D", "D"],
+        }
+    )
+    # C-D was postponed from the first weekend: it is the second game of both teams,
+    # but both already played in round 2, so it goes to round 3.
+    np.testing.assert_array_equal(assign_rounds(matches), [1, 2, 2, 3])
+
+
+def test_rounds_never_repeat_a_team():
+    _, matches = synthetic_tables(leagues=2, seasons=2, teams=8)
+    shuffled_dates = matches.sample(frac=1.0, random_state=5)["date"].to_numpy()
+    matches = matches.assign(date=shuffled_dates)
+    rounds = assign_rounds(matches)
+    sides = pd.DataFrame(
+        {
+            "league": np.tile(matches["league"].astype(str).to_numpy(), 2),
+            "season": np.tile(matches["season"].to_numpy(), 2),
+            "team": np.concatenate([matches["home_team_id"].astype(str), matches["away_team_id"].astype(str)]),
+            "round": np.tile(rounds, 2),
+        }
+    )
+    assert not sides.duplicated().any()
+
+
+def test_fixtures_continue_their_season_numbering():
+    _, matches = synthetic_tables(leagues=1, seasons=1, teams=6)
+    played, upcoming = matches.iloc[:-6], matches.iloc[-6:]
+    _, fixtures = with_rounds(played, upcoming.drop(columns=["home_goals", "away_goals"]))
+    np.testing.assert_array_equal(fixtures["round_number"], assign_rounds(matches)[-6:])
+
+
+def _write(frame, directory, fmt):
+    directory.mkdir(exist_ok=True)
+    path = directory / f"matches.{fmt}"
+    if fmt == "parquet":
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "csv"])
+def test_league_and_season_filters_return_the_same_rows_in_both_formats(tmp_path, fmt, monkeypatch):
+    _, matches = synthetic_tables(leagues=3, seasons=3, teams=6)
+    _write(matches, tmp_path / fmt, fmt)
+    pushed = []
+    read_parquet = data._read_parquet
+
+    def recording_read_parquet(path, columns, filters):
+        pushed.append(filters)
+        return read_parquet(path, columns, filters)
+
+    monkeypatch.setattr(data, "_read_parquet", recording_read_parquet)
+
+    loaded = load_matches(tmp_path / fmt, leagues=["L01", "L02"], seasons=[2023])
+    expected = matches.loc[matches["league"].isin(["L01", "L02"]) & (matches["season"] == 2023)]
+    assert loaded["match_id"].tolist() == expected["match_id"].tolist()
+    if fmt == "parquet":
+        assert pushed == [[("league", "in", ["L01", "L02"]), ("season", "in", [2023])]]
+
+
+def test_matches_are_loaded_with_compact_dtypes(tmp_path):
+    _, matches = synthetic_tables(leagues=2, seasons=1, teams=6)
+    matches = matches.assign(home_red=np.where(np.arange(len(matches)) % 3 == 0, np.nan, 1.0))
+    _write(matches, tmp_path, "csv")
+    loaded = load_matches(tmp_path)
+
+    assert loaded["season"].dtype == np.int16
+    assert loaded["home_goals"].dtype == np.int8
+    assert loaded["home_red"].dtype == "Int8"
+    assert int(loaded["home_red"].isna().sum()) == len(matches[::3])
+    assert loaded["date"].dtype == "datetime64[ns]"
+    assert isinstance(loaded["league"].dtype, pd.CategoricalDtype)
+    # Home and away ids share one category set, so their codes index the same team arrays.
+    assert loaded["home_team_id"].cat.categories.equals(loaded["away_team_id"].cat.categories)
+
+
+def test_fixtures_keep_empty_goals_as_nullable_int8(tmp_path):
+    _, matches = synthetic_tables(leagues=1, seasons=1, teams=6)
+    fixtures = matches.assign(home_goals=np.nan, away_goals=np.nan)
+    fixtures.loc[fixtures.index[:3], ["home_goals", "away_goals"]] = [[2, 1], [0, 0], [1, 3]]
+    fixtures.to_csv(tmp_path / "fixtures.csv", index=False)
+    loaded = load_fixtures(tmp_path)
+
+    assert loaded["home_goals"].dtype == "Int8"
+    assert loaded["home_goals"].isna().sum() == len(fixtures) - 3
+    assert loaded["away_goals"].iloc[:3].tolist() == [1, 0, 3]
+
+
+def test_missing_optional_strings_stay_missing(tmp_path):
+    teams = pd.DataFrame({"team_id": ["A", "B"], "team_name": ["Alpha", "Beta"], "team_aliases": ["Alpha FC", None]})
+    teams.to_csv(tmp_path / "teams.csv", index=False)
+    loaded = load_teams(tmp_path)
+    assert loaded["team_aliases"].iloc[0] == "Alpha FC"
+    assert pd.isna(loaded["team_aliases"].iloc[1])
+
+
+@pytest.mark.parametrize(
+    "change, message",
+    [
+        (lambda frame: frame.drop(columns=["home_goals"]), "missing required columns: home_goals"),
+        (lambda frame: frame.assign(home_goals="x"), "matches.home_goals: non-numeric values"),
+        (lambda frame: frame.assign(home_goals=300), "out of range for int8"),
+        (lambda frame: frame.assign(home_goals=1.5), "out of range for int8"),
+        (
+            lambda frame: frame.assign(away_goals=np.where(frame.index == 0, np.nan, 1)),
+            "matches.away_goals: 1 missing values",
+        ),
+        (lambda frame: frame.assign(date="not a date"), "unparseable dates"),
+    ],
+)
+def test_schema_violations_are_reported(tmp_path, change, message):
+    _, matches = synthetic_tables(leagues=1, seasons=1, teams=4)
+    _write(change(matches), tmp_path, "csv")
+    with pytest.raises(ValueError, match=message):
+        load_matches(tmp_path)
+
+
+def test_unknown_columns_are_rejected(tmp_path):
+    _, matches = synthetic_tables(leagues=1, seasons=1, teams=4)
+    _write(matches, tmp_path, "parquet")
+    with pytest.raises(ValueError, match="unknown columns: referee"):
+        load_matches(tmp_path, columns=["match_id", "referee"])
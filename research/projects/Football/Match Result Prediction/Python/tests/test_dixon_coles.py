@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from mrp import dixon_coles
+from mrp.benchmarks import synthetic_tables
+from mrp.dixon_coles import fit_dixon_coles, negative_log_likelihood, previous_fit, store_fit
+
+
+def _problem(seed=0, n_teams=6, n=120):
+    rng = np.random.default_rng(seed)
+    home = rng.integers(0, n_teams, n)
+    away = (home + rng.integers(1, n_teams, n)) % n_teams
+    # Plenty of 0-0, 0-1, 1-0 and 1-1 scores so every tau branch is exercised.
+    home_goals = rng.poisson(1.3, n).astype(np.float64)
+    away_goals = rng.poisson(1.0, n).astype(np.float64)
+    weights = rng.uniform(0.2, 1.0, n)
+    theta = np.concatenate([rng.normal(0, 0.3, 2 * n_teams), [0.25, -0.08]])
+    return theta, (home, away, home_goals, away_goals, weights, n_teams)
+
+
+def test_gradient_matches_central_finite_differences():
+    theta, args = _problem()
+    _, grad = negative_log_likelihood(theta, *args)
+
+    step = 1e-6
+    numeric = np.empty_like(theta)
+    for idx in range(len(theta)):
+        shift = np.zeros_like(theta)
+        shift[idx] = step
+        upper = negative_log_likelihood(theta + shift, *args)[0]
+        lower = negative_log_likelihood(theta - shift, *args)[0]
+        numeric[idx] = (upper - lower) / (2 * step)
+
+    np.testing.assert_allclose(grad, numeric, rtol=1e-5, atol=1e-6)
+
+
+def test_warm_start_reaches_the_cold_optimum():
+    _, matches = synthetic_tables(leagues=1, seasons=2, teams=8)
+    columns = ["home_team_id", "away_team_id", "home_goals", "away_goals"]
+    args = [matches[column] for column in columns]
+    # Last round's fit: the same history minus the final weekend.
+    earlier = fit_dixon_coles(*(matches[column].iloc[:-4] for column in columns))
+
+    cold = fit_dixon_coles(*args)
+    warm = fit_dixon_coles(*args, warm_start=earlier)
+
+    np.testing.assert_allclose(warm.attack, cold.attack, atol=1e-3)
+    np.testing.assert_allclose(warm.defence, cold.defence, atol=1e-3)
+    assert warm.rho == pytest.approx(cold.rho, abs=1e-3)
+    assert warm.iterations <= cold.iterations
+
+
+def test_stored_fits_are_scoped_by_cache_dir(tmp_path):
+    _, matches = synthetic_tables(leagues=1, seasons=1, teams=6)
+    model = fit_dixon_coles(matches["home_team_id"], matches["away_team_id"], matches["home_goals"], matches["away_goals"])
+    dixon_coles._FITS.clear()
+
+    store_fit("L00", model, tmp_path / "a")
+
+    assert previous_fit("L00", tmp_path / "a") is model
+    assert previous_fit("L00", tmp_path / "b") is None
+    assert previous_fit("L00") is None
+    dixon_coles._FITS.clear()
+    # Read back from disk after the in-memory cache is gone.
+    np.testing.assert_allclose(previous_fit("L00", tmp_path / "a").attack, model.attack)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mrp.benchmarks import synthetic_tables
+from mrp.data import with_rounds
+from mrp.features import TeamForm, rolling_form, team_long_view
+
+
+@pytest.fixture
+def matches():
+    _, frame = synthetic_tables(leagues=1, seasons=2, teams=6)
+    frame, _ = with_rounds(frame)
+    return frame
+
+
+def _keys(frame):
+    return frame["season"] * 1000 + frame["round_number"]
+
+
+def _full(frame):
+    form = TeamForm(league="L00", window=3)
+    form.update(frame)
+    return form
+
+
+def test_rolling_form_matches_shifted_pandas_rolling_means(matches):
+    long = team_long_view(matches)
+    form = rolling_form(long, window=3)
+
+    by_team = long.groupby("team", sort=False)
+    expected = by_team["points"].transform(lambda s: s.shift(1).rolling(3, min_periods=1).mean())
+    np.testing.assert_allclose(form["form_points"], expected, rtol=1e-6)
+    venue = long.groupby(["team", "is_home"], sort=False)["goals_for"]
+    expected_venue = venue.transform(lambda s: s.shift(1).rolling(3, min_periods=1).mean())
+    np.testing.assert_allclose(form["venue_goals_for"], expected_venue, rtol=1e-6)
+    np.testing.assert_array_equal(form["form_games"], by_team.cumcount().clip(upper=3))
+
+
+def test_round_by_round_updates_equal_a_full_build(matches):
+    form = TeamForm(league="L00", window=3)
+    for key in sorted(_keys(matches).unique()):
+        form.update(matches.loc[_keys(matches) <= key])
+
+    assert form.update(matches) == 0
+    pd.testing.assert_frame_equal(form.features(matches), _full(matches).features(matches))
+
+
+def test_rewritten_round_is_recomputed_with_every_later_round(matches):
+    form = _full(matches)
+    rewritten = matches.copy()
+    rewritten.loc[rewritten.index[5], "home_goals"] += 3
+
+    assert form.update(rewritten) > 0
+    assert form.rounds.keys() == _full(rewritten).rounds.keys()
+    pd.testing.assert_frame_equal(form.features(rewritten), _full(rewritten).features(rewritten))
+
+
+def test_round_dated_before_a_teams_stored_rows_recomputes_them(matches):
+    # A later round whose match is played before the team's previous round (rescheduled forward).
+    moved = matches.copy()
+    row = moved.index[(moved["season"] == 2023).to_numpy() & (moved["round_number"] == 6).to_numpy()][0]
+    round_five = moved.loc[(moved["season"] == 2023) & (moved["round_number"] == 5), "date"].min()
+    moved.loc[row, "date"] = round_five - pd.Timedelta(days=1)
+
+    form = TeamForm(league="L00", window=3)
+    form.update(moved.loc[_keys(moved) < 2023006])
+    form.update(moved)
+
+    pd.testing.assert_frame_equal(form.features(moved), _full(moved).features(moved))
+
+
+def test_fixtures_without_goal_columns_get_form_from_the_tails(matches):
+    last = _keys(matches) == _keys(matches).max()
+    played, upcoming = matches.loc[~last], matches.loc[last]
+    form = _full(played)
+    fixtures = upcoming[["match_id", "date", "season", "league", "home_team_id", "away_team_id"]]
+
+    features = form.features(fixtures)
+
+    # The fixture round's form is the same whether or not its results are already known.
+    pd.testing.assert_frame_equal(features, _full(matches).features(upcoming))
+    assert features.notna().all().all()
@@ -0,0 +1,58 @@
+import asyncio
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from mrp.inplay import InPlayEngine, MatchEvent, MatchState, replay_match
+
+
+def _run(engine, *sources):
+    seen = []
+    count = asyncio.run(engine.run(list(sources), seen.append))
+    return count, seen
+
+
+def test_kickoff_forecast_is_negative_binomial_over_the_whole_match():
+    state = MatchState("m", home_rate=1.6, away_rate=0.9, prior_matches=4.0)
+    forecast = state.forecast(max_goals=30)
+    # Gamma(shape = rate * prior, rate = prior) mixed Poisson: NB(shape, prior / (prior + 1)).
+    home = stats.nbinom.pmf(np.arange(31), 1.6 * 4.0, 4.0 / 5.0)
+    away = stats.nbinom.pmf(np.arange(31), 0.9 * 4.0, 4.0 / 5.0)
+    grid = np.outer(home, away)
+    assert forecast.p_home == pytest.approx(np.tril(grid, -1).sum(), abs=1e-9)
+    assert forecast.p_draw == pytest.approx(np.trace(grid), abs=1e-9)
+    assert forecast.remaining_home == pytest.approx(1.6)
+    assert forecast.p_no_more_goals == pytest.approx(home[0] * away[0])
+
+
+def test_final_whistle_settles_the_match_and_frees_its_state():
+    engine = InPlayEngine()
+    count, seen = _run(engine, replay_match("m1", 1.4, 1.1, home_goals=2, away_goals=1, tick=5.0))
+
+    final = seen[-1]
+    assert final.finished and (final.home_goals, final.away_goals) == (2, 1)
+    assert (final.p_home, final.p_draw, final.p_away) == (1.0, 0.0, 0.0)
+    assert final.remaining_home == final.remaining_away == 0.0
+    assert final.p_no_more_goals == 1.0 and final.p_over_2_5 == 1.0
+    assert count == len(seen) and engine.states == {}
+
+
+def test_late_and_bad_events_do_not_stop_the_other_matches():
+    async def feed():
+        yield MatchEvent("a", 0.0, "kickoff", home_rate=1.2, away_rate=1.0)
+        yield MatchEvent("a", 90.0, "full_time")
+        yield MatchEvent("a", 91.0, "tick")  # late tick after the whistle
+        yield MatchEvent("a", 90.0, "full_time")  # duplicate
+        yield MatchEvent("b", 10.0, "goal", side="home")  # no kickoff seen
+        yield MatchEvent("c", 0.0, "kickoff", home_rate=1.0, away_rate=1.0)
+        yield MatchEvent("c", 20.0, "goal", side="left")  # invalid side
+
+    engine = InPlayEngine()
+    _, seen = _run(engine, feed(), replay_match("m2", 1.0, 1.3, home_goals=0, away_goals=2, tick=10.0))
+
+    assert engine.ignored == 2
+    assert len(engine.errors) == 2
+    assert seen[-1].match_id == "m2" and seen[-1].finished
+    # The rejected goal left match c untouched.
+    assert engine.states["c"].home_goals == 0 and engine.states["c"].minute == 0.0
@@ -0,0 +1,77 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import pytest
+
+from mrp import parallel
+from mrp.benchmarks import clear_state, synthetic_tables, write_tables
+from mrp.config import MultiLeagueConfig
+
+pytest.importorskip("pyarrow")
+
+LEAGUES = ["L00", "L01", "L02"]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    teams, matches = synthetic_tables(leagues=len(LEAGUES), seasons=2, teams=6)
+    directory = tmp_path / "data"
+    directory.mkdir()
+    write_tables(directory, teams, matches)
+    return directory
+
+
+def _config(data_dir, cache_dir, workers):
+    # The last round of the last season is replayed from matches.
+    return MultiLeagueConfig(
+        leagues=LEAGUES,
+        season=2024,
+        round_number=10,
+        mode="match_result",
+        data_source=str(data_dir),
+        train_seasons=[2023, 2024],
+        cache_dir=str(cache_dir),
+        workers=workers,
+    )
+
+
+def test_process_pool_matches_the_sequential_run(data_dir, tmp_path):
+    clear_state()
+    sequential = parallel.run_multi_league(_config(data_dir, tmp_path / "cache-1", workers=1))
+    clear_state()
+    pooled = parallel.run_multi_league(_config(data_dir, tmp_path / "cache-2", workers=2))
+
+    assert sequential.rows
+    assert pooled.rows == sequential.rows
+    assert [row["league"] for row in pooled.rows] == sorted(row["league"] for row in pooled.rows)
+    assert {row["league"] for row in pooled.rows} == set(LEAGUES)
+    # Only the process count note differs; league notes keep their prefix and order.
+    assert sequential.notes[0] == "3 ligues sur 1 processus."
+    assert pooled.notes[0] == "3 ligues sur 2 processus."
+    assert pooled.notes[1:] == sequential.notes[1:]
+    prefixes = [note.split(" ", 1)[0] for note in pooled.notes[1:]]
+    assert set(prefixes) == {f"[{league}]" for league in LEAGUES}
+    assert prefixes == sorted(prefixes)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="the patch must reach forked workers")
+def test_shared_segment_is_unlinked_when_a_worker_raises(data_dir, tmp_path, monkeypatch):
+    created = []
+    share_frames = parallel.share_frames
+
+    def recording_share_frames(*args):
+        segment, shared = share_frames(*args)
+        created.append(shared.name)
+        return segment, shared
+
+    def failing_predict_league(*args, **kwargs):
+        raise RuntimeError("worker failure")
+
+    monkeypatch.setattr(parallel, "share_frames", recording_share_frames)
+    monkeypatch.setattr(parallel, "predict_league", failing_predict_league)
+    with pytest.raises(RuntimeError, match="worker failure"):
+        parallel.run_multi_league(_config(data_dir, tmp_path / "cache", workers=2))
+
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=created[0])
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from mrp.benchmarks import synthetic_tables
+from mrp.data import with_rounds
+from mrp.ratings import EloEngine, EloParams, expected_home_score, goal_difference_multiplier
+
+
+def _matches():
+    _, matches = synthetic_tables(leagues=1, seasons=2, teams=6)
+    matches, _ = with_rounds(matches)
+    return matches
+
+
+def _assert_same_state(engine, reference, matches):
+    ids = matches["match_id"]
+    np.testing.assert_allclose(engine.pre_match_ratings(ids), reference.pre_match_ratings(ids))
+    teams = reference.teams.to_series()
+    for season, round_number in [(2023, 3), (2024, 1), (2024, 10)]:
+        np.testing.assert_allclose(
+            engine.team_ratings(teams, season, round_number), reference.team_ratings(teams, season, round_number)
+        )
+    assert engine.position == reference.position
+
+
+def test_round_by_round_advance_equals_one_pass():
+    matches = _matches()
+    keys = matches["season"] * 1000 + matches["round_number"]
+    engine = EloEngine(league="L00")
+    applied = sum(engine.advance(matches.loc[keys <= key]) for key in sorted(keys.unique()))
+
+    reference = EloEngine(league="L00")
+    assert reference.advance(matches) == applied == keys.nunique()
+    assert engine.advance(matches) == 0
+    _assert_same_state(engine, reference, matches)
+
+
+def test_rewritten_round_rolls_back_to_the_last_valid_checkpoint():
+    matches = _matches()
+    engine = EloEngine(league="L00")
+    engine.advance(matches)
+
+    rewritten = matches.copy()
+    target = rewritten.index[(rewritten["season"] == 2024).to_numpy() & (rewritten["round_number"] == 4).to_numpy()][0]
+    rewritten.loc[target, "home_goals"] += 2
+    later_rounds = rewritten.loc[(rewritten["season"] == 2024) & (rewritten["round_number"] >= 4), "round_number"].nunique()
+
+    # Only the rewritten round and the ones after it are replayed.
+    assert engine.advance(rewritten) == later_rounds
+    assert (2024, 3) in engine.checkpoints
+
+    reference = EloEngine(league="L00")
+    reference.advance(rewritten)
+    _assert_same_state(engine, reference, rewritten)
+
+
+def test_removed_rounds_are_dropped_from_the_state():
+    matches = _matches()
+    engine = EloEngine(league="L00")
+    engine.advance(matches)
+
+    kept = matches.loc[(matches["season"] == 2023).to_numpy()]
+    assert engine.advance(kept) == 0
+    assert engine.position == (2023, int(kept["round_number"].max()))
+    assert max(engine.checkpoints) == engine.position
+
+
+def test_a_second_game_in_a_week_is_rated_after_the_first():
+    matches = pd.DataFrame(
+        {
+            "match_id": ["m1", "m2", "m3", "m4", "m5"],
+            "league": "L",
+            "season": 2024,
+            "date": pd.to_datetime(["2024-08-01", "2024-08-01", "2024-08-08", "2024-08-15", "2024-08-18"]),
+            "home_team_id": ["A", "C", "C", "A", "A"],
+            "away_team_id": ["B", "D", "E", "C", "E"],
+            "home_goals": [2, 0, 1, 3, 1],
+            "away_goals": [0, 0, 1, 1, 2],
+        }
+    )
+    matches, _ = with_rounds(matches)
+    engine = EloEngine(league="L")
+    engine.advance(matches)
+
+    # One match at a time in date order.
+    params = EloParams()
+    ratings = dict.fromkeys("ABCDE", params.initial)
+    expected = []
+    for row in matches.itertuples():
+        home, away = ratings[row.home_team_id], ratings[row.away_team_id]
+        expected.append((home, away))
+        actual = 1.0 if row.home_goals > row.away_goals else 0.5 if row.home_goals == row.away_goals else 0.0
+        score = expected_home_score(np.array(home), np.array(away), params)
+        delta = params.k * goal_difference_multiplier(np.array(row.home_goals - row.away_goals)) * (actual - score)
+        ratings[row.home_team_id] += float(delta)
+        ratings[row.away_team_id] -= float(delta)
+    np.testing.assert_allclose(engine.pre_match_ratings(matches["match_id"]), expected)
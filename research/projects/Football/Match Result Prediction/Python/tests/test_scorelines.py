@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from mrp.scorelines import scoreline_distribution
+
+HOME = np.array([0.4, 1.1, 1.6, 2.7])
+AWAY = np.array([0.3, 1.4, 0.9, 0.5])
+
+
+def test_marginals_match_independent_poisson_without_correction():
+    # A wide grid so the truncation mass is far below the tolerance.
+    dist = scoreline_distribution(HOME, AWAY, rho=0.0, max_goals=25, lines=(0.5, 2.5))
+
+    np.testing.assert_allclose(dist.p_home, stats.skellam.sf(0, HOME, AWAY), atol=1e-9)
+    np.testing.assert_allclose(dist.p_draw, stats.skellam.pmf(0, HOME, AWAY), atol=1e-9)
+    np.testing.assert_allclose(dist.p_away, stats.skellam.cdf(-1, HOME, AWAY), atol=1e-9)
+    np.testing.assert_allclose(dist.expected_home_goals, HOME, atol=1e-9)
+    np.testing.assert_allclose(dist.expected_away_goals, AWAY, atol=1e-9)
+    np.testing.assert_allclose(dist.p_btts, (1 - np.exp(-HOME)) * (1 - np.exp(-AWAY)), atol=1e-9)
+    for line in (0.5, 2.5):
+        np.testing.assert_allclose(dist.p_over[line], stats.poisson.sf(np.floor(line), HOME + AWAY), atol=1e-9)
+
+
+def test_matrices_match_scipy_cell_by_cell():
+    dist = scoreline_distribution(HOME, AWAY, max_goals=25)
+    goals = np.arange(26)
+    home = stats.poisson.pmf(goals[None, :, None], HOME[:, None, None])
+    away = stats.poisson.pmf(goals[None, None, :], AWAY[:, None, None])
+    expected = home * away
+    np.testing.assert_allclose(dist.matrices, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("rho", [-0.12, 0.08])
+def test_low_score_correction_scales_the_four_corner_cells_by_tau(rho):
+    plain = scoreline_distribution(HOME, AWAY, rho=0.0)
+    corrected = scoreline_distribution(HOME, AWAY, rho=rho)
+
+    np.testing.assert_allclose(corrected.matrices.sum(axis=(1, 2)), 1.0)
+    np.testing.assert_allclose(corrected.outcome.sum(axis=1), 1.0)
+    ratio = corrected.matrices / plain.matrices
+    # Outside the corner only the normalising constant changes.
+    scale = ratio[:, 2, 2]
+    outside = np.ones(ratio.shape[1:], dtype=bool)
+    outside[:2, :2] = False
+    np.testing.assert_allclose(ratio[:, outside], np.broadcast_to(scale[:, None], ratio[:, outside].shape))
+    tau = np.stack([1 - HOME * AWAY * rho, 1 + HOME * rho, 1 + AWAY * rho, np.full_like(HOME, 1 - rho)], axis=1)
+    corner = ratio[:, :2, :2].reshape(len(HOME), 4)
+    np.testing.assert_allclose(corner, tau * scale[:, None])
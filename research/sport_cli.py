@@ -4,9 +4,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import math
 import os
+import re
+import shutil
 import subprocess
 import sys
+import time
+import traceback
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
@@ -14,6 +23,21 @@ from typing import Iterable
 ROOT = Path(__file__).resolve().parent
 PROJECTS_DIR = ROOT / "projects"
 PAPERS_DIR = ROOT / "papers"
+CACHE_DIR = Path(os.environ.get("SPORT_CLI_CACHE_DIR") or ROOT / ".cache" / "sport_cli")
+CATALOG_PATH = CACHE_DIR / "catalog.json"
+CATALOG_VERSION = 1
+RUNS_CACHE_DIR = ROOT / ".cache" / "runs"
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on",
+    "or", "that", "the", "this", "to", "with", "we", "de", "des", "du", "en", "et", "la", "le",
+    "les", "un", "une", "pour", "par", "sur", "dans", "est",
+}
+TITLE_WEIGHT = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+SNIPPET_CHARS = 180
 
 try:
     from rich.console import Console
@@ -159,6 +183,343 @@ def load_papers(sport_filter: str | None = None) -> list[Paper]:
     return papers
 
 
+def filter_papers(papers: list[Paper], sport_filter: str | None) -> list[Paper]:
+    if not sport_filter:
+        return papers
+    return [p for p in papers if p.sport == sport_filter]
+
+
+# --- Catalog index -----------------------------------------------------------
+# Projects, papers and an inverted full-text index (paper PDFs, notebooks,
+# Python READMEs) are cached under CACHE_DIR. The cache is reused as long as
+# every watched directory/file keeps its mtime and size; on change, only the
+# modified documents are re-extracted.
+
+
+@dataclass(frozen=True)
+class Document:
+    doc_id: str
+    kind: str
+    sport: str
+    title: str
+    path: Path
+
+
+@dataclass
+class Catalog:
+    projects: list[Project]
+    papers: list[Paper]
+    documents: list[Document]
+    postings: dict[str, list[list[int]]]
+    lengths: list[int]
+    rebuilt: bool = False
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    document: Document
+    score: float
+    matched: int
+    snippet: str
+
+
+def tokenize(text: str) -> list[str]:
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return [t for t in TOKEN_RE.findall(text) if len(t) > 1 and t not in STOPWORDS]
+
+
+def relative_id(path: Path) -> str:
+    try:
+        return str(path.relative_to(ROOT))
+    except ValueError:
+        return str(path)
+
+
+def file_signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def pdf_extractor_available() -> bool:
+    try:
+        import pypdf  # noqa: F401
+    except Exception:
+        return shutil.which("pdftotext") is not None
+    return True
+
+
+def extract_pdf_text(path: Path) -> str:
+    try:
+        from pypdf import PdfReader
+    except Exception:
+        PdfReader = None
+    if PdfReader is not None:
+        try:
+            reader = PdfReader(str(path))
+            return "\n".join(page.extract_text() or "" for page in reader.pages)
+        except Exception:
+            return ""
+    if shutil.which("pdftotext"):
+        proc = subprocess.run(
+            ["pdftotext", "-q", "-enc", "UTF-8", str(path), "-"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        return proc.stdout
+    return ""
+
+
+def extract_notebook_text(path: Path) -> str:
+    try:
+        notebook = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return ""
+    parts: list[str] = []
+    for cell in notebook.get("cells", []):
+        source = cell.get("source", "")
+        parts.append("".join(source) if isinstance(source, list) else str(source))
+    return "\n\n".join(parts)
+
+
+def extract_text(document: Document) -> str:
+    if document.kind == "paper":
+        return extract_pdf_text(document.path)
+    if document.kind == "notebook":
+        return extract_notebook_text(document.path)
+    try:
+        return document.path.read_text(encoding="utf-8")
+    except Exception:
+        return ""
+
+
+def collect_documents(projects: list[Project], papers: list[Paper]) -> list[Document]:
+    documents: list[Document] = []
+    for paper in papers:
+        documents.append(Document(relative_id(paper.path), "paper", paper.sport, paper.title, paper.path))
+    for project in projects:
+        if project.notebook:
+            documents.append(
+                Document(relative_id(project.notebook), "notebook", project.sport, project.name, project.notebook)
+            )
+        if project.python_readme:
+            documents.append(
+                Document(relative_id(project.python_readme), "readme", project.sport, project.name, project.python_readme)
+            )
+    return documents
+
+
+def watched_paths(projects: list[Project], documents: list[Document]) -> list[Path]:
+    paths = [PROJECTS_DIR, PAPERS_DIR, PAPERS_DIR / "README.md"]
+    paths.extend(iter_sport_dirs())
+    if PAPERS_DIR.exists():
+        paths.extend(p for p in PAPERS_DIR.iterdir() if p.is_dir() and not p.name.startswith("."))
+    for project in projects:
+        paths.extend([project.path, project.path / "Jupyter", project.path / "Python"])
+    paths.extend(document.path for document in documents)
+    return paths
+
+
+def document_cache_path(doc_id: str) -> Path:
+    return CACHE_DIR / "docs" / f"{hashlib.sha1(doc_id.encode('utf-8')).hexdigest()}.json"
+
+
+def project_to_dict(project: Project) -> dict[str, str | None]:
+    return {
+        "sport": project.sport,
+        "name": project.name,
+        "path": str(project.path),
+        "notebook": str(project.notebook) if project.notebook else None,
+        "python_dir": str(project.python_dir) if project.python_dir else None,
+        "python_readme": str(project.python_readme) if project.python_readme else None,
+    }
+
+
+def project_from_dict(data: dict[str, str | None]) -> Project:
+    def as_path(value: str | None) -> Path | None:
+        return Path(value) if value else None
+
+    return Project(
+        sport=str(data["sport"]),
+        name=str(data["name"]),
+        path=Path(str(data["path"])),
+        notebook=as_path(data["notebook"]),
+        python_dir=as_path(data["python_dir"]),
+        python_readme=as_path(data["python_readme"]),
+    )
+
+
+def read_catalog_file() -> dict | None:
+    try:
+        data = json.loads(CATALOG_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if data.get("version") != CATALOG_VERSION or data.get("root") != str(ROOT):
+        return None
+    return data
+
+
+def catalog_is_fresh(data: dict) -> bool:
+    for path, signature in data.get("watched", {}).items():
+        if file_signature(Path(path)) != signature:
+            return False
+    return True
+
+
+def catalog_from_dict(data: dict, rebuilt: bool = False) -> Catalog:
+    return Catalog(
+        projects=[project_from_dict(item) for item in data["projects"]],
+        papers=[
+            Paper(sport=item["sport"], path=Path(item["path"]), title=item["title"], source=item["source"])
+            for item in data["papers"]
+        ],
+        documents=[
+            Document(item["doc_id"], item["kind"], item["sport"], item["title"], Path(item["path"]))
+            for item in data["documents"]
+        ],
+        postings=data["postings"],
+        lengths=data["lengths"],
+        rebuilt=rebuilt,
+    )
+
+
+def build_catalog(previous: dict | None) -> dict:
+    projects = load_projects()
+    papers = load_papers()
+    documents = collect_documents(projects, papers)
+    previous_docs = {item["doc_id"]: item for item in (previous or {}).get("documents", [])}
+
+    postings: dict[str, list[list[int]]] = {}
+    lengths: list[int] = []
+    doc_items: list[dict[str, object]] = []
+    (CACHE_DIR / "docs").mkdir(parents=True, exist_ok=True)
+    for idx, document in enumerate(documents):
+        signature = file_signature(document.path)
+        cache_path = document_cache_path(document.doc_id)
+        terms: dict[str, int] | None = None
+        cached = previous_docs.get(document.doc_id)
+        if cached and cached.get("signature") == signature and cached.get("title") == document.title:
+            try:
+                terms = json.loads(cache_path.read_text(encoding="utf-8"))["terms"]
+            except Exception:
+                terms = None
+        if terms is None:
+            text = extract_text(document)
+            counts: dict[str, int] = {}
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + 1
+            title_tokens = tokenize(f"{document.title} {document.path.stem.replace('-', ' ')} {document.sport}")
+            for token in title_tokens:
+                counts[token] = counts.get(token, 0) + TITLE_WEIGHT
+            terms = counts
+            cache_path.write_text(json.dumps({"text": text, "terms": terms}), encoding="utf-8")
+        for term, tf in terms.items():
+            postings.setdefault(term, []).append([idx, tf])
+        lengths.append(sum(terms.values()))
+        doc_items.append({
+            "doc_id": document.doc_id,
+            "kind": document.kind,
+            "sport": document.sport,
+            "title": document.title,
+            "path": str(document.path),
+            "signature": signature,
+        })
+
+    watched = {str(path): file_signature(path) for path in watched_paths(projects, documents)}
+    return {
+        "version": CATALOG_VERSION,
+        "root": str(ROOT),
+        "watched": watched,
+        "projects": [project_to_dict(project) for project in projects],
+        "papers": [
+            {"sport": p.sport, "path": str(p.path), "title": p.title, "source": p.source} for p in papers
+        ],
+        "documents": doc_items,
+        "postings": postings,
+        "lengths": lengths,
+    }
+
+
+def load_catalog(rebuild: bool = False) -> Catalog:
+    previous = None if rebuild else read_catalog_file()
+    if previous is not None and catalog_is_fresh(previous):
+        return catalog_from_dict(previous)
+    data = build_catalog(previous)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = CATALOG_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, CATALOG_PATH)
+    except OSError:
+        pass
+    return catalog_from_dict(data, rebuilt=True)
+
+
+def make_snippet(document: Document, terms: list[str]) -> str:
+    try:
+        text = json.loads(document_cache_path(document.doc_id).read_text(encoding="utf-8"))["text"]
+    except Exception:
+        text = ""
+    text = " ".join(text.split())
+    if not text:
+        return document.title
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms]
+    positions = [pos for pos in positions if pos >= 0]
+    start = max(0, min(positions) - SNIPPET_CHARS // 3) if positions else 0
+    snippet = text[start:start + SNIPPET_CHARS]
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if start + SNIPPET_CHARS < len(text) else ""
+    return f"{prefix}{snippet}{suffix}"
+
+
+def search_catalog(
+    catalog: Catalog,
+    query: str,
+    scope: str = "all",
+    sport_filter: str | None = None,
+    limit: int = 10,
+) -> list[SearchHit]:
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms or not catalog.documents:
+        return []
+    kinds = {"papers": {"paper"}, "projects": {"notebook", "readme"}}.get(scope, {"paper", "notebook", "readme"})
+    n_docs = len(catalog.documents)
+    avgdl = (sum(catalog.lengths) / n_docs) or 1.0
+    scores: dict[int, float] = {}
+    matched: dict[int, int] = {}
+    for term in terms:
+        postings = catalog.postings.get(term)
+        if not postings:
+            continue
+        idf = math.log(1.0 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+        for idx, tf in postings:
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * catalog.lengths[idx] / avgdl)
+            scores[idx] = scores.get(idx, 0.0) + idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+            matched[idx] = matched.get(idx, 0) + 1
+    candidates = [
+        idx
+        for idx in scores
+        if catalog.documents[idx].kind in kinds
+        and (not sport_filter or normalize(catalog.documents[idx].sport) == normalize(sport_filter))
+    ]
+    # Documents matching more query terms rank first, then by BM25.
+    ranked = sorted(candidates, key=lambda idx: (-matched[idx], -scores[idx]))[:limit]
+    return [
+        SearchHit(
+            document=catalog.documents[idx],
+            score=scores[idx],
+            matched=matched[idx],
+            snippet=make_snippet(catalog.documents[idx], terms),
+        )
+        for idx in ranked
+    ]
+
+
 def normalize(text: str) -> str:
     return text.lower().replace("_", " ").strip()
 
@@ -358,6 +719,7 @@ def select_paper(papers: list[Paper]) -> Paper | None:
 
 
 def run_menu(projects: list[Project], papers: list[Paper]) -> None:
+    catalog: Catalog | None = None
     while True:
         print("\nMenu pipeline research")
         print("1. Overview")
@@ -407,25 +769,58 @@ def run_menu(projects: list[Project], papers: list[Paper]) -> None:
             query = input("Mot-cle: ").strip()
             if not query:
                 continue
-            run_search(projects, papers, query, scope="all")
+            if catalog is None:
+                catalog = load_catalog()
+            run_search(catalog, query, scope="all")
         elif choice == "8":
             break
         else:
             print("Choix invalide.")
 
 
+def render_search_hits(hits: list[SearchHit]) -> None:
+    if RICH and CONSOLE:
+        table = Table(title="Search Results", header_style="bold")
+        table.add_column("#", style="bold")
+        table.add_column("Score")
+        table.add_column("Type")
+        table.add_column("Sport", style="bold")
+        table.add_column("Title")
+        table.add_column("Extrait")
+        for idx, hit in enumerate(hits, start=1):
+            doc = hit.document
+            table.add_row(str(idx), f"{hit.score:.2f}", doc.kind, doc.sport, doc.title, hit.snippet)
+        CONSOLE.print(table)
+    else:
+        print("Search Results")
+        for idx, hit in enumerate(hits, start=1):
+            doc = hit.document
+            print(f"{idx}. [{hit.score:.2f}] {doc.kind} | {doc.sport} | {doc.title}")
+            print(f"   {relative_id(doc.path)}")
+            print(f"   {hit.snippet}")
+
+
 def run_search(
-    projects: list[Project],
-    papers: list[Paper],
+    catalog: Catalog,
     query: str,
     scope: str = "all",
     sport_filter: str | None = None,
+    limit: int = 10,
 ) -> None:
+    if tokenize(query):
+        hits = search_catalog(catalog, query, scope=scope, sport_filter=sport_filter, limit=limit)
+        if hits:
+            render_search_hits(hits)
+        else:
+            print("Aucun resultat.")
+        return
+
+    # Query without indexable terms: fall back to substring matching on names/titles.
     q = normalize(query)
     if scope in {"projects", "all"}:
         matched_projects = [
             p
-            for p in projects
+            for p in catalog.projects
             if (not sport_filter or normalize(p.sport) == normalize(sport_filter))
             and q in normalize(p.name)
         ]
@@ -434,7 +829,7 @@ def run_search(
     if scope in {"papers", "all"}:
         matched_papers = [
             p
-            for p in papers
+            for p in catalog.papers
             if (not sport_filter or normalize(p.sport) == normalize(sport_filter))
             and (q in normalize(p.title) or q in normalize(p.path.name))
         ]
@@ -442,6 +837,265 @@ def run_search(
             render_papers(matched_papers)
 
 
+def render_index_stats(catalog: Catalog) -> None:
+    kinds: dict[str, int] = {}
+    for document in catalog.documents:
+        kinds[document.kind] = kinds.get(document.kind, 0) + 1
+    status = "reconstruit" if catalog.rebuilt else "a jour (cache)"
+    print(f"Index: {status} -> {CATALOG_PATH}")
+    print(f"Projects: {len(catalog.projects)} | Papers: {len(catalog.papers)}")
+    print(
+        f"Documents: {len(catalog.documents)} "
+        f"(papers {kinds.get('paper', 0)}, notebooks {kinds.get('notebook', 0)}, readmes {kinds.get('readme', 0)})"
+    )
+    print(f"Termes indexes: {len(catalog.postings)}")
+    if catalog.papers and not pdf_extractor_available():
+        print("Note: ni pypdf ni pdftotext disponibles, seuls les titres des papers sont indexes.")
+
+
+# --- Batch runs ----------------------------------------------------------------
+# A run matrix (sports x projects x years x rounds x modes) is expanded into
+# individual run configs executed in a local process pool. Each worker keeps
+# its project packages imported (and, for F1, a warm PredictionService), and
+# every run of a project shares the same cache directory.
+
+YEAR_PARAM = {"Football": "season"}
+DEFAULT_MODES = {"F1": ["qualifying"], "Football": ["match_result"]}
+MATRIX_KEYS = {
+    "sport": "sports",
+    "project": "projects",
+    "year": "years",
+    "round": "rounds",
+    "mode": "modes",
+}
+
+_RUN_STATE: dict[str, object] = {}
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    index: int
+    sport: str
+    project: str
+    python_dir: Path
+    params: dict[str, object]
+
+
+def parse_int_list(value: object) -> list[int]:
+    if value is None:
+        return []
+    if isinstance(value, int):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return sorted({number for item in value for number in parse_int_list(item)})
+    numbers: set[int] = set()
+    for part in str(value).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            numbers.update(range(int(start), int(end) + 1))
+        else:
+            numbers.add(int(part))
+    return sorted(numbers)
+
+
+def parse_str_list(value: object) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+def parse_param_value(raw: str) -> object:
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+def load_run_matrices(path: Path) -> list[dict[str, object]]:
+    text = path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+    except ValueError:
+        # NDJSON: one matrix (or explicit run) per line.
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if isinstance(data, dict):
+        data = data.get("runs", [data])
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ValueError(f"Fichier de runs invalide: {path}")
+    return data
+
+
+def matrix_values(matrix: dict[str, object], defaults: dict[str, object], key: str) -> object:
+    plural = MATRIX_KEYS[key]
+    for source in (matrix, defaults):
+        if source.get(plural) is not None:
+            return source[plural]
+        if source.get(key) is not None:
+            return source[key]
+    return None
+
+
+def expand_run_matrix(
+    matrices: list[dict[str, object]],
+    defaults: dict[str, object],
+    projects: list[Project],
+    cache_dir: Path,
+) -> list[RunSpec]:
+    runs: list[RunSpec] = []
+    for matrix in matrices:
+        sports = parse_str_list(matrix_values(matrix, defaults, "sport"))
+        if not sports:
+            raise ValueError("Aucun sport dans la matrice de runs (--sports)")
+        wanted_projects = parse_str_list(matrix_values(matrix, defaults, "project"))
+        years = parse_int_list(matrix_values(matrix, defaults, "year"))
+        rounds = parse_int_list(matrix_values(matrix, defaults, "round"))
+        if not years or not rounds:
+            raise ValueError("La matrice de runs requiert des annees (--years) et des rounds (--rounds)")
+        params = dict(defaults.get("params") or {})
+        params.update(matrix.get("params") or {})
+
+        for sport in sports:
+            sport_projects = [
+                p for p in projects if normalize(p.sport) == normalize(sport) and p.python_dir
+            ]
+            if wanted_projects:
+                sport_projects = [
+                    p for p in sport_projects if any(normalize(w) in normalize(p.name) for w in wanted_projects)
+                ]
+            if not sport_projects:
+                raise ValueError(f"Aucun project Python pour {sport} ({', '.join(wanted_projects) or 'tous'})")
+            for project in sport_projects:
+                modes = parse_str_list(matrix_values(matrix, defaults, "mode")) or DEFAULT_MODES.get(
+                    project.sport, []
+                )
+                if not modes:
+                    raise ValueError(f"Aucun mode pour {project.sport}/{project.name} (--modes)")
+                project_cache = cache_dir / project.sport / project.name
+                year_key = YEAR_PARAM.get(project.sport, "year")
+                # Mode-major order keeps consecutive runs on the same training data.
+                for mode in modes:
+                    for year in years:
+                        for round_number in rounds:
+                            run_params = dict(params)
+                            run_params.setdefault("cache_dir", str(project_cache))
+                            run_params.update({"mode": mode, year_key: year, "round_number": round_number})
+                            runs.append(
+                                RunSpec(
+                                    index=len(runs),
+                                    sport=project.sport,
+                                    project=project.name,
+                                    python_dir=project.python_dir,
+                                    params=run_params,
+                                )
+                            )
+    return runs
+
+
+def execute_f1_run(params: dict[str, object]) -> dict[str, object]:
+    service = _RUN_STATE.get("f1_service")
+    if service is None:
+        from rqp.service import PredictionService
+
+        service = PredictionService()
+        _RUN_STATE["f1_service"] = service
+    payload = service.predict(params)
+    payload.pop("service", None)
+    return payload
+
+
+def execute_football_run(params: dict[str, object]) -> dict[str, object]:
+    from mrp import PredictionConfig, prediction_payload, run_prediction
+
+    season = int(params["season"])
+    train_seasons = params.get("train_seasons") or "auto"
+    if isinstance(train_seasons, list):
+        seasons = [int(value) for value in train_seasons]
+    elif str(train_seasons).lower() in {"auto", "default"}:
+        seasons = [season - 2, season - 1, season]
+    else:
+        seasons = parse_int_list(train_seasons)
+    config = PredictionConfig(
+        league=str(params["league"]),
+        season=season,
+        round_number=int(params["round_number"]),
+        mode=str(params["mode"]),
+        data_source=str(params.get("data_source") or "placeholder"),
+        train_seasons=seasons,
+        cache_dir=str(params["cache_dir"]) if params.get("cache_dir") else None,
+    )
+    return prediction_payload(config, run_prediction(config))
+
+
+RUN_EXECUTORS = {"F1": execute_f1_run, "Football": execute_football_run}
+
+
+def execute_run(run: RunSpec) -> dict[str, object]:
+    started = time.perf_counter()
+    record: dict[str, object] = {
+        "index": run.index,
+        "sport": run.sport,
+        "project": run.project,
+        "params": run.params,
+    }
+    try:
+        executor = RUN_EXECUTORS.get(run.sport)
+        if executor is None:
+            raise ValueError(f"Sport non supporte pour run: {run.sport}")
+        if str(run.python_dir) not in sys.path:
+            sys.path.insert(0, str(run.python_dir))
+        Path(str(run.params["cache_dir"])).mkdir(parents=True, exist_ok=True)
+        record["result"] = executor(run.params)
+        record["status"] = "done"
+    except (Exception, SystemExit) as exc:
+        record["status"] = "error"
+        record["error"] = f"{type(exc).__name__}: {exc}"
+        record["traceback"] = traceback.format_exc()
+    record["duration_ms"] = int((time.perf_counter() - started) * 1000)
+    return record
+
+
+def run_batch(
+    runs: list[RunSpec],
+    workers: int,
+    output: Path | None = None,
+    quiet: bool = False,
+) -> dict[str, int]:
+    summary = {"runs": len(runs), "done": 0, "error": 0, "workers": 1}
+    sink = output.open("w", encoding="utf-8") if output else None
+    started = time.perf_counter()
+
+    def emit(record: dict[str, object]) -> None:
+        summary[str(record["status"])] += 1
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        if sink:
+            sink.write(line + "\n")
+            sink.flush()
+        if not quiet:
+            print(line, flush=True)
+
+    try:
+        workers = max(1, min(workers, len(runs) or 1))
+        summary["workers"] = workers
+        if workers == 1:
+            for run in runs:
+                emit(execute_run(run))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(execute_run, run) for run in runs]
+                for future in as_completed(futures):
+                    emit(future.result())
+    finally:
+        if sink:
+            sink.close()
+    summary["duration_ms"] = int((time.perf_counter() - started) * 1000)
+    return summary
+
+
 def resolve_project(projects: list[Project], sport: str | None, name: str) -> Project | None:
     if sport:
         filtered = [p for p in projects if normalize(p.sport) == normalize(sport)]
@@ -495,6 +1149,10 @@ def build_parser() -> argparse.ArgumentParser:
     search_parser.add_argument("query")
     search_parser.add_argument("--scope", choices=["papers", "projects", "all"], default="all")
     search_parser.add_argument("--sport", default=None)
+    search_parser.add_argument("--limit", type=int, default=10)
+
+    index_parser = subparsers.add_parser("index", help="Construire/afficher l'index du catalogue")
+    index_parser.add_argument("--rebuild", action="store_true", help="Ignorer le cache et tout re-extraire")
 
     open_parser = subparsers.add_parser("open", help="Ouvrir un fichier (paper, notebook, readme)")
     open_parser.add_argument(
@@ -517,6 +1175,26 @@ def build_parser() -> argparse.ArgumentParser:
     open_parser.add_argument("--path", default=None)
     open_parser.add_argument("--dry-run", action="store_true")
 
+    run_parser = subparsers.add_parser("run", help="Executer une matrice de runs en parallele (NDJSON)")
+    run_parser.add_argument("--file", default=None, help="Matrice(s) de runs en JSON/NDJSON")
+    run_parser.add_argument("--sports", default=None, help="ex: F1,Football")
+    run_parser.add_argument("--projects", default=None, help="Filtre sur les noms de projects")
+    run_parser.add_argument("--years", default=None, help="ex: 2023-2024")
+    run_parser.add_argument("--rounds", default=None, help="ex: 1-10,12")
+    run_parser.add_argument("--modes", default=None, help="ex: qualifying,race")
+    run_parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Parametre commun a tous les runs (ex: source=fastf1, league=EPL)",
+    )
+    run_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    run_parser.add_argument("--cache-dir", default=str(RUNS_CACHE_DIR), help="Cache partage par les workers")
+    run_parser.add_argument("--output", default=None, help="Ecrire aussi le NDJSON dans ce fichier")
+    run_parser.add_argument("--dry-run", action="store_true", help="Afficher les runs sans les executer")
+    run_parser.add_argument("--quiet", action="store_true")
+
     subparsers.add_parser("menu", help="Mode interactif")
 
     return parser
@@ -526,6 +1204,7 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    # The full-text index is only built (or read from cache) by the commands that search it.
     projects = load_projects()
     papers = load_papers()
 
@@ -554,11 +1233,54 @@ def main() -> None:
 
     if args.command == "papers":
         sport = args.sport
-        render_papers(load_papers(sport_filter=sport), limit=args.limit)
+        render_papers(filter_papers(papers, sport), limit=args.limit)
         return
 
     if args.command == "search":
-        run_search(projects, papers, args.query, scope=args.scope, sport_filter=args.sport)
+        run_search(load_catalog(), args.query, scope=args.scope, sport_filter=args.sport, limit=args.limit)
+        return
+
+    if args.command == "index":
+        render_index_stats(load_catalog(rebuild=args.rebuild))
+        return
+
+    if args.command == "run":
+        params: dict[str, object] = {}
+        for item in args.param:
+            key, sep, value = item.partition("=")
+            if not sep or not key.strip():
+                parser.error(f"--param invalide (KEY=VALUE attendu): {item}")
+            params[key.strip()] = parse_param_value(value)
+        defaults = {
+            "sports": args.sports,
+            "projects": args.projects,
+            "years": args.years,
+            "rounds": args.rounds,
+            "modes": args.modes,
+            "params": params,
+        }
+        try:
+            matrices = load_run_matrices(Path(args.file)) if args.file else [{}]
+            runs = expand_run_matrix(matrices, defaults, projects, Path(args.cache_dir).resolve())
+        except (OSError, ValueError) as exc:
+            parser.error(str(exc))
+        if args.dry_run:
+            for run in runs:
+                print(json.dumps({"index": run.index, "sport": run.sport, "project": run.project, "params": run.params}))
+            return
+        summary = run_batch(
+            runs,
+            workers=args.workers,
+            output=Path(args.output) if args.output else None,
+            quiet=args.quiet,
+        )
+        print(
+            f"{summary['runs']} runs: {summary['done']} ok, {summary['error']} en erreur "
+            f"({summary['duration_ms']} ms, {summary['workers']} workers)",
+            file=sys.stderr,
+        )
+        if summary["error"]:
+            sys.exit(1)
         return
 
     if args.command == "menu":
@@ -597,7 +1319,7 @@ def main() -> None:
             open_with_system(str(target))
             return
         if args.type == "paper":
-            paper = resolve_paper(load_papers(args.sport), args.sport, args.index, args.name)
+            paper = resolve_paper(filter_papers(papers, args.sport), args.sport, args.index, args.name)
             if not paper:
                 print("Paper introuvable ou ambigu. Utilisez --sport et --index/--name.")
                 return
@@ -607,7 +1329,7 @@ def main() -> None:
             open_with_system(str(paper.path))
             return
         if args.type == "source":
-            paper = resolve_paper(load_papers(args.sport), args.sport, args.index, args.name)
+            paper = resolve_paper(filter_papers(papers, args.sport), args.sport, args.index, args.name)
             if not paper:
                 print("Paper introuvable ou ambigu. Utilisez --sport et --index/--name.")
                 return